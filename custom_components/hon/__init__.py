@@ -23,13 +23,17 @@ from homeassistant.util import dt as dt_util
 
 from .api.client import HonConnection, async_remove_setup_cache, get_hOn_mac
 from .api.exceptions import HonAuthenticationError, HonConnectionError
-from .const import DOMAIN, PLATFORMS
+from .const import CONF_TRACING, DEFAULT_TRACING, DOMAIN, PLATFORMS
+from .profiler import HonBootProfiler
+from .scheduler import HonPollScheduler
+from .tracing import write_trace
 
 if TYPE_CHECKING:
     from .coordinator import HonBaseCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 SERVICE_REGISTRY = "service_registry"
+TRACE_FILE = "hon_trace.json"
 
 
 type HonConfigEntry = ConfigEntry[HonConnection]
@@ -48,20 +52,6 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-# This method will update a sensor value with the targetted one for a better user experience
-def update_sensor(hass, device_id, mac, sensor_name, state):
-    """Update the matching sensor with the given state."""
-
-    entity_reg = er.async_get(hass)
-    entries = er.async_entries_for_device(entity_reg, device_id)
-
-    # Loop over all entries and update the good one
-    for entry in entries:
-        if entry.unique_id.endswith("_" + mac + "_" + sensor_name):
-            inputStateObject = hass.states.get(entry.entity_id)
-            hass.states.async_set(entry.entity_id, state, inputStateObject.attributes)
-
-
 def get_parameters(call):
     """Parse the parameters string from a service call."""
     parameters_str = call.data.get("parameters", "{}")
@@ -120,13 +110,18 @@ async def async_migrate_entry(hass: HomeAssistant, entry: HonConfigEntry) -> boo
 
 async def async_setup_entry(hass: HomeAssistant, entry: HonConfigEntry) -> bool:
     """Set up the hOn integration for a config entry."""
+    profiler = HonBootProfiler()
     hon = HonConnection(hass, entry)
+    hon.boot_profiler = profiler
+    hon.tracer.enabled = bool(entry.options.get(CONF_TRACING, DEFAULT_TRACING))
     entry.runtime_data = hon
 
     # Warm boots reuse the persisted appliance list, command catalogues and
     # statistics so the boot only blocks on the live requests.
-    await hon.async_load_setup_cache()
+    with profiler.phase("cache_load"):
+        await hon.async_load_setup_cache()
     cached_appliances = hon.get_cached_appliances()
+    profiler.warm = bool(cached_appliances)
 
     preloaded: dict[str, HonBaseCoordinator] = {}
     try:
@@ -142,14 +137,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: HonConfigEntry) -> bool:
                 coordinator.device.mac_address: coordinator
                 for coordinator in coordinators
             }
-            results = await asyncio.gather(
-                hon.async_restore_or_authorize(),
-                *(
-                    coordinator.async_config_entry_first_refresh()
-                    for coordinator in coordinators
-                ),
-                return_exceptions=True,
-            )
+            with profiler.phase("preload"):
+                results = await asyncio.gather(
+                    profiler.timed("auth", hon.async_restore_or_authorize()),
+                    *(
+                        profiler.first_refresh(coordinator, preloaded=True)
+                        for coordinator in coordinators
+                    ),
+                    return_exceptions=True,
+                )
             result = results[0]
             if isinstance(result, BaseException):
                 raise result
@@ -166,7 +162,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: HonConfigEntry) -> bool:
                 ):
                     raise refresh_result
         else:
-            result = await hon.async_restore_or_authorize()
+            with profiler.phase("auth"):
+                result = await hon.async_restore_or_authorize()
     except (ConfigEntryAuthFailed, ConfigEntryNotReady):
         raise
     except HonConnectionError as err:
@@ -194,13 +191,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: HonConfigEntry) -> bool:
             coordinator.apply_appliance_update(appliance)
         else:
             to_refresh.append(await hon.async_get_coordinator(appliance))
-    await asyncio.gather(
-        *(coordinator.async_config_entry_first_refresh() for coordinator in to_refresh)
-    )
+    with profiler.phase("first_refresh"):
+        await asyncio.gather(
+            *(profiler.first_refresh(coordinator) for coordinator in to_refresh)
+        )
     hon.prune_coordinators({a.get("macAddress", "") for a in hon.appliances})
     hon.store_cached_appliances()
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    if hon.batch_polling:
+        entry.async_on_unload(
+            HonPollScheduler(hass, hon, hon.batch_poll_interval).async_start()
+        )
+
+    with profiler.phase("platforms"):
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    profiler.finish()
 
     async def _update_listener(hass: HomeAssistant, entry: HonConfigEntry) -> None:
         """Handle options update."""
@@ -392,7 +397,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: HonConfigEntry) -> bool:
         coordinator = await hon.async_get_existing_coordinator(mac)
         parameters = {"onOffStatus": "1", "machMode": call.data.get("mode", 1)}
         await coordinator.async_set(parameters)
-        await coordinator.async_request_refresh()
 
     # Generic method to TURN OFF any hOn device
     async def handle_turn_off(call):
@@ -402,7 +406,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: HonConfigEntry) -> bool:
         coordinator = await hon.async_get_existing_coordinator(mac)
         parameters = {"onOffStatus": "0", "machMode": "1"}
         await coordinator.async_set(parameters)
-        await coordinator.async_request_refresh()
 
     async def handle_oven_off(call):
         parameters = {"onOffStatus": "0", "prPosition": "0", "prCode": "0"}
@@ -419,40 +422,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: HonConfigEntry) -> bool:
         return await hon.async_set(mac, "AP", parameters)
 
     async def handle_light_on(call):
-        device_id = call.data.get("device")
-        mac = get_hOn_mac(device_id, hass)
-
-        update_sensor(hass, device_id, mac, "light_status", "on")
+        mac = get_hOn_mac(call.data.get("device"), hass)
         coordinator = await hon.async_get_existing_coordinator(mac)
-        await coordinator.async_set({"lightStatus": "1"})
-        await coordinator.async_request_refresh()
+        await coordinator.device.async_set({"lightStatus": "1"})
 
     async def handle_light_off(call):
-        device_id = call.data.get("device")
-        mac = get_hOn_mac(device_id, hass)
-        update_sensor(hass, device_id, mac, "light_status", "off")
-
+        mac = get_hOn_mac(call.data.get("device"), hass)
         coordinator = await hon.async_get_existing_coordinator(mac)
-        await coordinator.async_set({"lightStatus": "0"})
-        await coordinator.async_request_refresh()
+        await coordinator.device.async_set({"lightStatus": "0"})
 
     async def handle_health_mode_on(call):
-        device_id = call.data.get("device")
-        mac = get_hOn_mac(device_id, hass)
-        update_sensor(hass, device_id, mac, "health_mode", "on")
-
+        mac = get_hOn_mac(call.data.get("device"), hass)
         coordinator = await hon.async_get_existing_coordinator(mac)
-        await coordinator.async_set({"healthMode": "1"})
-        await coordinator.async_request_refresh()
+        await coordinator.device.async_set({"healthMode": "1"})
 
     async def handle_health_mode_off(call):
-        device_id = call.data.get("device")
-        mac = get_hOn_mac(device_id, hass)
-        update_sensor(hass, device_id, mac, "health_mode", "off")
-
+        mac = get_hOn_mac(call.data.get("device"), hass)
         coordinator = await hon.async_get_existing_coordinator(mac)
-        await coordinator.async_set({"healthMode": "0"})
-        await coordinator.async_request_refresh()
+        await coordinator.device.async_set({"healthMode": "0"})
 
     async def handle_start_program(call):
         device_ids = get_device_ids(hass, call)
@@ -477,7 +464,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: HonConfigEntry) -> bool:
         for device_id in device_ids:
             device = hon.get_device(hass, device_id)
             await device.coordinator.async_set(parameters)
-            await device.coordinator.async_request_refresh()
 
     async def handle_update_settings(call):
         # device_ids = call.data.get("device_id", [])
@@ -490,7 +476,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: HonConfigEntry) -> bool:
 
         for device_id in device_ids:
             device = hon.get_device(hass, device_id)
-            await device.settings_command(parameters).send()
+            await device.send_settings(parameters)
 
     async def async_get_setting(call: ServiceCall):
         """Handle the get_setting service call."""
@@ -507,6 +493,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: HonConfigEntry) -> bool:
         hass.bus.async_fire("hon_get_setting_result", {"results": results})
         return results
 
+    async def handle_set_tracing(call: ServiceCall) -> None:
+        """Turn the refresh tracing of every loaded entry on or off."""
+        for loaded in hass.config_entries.async_loaded_entries(DOMAIN):
+            tracer = loaded.runtime_data.tracer
+            tracer.enabled = bool(call.data.get("enabled", True))
+            if call.data.get("reset", False):
+                tracer.reset()
+
+    async def handle_dump_trace(call: ServiceCall) -> None:
+        """Write the recorded spans of every loaded entry to a JSON file."""
+        path = call.data.get("path")
+        if path is None:
+            path = hass.config.path(TRACE_FILE)
+        elif not hass.config.is_allowed_path(path):
+            raise HomeAssistantError(f"Writing to {path} is not allowed")
+        payload = {
+            "entries": {
+                loaded.entry_id: loaded.runtime_data.tracer.snapshot()
+                for loaded in hass.config_entries.async_loaded_entries(DOMAIN)
+            }
+        }
+        await hass.async_add_executor_job(write_trace, path, payload)
+        _LOGGER.info("hOn trace written to %s", path)
+
     services = {
         "turn_on_washingmachine": handle_washingmachine_start,
         "turn_off_washingmachine": handle_washingmachine_off,
@@ -528,6 +538,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: HonConfigEntry) -> bool:
         "start_program": handle_start_program,
         "update_settings": handle_update_settings,
         "get_setting": async_get_setting,
+        "set_tracing": handle_set_tracing,
+        "dump_trace": handle_dump_trace,
     }
 
     registered_services = hass.data.setdefault(DOMAIN, {}).setdefault(
@@ -0,0 +1,101 @@
+"""Per-endpoint circuit breaker for the hOn cloud requests."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import HonConnectionError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fail fast on an endpoint that keeps failing.
+
+    The breaker starts ``closed``. After ``threshold`` consecutive failures
+    (transport errors or 5xx once the retries are exhausted) it opens and
+    every request raises :class:`HonConnectionError` without touching the
+    network. Once ``reset_timeout`` seconds elapsed it turns ``half_open``
+    and lets a single probe through: a success closes it again, a failure
+    re-opens it for another window.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        threshold: int,
+        reset_timeout: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self._name = name
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._rejected = 0
+        self._trips = 0
+
+    @property
+    def state(self) -> str:
+        """Return the current state, turning an expired open into half-open."""
+        if (
+            self._state == STATE_OPEN
+            and self._clock() - self._opened_at >= self._reset_timeout
+        ):
+            self._state = STATE_HALF_OPEN
+        return self._state
+
+    def before_request(self) -> None:
+        """Let a request through or raise :class:`HonConnectionError`."""
+        state = self.state
+        if state == STATE_CLOSED:
+            return
+        if state == STATE_HALF_OPEN and not self._probing:
+            self._probing = True
+            return
+        self._rejected += 1
+        remaining = max(0.0, self._reset_timeout - (self._clock() - self._opened_at))
+        raise HonConnectionError(
+            f"hOn endpoint {self._name} unavailable, next attempt in {remaining:.0f}s"
+        )
+
+    def record(self, healthy: bool | None) -> None:
+        """Record the outcome of a request let through by :meth:`before_request`.
+
+        ``None`` marks a request abandoned before the endpoint answered
+        (cancelled, or stopped by a client-side limit): it frees the probe
+        slot without counting as a success or a failure.
+        """
+        self._probing = False
+        if healthy is None:
+            return
+        if healthy:
+            self._failures = 0
+            self._state = STATE_CLOSED
+            return
+        self._failures += 1
+        if self._state == STATE_HALF_OPEN or self._failures >= self._threshold:
+            if self._state == STATE_CLOSED:
+                self._trips += 1
+            self._state = STATE_OPEN
+            self._opened_at = self._clock()
+
+    def stats(self) -> dict[str, Any]:
+        """Return the state and counters of the breaker."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "trips": self._trips,
+            "rejected": self._rejected,
+        }
@@ -13,24 +13,34 @@ import base64
 import hashlib
 import json as json_module
 import logging
+import random
 import secrets
 import time
 from datetime import UTC, datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import partial
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
 
 import aiohttp
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 
+from ..command import compile_catalogue
 from ..const import (
     API_URL,
     APP_VERSION,
+    CONF_ADAPTIVE_POLLING,
+    CONF_BATCH_POLLING,
     CONF_COGNITO_TOKEN,
     CONF_ID_TOKEN,
     CONF_REFRESH_TOKEN,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_BATCH_POLLING,
     DEFAULT_SCAN_INTERVAL,
     DEVICE_MODEL,
     DOMAIN,
@@ -38,16 +48,26 @@ from ..const import (
     OS_VERSION,
 )
 from ..coordinator import HonBaseCoordinator
+from ..polling import SHORTEST_POLL_INTERVAL, polling_profile
+from ..tracing import HonTracer
+from .circuit import STATE_CLOSED, CircuitBreaker
 from .exceptions import (
     HonAuthenticationError,
     HonConnectionError,
     HonPasswordChangeRequiredError,
     HonRateLimitError,
 )
+from .metrics import EndpointMetrics
+from .ratelimit import TokenBucket
+from .setup_cache import SetupBlobStore
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from homeassistant.core import HomeAssistant
 
+    from ..profiler import HonBootProfiler
+
 _LOGGER = logging.getLogger(__name__)
 
 # CIAM access tokens expire after ~15 minutes, so refresh well before that.
@@ -55,6 +75,23 @@ SESSION_TIMEOUT = 600  # seconds
 REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
 RETRYABLE_STATUS = {429, 500, 502, 503, 504}
 MAX_RETRIES = 3
+# Decorrelated-jitter backoff bounds (seconds) between retries.
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 8.0
+# Consecutive failed requests that open an endpoint's circuit breaker, and
+# seconds it stays open before a single probe request is let through.
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 60.0
+# Longest server-imposed pause (Retry-After) a request waits out; beyond it
+# the request fails fast and the next poll tries again.
+MAX_RETRY_AFTER = 60.0
+
+# Client-side request budgets (tokens per second, burst size). Commands take
+# a write token and every other API call a read token, so a burst of commands
+# never starves the polls (nor the reverse), while boot bursts and automation
+# storms stay under the cloud's throttling instead of being answered with 429s.
+READ_RATE_LIMIT = (2.0, 10)
+WRITE_RATE_LIMIT = (0.5, 3)
 
 SETUP_CACHE_STORAGE_VERSION = 1
 # Boot writes one cache entry per appliance in a burst; a delayed save
@@ -62,16 +99,89 @@ SETUP_CACHE_STORAGE_VERSION = 1
 SETUP_CACHE_SAVE_DELAY = 10.0
 # Reserved key of the cached appliance list (never collides with a MAC).
 APPLIANCES_CACHE_KEY = "__appliances__"
+# Setup cache fields persisted as blobs, with the index key of their digest:
+# the raw catalogue and its pre-parsed table (see ``compile_catalogue``).
+SETUP_CACHE_BLOBS = {"commands": "commands_blob", "table": "table_blob"}
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds of a ``Retry-After`` header, if valid.
+
+    Accepts both forms of the header: delta-seconds and an HTTP-date.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+def _conditional_headers(validators: dict[str, str]) -> dict[str, str]:
+    """Return the conditional request headers matching stored validators."""
+    headers = {}
+    if etag := validators.get("etag"):
+        headers["If-None-Match"] = etag
+    if last_modified := validators.get("last_modified"):
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _update_validators(validators: dict[str, str], headers: Any) -> None:
+    """Replace ``validators`` with the ones of a fresh response, if any."""
+    validators.clear()
+    if etag := headers.get("ETag"):
+        validators["etag"] = etag
+    if last_modified := headers.get("Last-Modified"):
+        validators["last_modified"] = last_modified
+
+
+def _decorrelated_backoff(previous: float) -> float:
+    """Return the next retry delay using decorrelated jitter.
+
+    Each delay is drawn between the base and three times the previous one,
+    capped, so concurrent clients retrying after the same outage spread out
+    instead of hitting the cloud again in lockstep.
+    """
+    return min(BACKOFF_CAP, random.uniform(BACKOFF_BASE, previous * 3))
 
 
 def _setup_cache_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
-    """Return the Store holding the per-appliance setup cache of an entry."""
+    """Return the Store holding the setup cache index of an entry."""
     return Store(hass, SETUP_CACHE_STORAGE_VERSION, f"{DOMAIN}.setup_cache_{entry_id}")
 
 
+def _setup_cache_blobs(hass: HomeAssistant, entry_id: str) -> SetupBlobStore:
+    """Return the blob store holding the cached catalogues of an entry."""
+    return SetupBlobStore(
+        hass.config.path(STORAGE_DIR, f"{DOMAIN}.setup_cache_{entry_id}.blobs")
+    )
+
+
+def _write_catalogue_blobs(
+    blobs: SetupBlobStore, commands: dict[str, Any], known: tuple[Any, Any] | None
+) -> tuple[str, str]:
+    """Write a catalogue and its compiled table; return both digests.
+
+    Runs in the executor. The table is only recompiled when the catalogue
+    differs from the ``known`` (commands, table) digests already stored.
+    """
+    digest = blobs.write(commands)
+    if known is not None and known[0] == digest and isinstance(known[1], str):
+        return digest, known[1]
+    return digest, blobs.write(compile_catalogue(commands))
+
+
 async def async_remove_setup_cache(hass: HomeAssistant, entry_id: str) -> None:
     """Delete the on-disk setup cache of a removed config entry."""
     await _setup_cache_store(hass, entry_id).async_remove()
+    await hass.async_add_executor_job(_setup_cache_blobs(hass, entry_id).remove)
 
 
 class HonConnection:
@@ -83,11 +193,16 @@ class HonConnection:
         entry: Any | None,
         email: str | None = None,
         password: str | None = None,
+        *,
+        read_limit: tuple[float, int] = READ_RATE_LIMIT,
+        write_limit: tuple[float, int] = WRITE_RATE_LIMIT,
     ) -> None:
         """Initialize the connection.
 
         During the config flow ``hass`` and ``entry`` may be ``None`` and the
         credentials passed explicitly for a one-shot login check.
+        ``read_limit``/``write_limit`` size the request token buckets as
+        ``(tokens per second, burst)``.
         """
         self._hass = hass
         self._entry = entry
@@ -110,7 +225,24 @@ class HonConnection:
         self._auth_lock = asyncio.Lock()
         self._auth_generation = 0
         self._setup_store: Store[dict[str, Any]] | None = None
+        self._setup_blobs: SetupBlobStore | None = None
         self._setup_cache: dict[str, Any] = {}
+        self._read_bucket = TokenBucket(*read_limit)
+        self._write_bucket = TokenBucket(*write_limit)
+        # Monotonic time until which the server asked every request to pause.
+        self._cooldown_until = 0.0
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        # Shared reads in flight, with the validators copy a conditional one
+        # updates (see ``_async_request``).
+        self._inflight: dict[
+            tuple[Any, ...],
+            tuple[asyncio.Future[dict[str, Any] | None], dict[str, str] | None],
+        ] = {}
+        self._coalesced_requests = 0
+        self._endpoint_metrics: dict[str, EndpointMetrics] = {}
+        self.tracer = HonTracer()
+        # Set by ``async_setup_entry`` for the boot report.
+        self.boot_profiler: HonBootProfiler | None = None
 
     @property
     def _session_provider(self) -> aiohttp.ClientSession:
@@ -138,6 +270,43 @@ class HonConnection:
         """Return the config entry this connection belongs to."""
         return self._entry
 
+    @property
+    def update_interval(self) -> timedelta:
+        """Return the polling interval configured on the entry."""
+        return timedelta(
+            seconds=int(
+                self._entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_SCAN_INTERVAL)
+            )
+        )
+
+    @property
+    def batch_polling(self) -> bool:
+        """Return whether the appliances are polled by one account timer."""
+        return bool(self._entry.options.get(CONF_BATCH_POLLING, DEFAULT_BATCH_POLLING))
+
+    @property
+    def adaptive_polling(self) -> bool:
+        """Return whether the polling interval follows the appliance activity."""
+        return bool(
+            self._entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
+        )
+
+    @property
+    def batch_poll_interval(self) -> timedelta:
+        """Return the tick of the batch scheduler.
+
+        With adaptive polling the scheduler ticks at the shortest profile
+        interval, and each tick refreshes only the coordinators that are due.
+        """
+        if self.adaptive_polling:
+            return min(self.update_interval, SHORTEST_POLL_INTERVAL)
+        return self.update_interval
+
+    @property
+    def coordinators(self) -> Mapping[str, HonBaseCoordinator]:
+        """Return a read-only view of the coordinators by MAC address."""
+        return MappingProxyType(self._coordinator_dict)
+
     async def async_get_existing_coordinator(
         self, mac: str
     ) -> HonBaseCoordinator | None:
@@ -149,14 +318,17 @@ class HonConnection:
         mac = appliance.get("macAddress", "")
         if mac in self._coordinator_dict:
             return self._coordinator_dict[mac]
-        update_interval = self._entry.options.get(
-            CONF_UPDATE_INTERVAL, DEFAULT_SCAN_INTERVAL
-        )
         coordinator = HonBaseCoordinator(
             self._hass,
             self,
             appliance,
-            update_interval=timedelta(seconds=int(update_interval)),
+            # In batch mode the account-wide scheduler drives the refreshes.
+            update_interval=None if self.batch_polling else self.update_interval,
+            polling_profile=(
+                polling_profile(appliance.get("applianceTypeId"))
+                if self.adaptive_polling
+                else None
+            ),
         )
         self._coordinator_dict[mac] = coordinator
         return coordinator
@@ -170,11 +342,115 @@ class HonConnection:
             "id-token": self._id_token,
         }
 
-    async def _ensure_session(self) -> None:
+    def _start_cooldown(self, delay: float) -> None:
+        """Make every request of the connection pause for ``delay`` seconds."""
+        self._cooldown_until = max(self._cooldown_until, time.monotonic() + delay)
+        _LOGGER.debug("hOn cloud asked to pause requests for %.0fs", delay)
+
+    async def _async_wait_cooldown(self) -> None:
+        """Wait out a server-imposed pause shared by all requests.
+
+        Raises :class:`HonRateLimitError` instead when the pause is longer
+        than ``MAX_RETRY_AFTER``.
+        """
+        remaining = self._cooldown_until - time.monotonic()
+        if remaining <= 0:
+            return
+        if remaining > MAX_RETRY_AFTER:
+            raise HonRateLimitError(
+                f"hOn API asked to pause requests for {remaining:.0f}s"
+            )
+        await asyncio.sleep(remaining)
+
+    async def _async_throttle(self, command: bool) -> None:
+        """Wait for a request slot in the write (commands) or read bucket."""
+        bucket = self._write_bucket if command else self._read_bucket
+        waited = await bucket.acquire()
+        if waited:
+            _LOGGER.debug("Request delayed %.2fs by the rate limiter", waited)
+
+    @property
+    def rate_limit_stats(self) -> dict[str, Any]:
+        """Return the queue-wait statistics of the request rate limiter."""
+        return {
+            "read": self._read_bucket.stats(),
+            "write": self._write_bucket.stats(),
+        }
+
+    def _circuit_breaker(self, url: str) -> CircuitBreaker:
+        """Return the circuit breaker of an endpoint (URL without query)."""
+        endpoint = urlsplit(url).path
+        breaker = self._circuit_breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._circuit_breakers[endpoint] = CircuitBreaker(
+                endpoint, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT
+            )
+        return breaker
+
+    @property
+    def circuit_breaker_stats(self) -> dict[str, dict[str, Any]]:
+        """Return the state and counters of every endpoint's circuit breaker."""
+        return {
+            endpoint: breaker.stats()
+            for endpoint, breaker in self._circuit_breakers.items()
+        }
+
+    def _metrics(self, url: str) -> EndpointMetrics:
+        """Return the request metrics of an endpoint (URL without query)."""
+        endpoint = urlsplit(url).path
+        metrics = self._endpoint_metrics.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoint_metrics[endpoint] = EndpointMetrics()
+        return metrics
+
+    @property
+    def endpoint_stats(self) -> dict[str, dict[str, Any]]:
+        """Return the request metrics of every endpoint."""
+        return {
+            endpoint: metrics.stats()
+            for endpoint, metrics in self._endpoint_metrics.items()
+        }
+
+    @property
+    def request_totals(self) -> dict[str, Any]:
+        """Return the request counters summed over the endpoints.
+
+        ``latency_p95`` is the worst endpoint p95 (ms), ``None`` before the
+        first response.
+        """
+        metrics = self._endpoint_metrics.values()
+        p95 = [
+            value
+            for endpoint in metrics
+            if (value := endpoint.latency()["p95"]) is not None
+        ]
+        return {
+            "requests": sum(endpoint.requests for endpoint in metrics),
+            "retries": sum(endpoint.retries for endpoint in metrics),
+            "reauths": sum(endpoint.reauths for endpoint in metrics),
+            "failures": sum(endpoint.failures for endpoint in metrics),
+            "latency_p95": max(p95, default=None),
+        }
+
+    @property
+    def open_circuits(self) -> list[str]:
+        """Return the endpoints whose circuit breaker is not closed."""
+        return [
+            endpoint
+            for endpoint, breaker in self._circuit_breakers.items()
+            if breaker.state != STATE_CLOSED
+        ]
+
+    async def async_ensure_session(self) -> None:
         """Re-authenticate when the CIAM tokens are close to expiring."""
         if time.time() - self._start_time > SESSION_TIMEOUT:
             await self.async_authorize()
 
+    @property
+    def coalesced_requests(self) -> int:
+        """Return how many reads joined an identical request in flight."""
+        return self._coalesced_requests
+
     async def _async_request(
         self,
         method: str,
@@ -186,7 +462,87 @@ class HonConnection:
         return_text: bool = False,
         retries: int = MAX_RETRIES,
         auto_reauth: bool = True,
-    ) -> dict[str, Any]:
+        command: bool = False,
+        validators: dict[str, str] | None = None,
+    ) -> dict[str, Any] | None:
+        """Perform a request, sharing identical authenticated reads in flight.
+
+        Concurrent authenticated GETs with the same URL and parameters (a
+        poll overlapping a post-command refresh or the deferred setup
+        refresh) await a single request and receive the same payload, which
+        callers must therefore treat as read-only. Each caller can be
+        cancelled on its own without cancelling the shared request.
+        Conditional reads (``validators``) are shared only with callers
+        holding the same validators: the request runs on a copy, which each
+        caller's own validators then take over.
+        """
+        if method != "GET" or not authenticated:
+            return await self._async_send_request(
+                method,
+                url,
+                params=params,
+                json=json,
+                authenticated=authenticated,
+                return_text=return_text,
+                retries=retries,
+                auto_reauth=auto_reauth,
+                command=command,
+                validators=validators,
+            )
+        key = (
+            url,
+            tuple(sorted((params or {}).items())),
+            return_text,
+            None if validators is None else tuple(sorted(validators.items())),
+        )
+        if (inflight := self._inflight.get(key)) is None:
+            shared = None if validators is None else dict(validators)
+            future = asyncio.ensure_future(
+                self._async_send_request(
+                    method,
+                    url,
+                    params=params,
+                    authenticated=True,
+                    return_text=return_text,
+                    retries=retries,
+                    auto_reauth=auto_reauth,
+                    validators=shared,
+                )
+            )
+            self._inflight[key] = (future, shared)
+            future.add_done_callback(partial(self._forget_inflight, key))
+        else:
+            future, shared = inflight
+            self._coalesced_requests += 1
+        result = await asyncio.shield(future)
+        if shared is not None:
+            validators.clear()
+            validators.update(shared)
+        return result
+
+    def _forget_inflight(
+        self, key: tuple[Any, ...], future: asyncio.Future[dict[str, Any] | None]
+    ) -> None:
+        """Drop a finished shared read (marking its error as retrieved)."""
+        if (inflight := self._inflight.get(key)) is not None and inflight[0] is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            future.exception()
+
+    async def _async_send_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any | None = None,
+        authenticated: bool = False,
+        return_text: bool = False,
+        retries: int = MAX_RETRIES,
+        auto_reauth: bool = True,
+        command: bool = False,
+        validators: dict[str, str] | None = None,
+    ) -> dict[str, Any] | None:
         """Perform a request with timeout, backoff and token refresh.
 
         Returns the JSON body of a successful (2xx) response, or the raw text
@@ -196,43 +552,102 @@ class HonConnection:
         :class:`HonAuthenticationError` instead of recursing.
         ``authenticated`` builds the token headers on every attempt, so a
         retry after a re-login sends the fresh tokens (not the ones captured
-        when the call started).
+        when the call started). Authenticated attempts go through the rate
+        limiter first; ``command`` marks a ``/commands/v1/send`` write.
+        Retries wait a decorrelated-jitter backoff, or the server's
+        ``Retry-After`` which then pauses every request of the connection.
+        Every attempt is recorded in the endpoint's :class:`EndpointMetrics`.
+        While the endpoint's circuit breaker is open the call raises
+        :class:`HonConnectionError` without touching the network.
+        ``validators`` (the ``etag``/``last_modified`` of the previous
+        answer) makes the request conditional: they are updated in place
+        from the response, and an unchanged resource (304) returns ``None``.
         """
         session = self._session_provider
         attempt = 0
-        while True:
-            attempt += 1
-            auth_generation = self._auth_generation
-            try:
-                async with session.request(
-                    method,
-                    url,
-                    params=params,
-                    json=json,
-                    headers=self._headers if authenticated else None,
-                    timeout=REQUEST_TIMEOUT,
-                ) as response:
-                    if response.status in RETRYABLE_STATUS and attempt <= retries:
-                        await asyncio.sleep(min(2 ** (attempt - 1), 8))
-                        continue
-                    if response.status == 401 or response.status == 403:
-                        if not auto_reauth or attempt > retries:
-                            raise HonAuthenticationError("Authentication failed")
-                        await self.async_authorize(generation=auth_generation)
-                        continue
-                    if response.status == 429:
-                        raise HonRateLimitError("hOn API rate limit reached")
-                    if response.status >= 400:
-                        raise HonConnectionError(f"hOn API returned {response.status}")
-                    if return_text:
-                        return {"_text": await response.text()}
-                    return await response.json()
-            except (aiohttp.ContentTypeError, json_module.JSONDecodeError):
-                raise
-            except (aiohttp.ClientError, TimeoutError) as err:
-                if attempt > retries:
-                    raise HonConnectionError(f"Request failed: {err}") from err
-                await asyncio.sleep(min(2 ** (attempt - 1), 8))
+        backoff = BACKOFF_BASE
+        delay = 0.0
+        breaker = self._circuit_breaker(url)
+        breaker.before_request()
+        metrics = self._metrics(url)
+        metrics.requests += 1
+        healthy: bool | None = None
+        try:
+            while True:
+                attempt += 1
+                if delay:
+                    await asyncio.sleep(delay)
+                    delay = 0.0
+                await self._async_wait_cooldown()
+                if authenticated:
+                    await self._async_throttle(command)
+                auth_generation = self._auth_generation
+                headers = self._headers if authenticated else None
+                if validators:
+                    headers = {**(headers or {}), **_conditional_headers(validators)}
+                sent = time.perf_counter()
+                try:
+                    async with session.request(
+                        method,
+                        url,
+                        params=params,
+                        json=json,
+                        headers=headers,
+                        timeout=REQUEST_TIMEOUT,
+                    ) as response:
+                        metrics.record_response(
+                            response.status, time.perf_counter() - sent
+                        )
+                        # Any answer but a 5xx shows the endpoint is up.
+                        healthy = response.status < 500
+                        if response.status in RETRYABLE_STATUS:
+                            retry_after = _parse_retry_after(
+                                response.headers.get("Retry-After")
+                            )
+                            if retry_after is not None:
+                                self._start_cooldown(retry_after)
+                            if attempt <= retries and (
+                                retry_after is None or retry_after <= MAX_RETRY_AFTER
+                            ):
+                                if retry_after is None:
+                                    backoff = delay = _decorrelated_backoff(backoff)
+                                metrics.retries += 1
+                                continue
+                        if response.status == 401 or response.status == 403:
+                            if not auto_reauth or attempt > retries:
+                                raise HonAuthenticationError("Authentication failed")
+                            metrics.reauths += 1
+                            reauth_start = time.perf_counter()
+                            try:
+                                await self.async_authorize(generation=auth_generation)
+                            finally:
+                                metrics.auth_wait += time.perf_counter() - reauth_start
+                            continue
+                        if response.status == 429:
+                            raise HonRateLimitError("hOn API rate limit reached")
+                        if response.status >= 400:
+                            raise HonConnectionError(
+                                f"hOn API returned {response.status}"
+                            )
+                        if validators is not None:
+                            if response.status == 304:
+                                return None
+                            _update_validators(validators, response.headers)
+                        metrics.response_bytes += len(await response.read())
+                        if return_text:
+                            return {"_text": await response.text()}
+                        return await response.json()
+                except (aiohttp.ContentTypeError, json_module.JSONDecodeError):
+                    raise
+                except (aiohttp.ClientError, TimeoutError) as err:
+                    metrics.record_error()
+                    if attempt > retries:
+                        healthy = False
+                        raise HonConnectionError(f"Request failed: {err}") from err
+                    backoff = delay = _decorrelated_backoff(backoff)
+                    metrics.retries += 1
+        finally:
+            breaker.record(healthy)
 
     async def async_authorize(self, *, generation: int | None = None) -> bool:
         """Authenticate against the hOn CIAM endpoint and load the appliances.
@@ -323,7 +738,27 @@ class HonConnection:
         if self._hass is None or self._entry is None:
             return
         self._setup_store = _setup_cache_store(self._hass, self._entry.entry_id)
-        self._setup_cache = await self._setup_store.async_load() or {}
+        self._setup_blobs = _setup_cache_blobs(self._hass, self._entry.entry_id)
+        index = await self._setup_store.async_load() or {}
+        digests = {
+            entry[blob_key]
+            for entry in index.values()
+            if isinstance(entry, dict)
+            for blob_key in SETUP_CACHE_BLOBS.values()
+            if isinstance(entry.get(blob_key), str)
+        }
+        payloads = await self._hass.async_add_executor_job(
+            self._setup_blobs.load, digests
+        )
+        for entry in index.values():
+            if not isinstance(entry, dict):
+                continue
+            for key, blob_key in SETUP_CACHE_BLOBS.items():
+                payload = payloads.get(entry.get(blob_key))
+                if payload is not None:
+                    # Same-model appliances share the (never mutated) payload.
+                    entry[key] = payload
+        self._setup_cache = index
 
     def get_cached_setup(self, mac: str, fw_version: str) -> dict[str, Any] | None:
         """Return the cached setup payloads for an appliance, if still valid.
@@ -350,20 +785,91 @@ class HonConnection:
         fw_version: str,
         commands: dict[str, Any],
         statistics: dict[str, Any],
+        statistics_state: dict[str, Any] | None = None,
     ) -> None:
-        """Persist the setup payloads of an appliance for the next boot."""
-        if self._setup_store is None:
+        """Persist the setup payloads of an appliance for the next boot.
+
+        The catalogue goes to a compressed blob named after its content
+        (written in the executor, and only if new); the index entry saved
+        afterwards references it and holds the small statistics payload with
+        its fetch time and validators (``HonDevice.statistics_state``).
+        """
+        if self._setup_store is None or self._hass is None:
             return
-        self._setup_cache[mac] = {
+        previous = self._setup_cache.get(mac)
+        cached = {
             "fw_version": fw_version,
             "app_version": APP_VERSION,
             "commands": commands,
             "statistics": statistics,
+            "statistics_state": statistics_state,
         }
-        self._setup_store.async_delay_save(
-            lambda: self._setup_cache, SETUP_CACHE_SAVE_DELAY
+        self._setup_cache[mac] = cached
+        self._entry.async_create_background_task(
+            self._hass,
+            self._async_store_commands_blob(cached, previous),
+            "hon setup cache blob",
+            eager_start=False,
         )
 
+    def store_cached_statistics(
+        self, mac: str, statistics: dict[str, Any], statistics_state: dict[str, Any]
+    ) -> None:
+        """Update the cached statistics of an appliance after a refresh.
+
+        Only the small index is rewritten (coalesced with the other saves);
+        an appliance without a cache entry is left to ``store_setup_cache``.
+        """
+        entry = self._setup_cache.get(mac)
+        if self._setup_store is None or not isinstance(entry, dict):
+            return
+        entry["statistics"] = statistics
+        entry["statistics_state"] = statistics_state
+        self._async_save_setup_cache()
+
+    async def _async_store_commands_blob(
+        self, entry: dict[str, Any], previous: Any
+    ) -> None:
+        """Write the catalogue blobs of ``entry``, then save the index."""
+        if self._hass is None or self._setup_blobs is None:
+            return
+        known = None
+        if isinstance(previous, dict) and previous.get("app_version") == APP_VERSION:
+            known = (previous.get("commands_blob"), previous.get("table_blob"))
+        try:
+            digests = await self._hass.async_add_executor_job(
+                _write_catalogue_blobs, self._setup_blobs, entry["commands"], known
+            )
+        except OSError as err:
+            _LOGGER.debug("Unable to write the setup cache blobs: %s", err)
+            return
+        entry["commands_blob"], entry["table_blob"] = digests
+        self._async_save_setup_cache()
+
+    def _async_save_setup_cache(self) -> None:
+        """Schedule a coalesced write of the setup cache index."""
+        if self._setup_store is not None:
+            self._setup_store.async_delay_save(
+                self._setup_cache_index, SETUP_CACHE_SAVE_DELAY
+            )
+
+    def _setup_cache_index(self) -> dict[str, Any]:
+        """Return the index to persist: catalogues replaced by their digest.
+
+        An entry whose blob is not written yet keeps its catalogue inline,
+        like the entries of the previous (single file) format.
+        """
+        return {
+            key: {
+                k: v
+                for k, v in entry.items()
+                if k not in SETUP_CACHE_BLOBS or SETUP_CACHE_BLOBS[k] not in entry
+            }
+            if isinstance(entry, dict)
+            else entry
+            for key, entry in self._setup_cache.items()
+        }
+
     def get_cached_appliances(self) -> list[dict[str, Any]] | None:
         """Return the appliance list persisted by the previous boot, if any.
 
@@ -387,9 +893,7 @@ class HonConnection:
             "app_version": APP_VERSION,
             "appliances": self._appliances,
         }
-        self._setup_store.async_delay_save(
-            lambda: self._setup_cache, SETUP_CACHE_SAVE_DELAY
-        )
+        self._async_save_setup_cache()
 
     def prune_coordinators(self, macs: set[str]) -> None:
         """Drop the coordinators (and cache entries) of removed appliances."""
@@ -507,16 +1011,18 @@ class HonConnection:
             # Appliance without a command set (e.g. a TV): the cloud returns an
             # empty payload. Expected — let the caller skip command setup.
             return {}
-        result_code = result.pop("resultCode", None)
+        result_code = result.get("resultCode")
         if result_code != "0":
             _LOGGER.warning("Command retrieve returned resultCode %s", result_code)
             return {}
+        # Copy rather than pop: the payload may be shared by coalesced reads.
+        result = {key: value for key, value in result.items() if key != "resultCode"}
         _LOGGER.debug("Commands loaded: %d entries", len(result))
         return result
 
     async def async_get_context(self, device) -> dict[str, Any]:
         """Fetch the current device context (CYCLE)."""
-        await self._ensure_session()
+        await self.async_ensure_session()
 
         params = {
             "macAddress": device.mac_address,
@@ -530,16 +1036,27 @@ class HonConnection:
         _LOGGER.debug("Context fetched for device type [%s]", device.appliance_type)
         return json_data.get("payload", {})
 
-    async def load_statistics(self, device) -> dict[str, Any]:
-        """Fetch the lifetime statistics for a device."""
+    async def load_statistics(
+        self, device, validators: dict[str, str] | None = None
+    ) -> dict[str, Any] | None:
+        """Fetch the lifetime statistics for a device.
+
+        With ``validators`` the request is conditional (see
+        ``_async_send_request``) and ``None`` means "not modified".
+        """
         params = {
             "macAddress": device.mac_address,
             "applianceType": device.appliance_type,
         }
         url = f"{API_URL}/commands/v1/statistics"
         json_data = await self._async_request(
-            "GET", url, params=params, authenticated=True
+            "GET", url, params=params, authenticated=True, validators=validators
         )
+        if json_data is None:
+            _LOGGER.debug(
+                "Statistics unchanged for device type [%s]", device.appliance_type
+            )
+            return None
         _LOGGER.debug("Statistics fetched for device type [%s]", device.appliance_type)
         return json_data.get("payload", {})
 
@@ -547,7 +1064,7 @@ class HonConnection:
         self, mac: str, type_name: str, parameters: dict[str, str]
     ) -> bool:
         """Send a startProgram command with the given parameters."""
-        await self._ensure_session()
+        await self.async_ensure_session()
 
         timestamp = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
         attributes = {
@@ -588,6 +1105,7 @@ class HonConnection:
                 "POST",
                 f"{API_URL}/commands/v1/send",
                 authenticated=True,
+                command=True,
                 json=command,
             )
         except (json_module.JSONDecodeError, HonConnectionError):
@@ -609,7 +1127,7 @@ class HonConnection:
         ancillary_parameters: dict[str, str],
     ) -> bool:
         """Send an arbitrary command to a device."""
-        await self._ensure_session()
+        await self.async_ensure_session()
 
         now = datetime.now(UTC).isoformat()
         payload = {
@@ -653,6 +1171,7 @@ class HonConnection:
                 "POST",
                 f"{API_URL}/commands/v1/send",
                 authenticated=True,
+                command=True,
                 json=payload,
             )
         except (json_module.JSONDecodeError, HonConnectionError):
@@ -0,0 +1,80 @@
+"""Per-endpoint request metrics of the hOn cloud connection."""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+from typing import Any
+
+# Latency percentiles are computed over this many most recent responses, so
+# they follow a degradation instead of being diluted by the whole uptime.
+LATENCY_WINDOW = 256
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(samples: list[float], rank: int) -> float:
+    """Return the nearest-rank ``rank``-th percentile of sorted ``samples``."""
+    index = max(0, -(-rank * len(samples) // 100) - 1)
+    return samples[index]
+
+
+class EndpointMetrics:
+    """Counters and latency window of one endpoint (URL path).
+
+    ``requests`` counts the calls, each of which may take several HTTP
+    attempts: the extra ones are counted as ``retries`` (throttled, 5xx or
+    transport errors) or ``reauths`` (401/403 answered by a re-login).
+    ``statuses`` counts every HTTP answer and ``errors`` the attempts that
+    got none. Latency is measured from sending the request to its response
+    headers; ``auth_wait`` is the time requests spent held by a re-login
+    (waiting on the auth lock, then for the login itself).
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        """Initialize empty metrics."""
+        self.requests = 0
+        self.retries = 0
+        self.reauths = 0
+        self.errors = 0
+        self.response_bytes = 0
+        self.auth_wait = 0.0
+        self.statuses: Counter[int] = Counter()
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    def record_response(self, status: int, latency: float) -> None:
+        """Record an HTTP answer and the time it took."""
+        self.statuses[status] += 1
+        self._latencies.append(latency)
+
+    def record_error(self) -> None:
+        """Record an attempt that failed without an HTTP answer."""
+        self.errors += 1
+
+    @property
+    def failures(self) -> int:
+        """Return the attempts answered with an error status or not at all."""
+        return self.errors + sum(
+            count for status, count in self.statuses.items() if status >= 400
+        )
+
+    def latency(self) -> dict[str, float | None]:
+        """Return the latency percentiles (ms) over the recent responses."""
+        samples = sorted(self._latencies)
+        return {
+            f"p{rank}": (
+                round(percentile(samples, rank) * 1000, 1) if samples else None
+            )
+            for rank in PERCENTILES
+        }
+
+    def stats(self) -> dict[str, Any]:
+        """Return the counters and latency percentiles of the endpoint."""
+        return {
+            "requests": self.requests,
+            "statuses": {str(status): count for status, count in self.statuses.items()},
+            "retries": self.retries,
+            "reauths": self.reauths,
+            "errors": self.errors,
+            "latency_ms": self.latency(),
+            "response_bytes": self.response_bytes,
+            "auth_wait": round(self.auth_wait, 3),
+        }
@@ -0,0 +1,119 @@
+"""Token-bucket rate limiting for the hOn cloud requests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class TokenBucket:
+    """Token bucket handing out request slots in priority then FIFO order.
+
+    The bucket holds up to ``capacity`` tokens and refills at ``rate`` tokens
+    per second. :meth:`acquire` takes one token, waiting for the refill when
+    the bucket is empty; priority waiters are served before the regular
+    ones. The time spent waiting is recorded for diagnostics.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket."""
+        self._rate = rate
+        self._capacity = capacity
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._priority_waiters: deque[asyncio.Future[None]] = deque()
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._timer: asyncio.TimerHandle | None = None
+        self._acquired = 0
+        self._delayed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = self._clock()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def _next_waiter(self) -> asyncio.Future[None] | None:
+        """Pop the next live waiter, priority waiters first."""
+        for queue in (self._priority_waiters, self._waiters):
+            while queue:
+                future = queue.popleft()
+                if not future.done():
+                    return future
+        return None
+
+    def _dispatch(self) -> None:
+        """Hand the available tokens to the waiters, then re-arm the timer."""
+        self._timer = None
+        self._refill()
+        while self._tokens >= 1:
+            future = self._next_waiter()
+            if future is None:
+                return
+            self._tokens -= 1
+            future.set_result(None)
+        if self._priority_waiters or self._waiters:
+            delay = (1 - self._tokens) / self._rate
+            self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    async def acquire(self, *, priority: bool = False) -> float:
+        """Take one token; return the seconds spent waiting for it."""
+        start = self._clock()
+        self._refill()
+        if not self._priority_waiters and not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            self._record(0.0)
+            return 0.0
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        (self._priority_waiters if priority else self._waiters).append(future)
+        if self._timer is None:
+            self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The token was granted as the caller gave up: hand it on.
+                self._tokens += 1
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._dispatch()
+            raise
+        waited = self._clock() - start
+        self._record(waited)
+        return waited
+
+    def _record(self, waited: float) -> None:
+        """Account one acquired token and the time waited for it."""
+        self._acquired += 1
+        if waited > 0:
+            self._delayed += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the queue-wait statistics of the bucket."""
+        return {
+            "rate": self._rate,
+            "capacity": self._capacity,
+            "acquired": self._acquired,
+            "delayed": self._delayed,
+            "total_wait": round(self._total_wait, 3),
+            "max_wait": round(self._max_wait, 3),
+        }
@@ -0,0 +1,81 @@
+"""Content-addressed, compressed payload blobs of the setup cache."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import zlib
+from typing import Any
+
+from homeassistant.helpers.json import json_bytes_sorted
+from homeassistant.util.json import json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+BLOB_SUFFIX = ".json.z"
+COMPRESSION_LEVEL = 6
+
+
+class SetupBlobStore:
+    """Large setup payloads stored once per content digest.
+
+    The setup cache index (a small ``Store``) references each appliance's
+    command catalogue by the digest of its content; the catalogue itself is
+    a zlib-compressed JSON file named after that digest. Appliances of the
+    same model share one file, and a refreshed catalogue only costs a write
+    when its content changed.
+
+    Every method does blocking I/O and must run in the executor.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the store over the ``path`` directory."""
+        self._path = path
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self._path, digest + BLOB_SUFFIX)
+
+    def write(self, payload: Any) -> str:
+        """Store ``payload`` unless already present and return its digest."""
+        raw = json_bytes_sorted(payload)
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        path = self._blob_path(digest)
+        if os.path.exists(path):
+            return digest
+        os.makedirs(self._path, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(zlib.compress(raw, COMPRESSION_LEVEL))
+        os.replace(temp_path, path)
+        return digest
+
+    def load(self, digests: set[str]) -> dict[str, Any]:
+        """Return the payloads of ``digests`` and delete every other blob.
+
+        Missing or unreadable blobs are left out of the result; the caller
+        then falls back to fetching the payload.
+        """
+        payloads: dict[str, Any] = {}
+        try:
+            names = os.listdir(self._path)
+        except FileNotFoundError:
+            return payloads
+        for name in names:
+            digest = name.removesuffix(BLOB_SUFFIX)
+            path = os.path.join(self._path, name)
+            if digest not in digests:
+                # Superseded catalogue (or a write interrupted mid-way).
+                os.remove(path)
+                continue
+            try:
+                with open(path, "rb") as file:
+                    payloads[digest] = json_loads(zlib.decompress(file.read()))
+            except (OSError, zlib.error, ValueError) as err:
+                _LOGGER.debug("Ignoring unreadable setup cache blob %s: %s", name, err)
+        return payloads
+
+    def remove(self) -> None:
+        """Delete every blob."""
+        shutil.rmtree(self._path, ignore_errors=True)
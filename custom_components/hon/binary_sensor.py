@@ -23,6 +23,7 @@ from .devices.binary_sensor import (
     HonBasePreheating,
     HonBaseRemoteControl,
 )
+from .profiler import profile_platform_setup
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -33,6 +34,7 @@ _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = 0
 
 
+@profile_platform_setup
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ) -> None:
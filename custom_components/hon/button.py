@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from .devices.button import HonBaseButtonEntity, HonBaseSettingsButtonEntity
+from .profiler import profile_platform_setup
 
 PARALLEL_UPDATES = 0
 
@@ -13,6 +14,7 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
 
+@profile_platform_setup
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ) -> None:
@@ -10,6 +10,7 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_platform
 
 from .devices.climate import HonClimateEntity
+from .profiler import profile_platform_setup
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -19,6 +20,7 @@ _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = 1
 
 
+@profile_platform_setup
 async def async_setup_entry(hass, entry: ConfigEntry, async_add_entities) -> None:
     """Set up the climate platform."""
 
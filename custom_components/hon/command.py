@@ -3,46 +3,167 @@
 from __future__ import annotations
 
 import logging
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from .parameter import (
     HonParameterEnum,
     HonParameterFixed,
     HonParameterProgram,
     HonParameterRange,
+    parameter_from_spec,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Layout version of ``compile_catalogue`` tables; tables of another version
+# are ignored and the raw payload is parsed instead.
+CATALOGUE_TABLE_VERSION = 1
+SETTABLE_KINDS = ("range", "enum")
+
+
+def create_parameter(key, attributes):
+    """Build the parameter model matching the attributes' typology.
+
+    Returns ``None`` for typologies the integration does not model.
+    """
+    match attributes.get("typology"):
+        case "range":
+            return HonParameterRange(key, attributes)
+        case "enum":
+            return HonParameterEnum(key, attributes)
+        case "fixed":
+            return HonParameterFixed(key, attributes)
+    return None
+
+
+def split_catalogue(payload):
+    """Split a catalogue payload into its single and multi-program commands.
+
+    Returns ``{name: (attributes, programs)}`` where exactly one of the two
+    is set: the attributes of a single-program command, or
+    ``{program: attributes}`` for a multi-program one (the last program is
+    the default). The payload is not mutated.
+    """
+    result = {}
+    for name, attr in payload.items():
+        if name in ("applianceModel", "options", "dictionaryId"):
+            continue
+        if "parameters" in attr:
+            result[name] = (attr, None)
+        if "setParameters" in attr and "parameters" in attr[list(attr)[0]]:
+            result[name] = (attr.get("setParameters"), None)
+        elif "parameters" in attr[list(attr)[0]]:
+            result[name] = (
+                None,
+                {
+                    program.split(".")[-1].lower(): attributes
+                    for program, attributes in attr.items()
+                },
+            )
+    return result
+
+
+def _command_spec(attributes):
+    """Return the flat table entry of one command's attributes."""
+
+    def specs(parameters):
+        return [
+            parameter.spec()
+            for key, raw in parameters.items()
+            if (parameter := create_parameter(key, raw)) is not None
+        ]
+
+    return {
+        "description": attributes.get("description", ""),
+        "parameters": specs(attributes.get("parameters", {})),
+        "ancillary": specs(attributes.get("ancillaryParameters", {})),
+    }
+
+
+def compile_catalogue(payload):
+    """Parse a catalogue payload once into a flat, JSON-serializable table.
+
+    Every parameter becomes its :meth:`HonParameter.spec` list (kind,
+    bounds, enum values, fixed value), so a warm boot rebuilds the command
+    objects without parsing the API attributes again (see
+    ``HonDevice.load_commands``). Pure function, safe to run in the executor.
+    """
+    commands = {}
+    for name, (attributes, programs) in split_catalogue(payload).items():
+        if programs is None:
+            commands[name] = {"command": _command_spec(attributes)}
+        else:
+            commands[name] = {
+                "programs": {
+                    program: _command_spec(attributes)
+                    for program, attributes in programs.items()
+                }
+            }
+    return {"version": CATALOGUE_TABLE_VERSION, "commands": commands}
+
 
 class HonCommand:
     """A command with its parameters for an appliance."""
 
+    __slots__ = (
+        "_connector",
+        "_device",
+        "_name",
+        "_multi",
+        "_program",
+        "_description",
+        "_parameters",
+        "_ancillary_parameters",
+        "_setting_keys",
+        "_settings",
+    )
+
     def __init__(self, name, attributes, connector, device, multi=None, program=""):
         """Initialize the command from its attributes."""
-        self._connector = connector
-        self._device = device
-        self._name = name
-        self._multi = multi or {}
-        self._program = program
+        self._init(name, connector, device, multi, program)
         self._description = attributes.get("description", "")
         self._parameters = self._create_parameters(attributes.get("parameters", {}))
         self._ancillary_parameters = self._create_parameters(
             attributes.get("ancillaryParameters", {})
         )
 
+    @classmethod
+    def from_spec(cls, name, spec, connector, device, multi=None, program=""):
+        """Build the command from its ``compile_catalogue`` table entry."""
+        command = cls.__new__(cls)
+        command._init(name, connector, device, multi, program)
+        command._description = spec["description"]
+        command._parameters = command._restore_parameters(spec["parameters"])
+        command._ancillary_parameters = command._restore_parameters(spec["ancillary"])
+        return command
+
+    def _init(self, name, connector, device, multi, program):
+        self._connector = connector
+        self._device = device
+        self._name = sys.intern(name)
+        self._multi = multi or {}
+        self._program = sys.intern(program)
+        # Derived views, built on first access (see ``invalidate_settings``).
+        self._setting_keys = None
+        self._settings = None
+
     def __repr__(self):
         return f"{self._name} command"
 
     def _create_parameters(self, parameters):
         result = {}
-        for parameter, attributes in parameters.items():
-            match attributes.get("typology"):
-                case "range":
-                    result[parameter] = HonParameterRange(parameter, attributes)
-                case "enum":
-                    result[parameter] = HonParameterEnum(parameter, attributes)
-                case "fixed":
-                    result[parameter] = HonParameterFixed(parameter, attributes)
+        for key, attributes in parameters.items():
+            parameter = create_parameter(key, attributes)
+            if parameter is not None:
+                result[key] = parameter
+        if self._multi:
+            result["program"] = HonParameterProgram("program", self)
+        return result
+
+    def _restore_parameters(self, specs):
+        result = {spec[1]: parameter_from_spec(spec) for spec in specs}
         if self._multi:
             result["program"] = HonParameterProgram("program", self)
         return result
@@ -70,13 +191,29 @@ class HonCommand:
         )
 
     def get_programs(self):
-        """Return the available programs."""
+        """Return the available programs.
+
+        For a multi-program command this is a :class:`HonProgramCatalogue`:
+        listing the programs is free, a program's command is only built when
+        it is looked up.
+        """
         return self._multi
 
     def set_program(self, program):
         """Select a program for the command."""
-        self._multi[program]._multi = self._multi
-        self._device.commands[self._name] = self._multi[program]
+        command = self._multi[program]
+        command._multi = self._multi
+        command.invalidate_settings()
+        self._device.commands[self._name] = command
+        self._device.invalidate_data()
+
+    def invalidate_settings(self):
+        """Drop the cached ``setting_keys``/``settings`` views.
+
+        Needed whenever the programs or parameters behind them change.
+        """
+        self._setting_keys = None
+        self._settings = None
 
     def _get_settings_keys(self, command=None):
         command = command or self
@@ -90,17 +227,29 @@ class HonCommand:
 
     @property
     def setting_keys(self):
-        """Return the keys of the settable parameters."""
+        """Return the keys of the settable parameters (cached)."""
+        if self._setting_keys is None:
+            self._setting_keys = tuple(self._build_setting_keys())
+        return self._setting_keys
+
+    def _build_setting_keys(self):
         if not self._multi:
             return self._get_settings_keys()
+        if isinstance(self._multi, HonProgramCatalogue):
+            return self._multi.setting_keys | {"program"}
         result = [
             key for cmd in self._multi.values() for key in self._get_settings_keys(cmd)
         ]
-        return list(set(result + ["program"]))
+        return set(result + ["program"])
 
     @property
     def settings(self):
-        """Parameters with typology enum and range"""
+        """Parameters with typology enum and range (cached, read-only)."""
+        if self._settings is None:
+            self._settings = MappingProxyType(self._build_settings())
+        return self._settings
+
+    def _build_settings(self):
         if not self._multi:
             return {
                 key: parameter
@@ -111,7 +260,9 @@ class HonCommand:
         result = {}
         for key in self.setting_keys:
             parameter = self._parameters.get(key)
-            if parameter is None:
+            if parameter is None and isinstance(self._multi, HonProgramCatalogue):
+                parameter = self._multi.find_parameter(key)
+            elif parameter is None:
                 for command in self._multi.values():
                     parameter = command.parameters.get(key)
                     if parameter is not None:
@@ -132,3 +283,99 @@ class HonCommand:
             example += f"'{key}':{parameter.default},"
         example = example[:-1] + "}"
         return text, example
+
+
+class HonProgramCatalogue(Mapping[str, HonCommand]):
+    """The programs of a multi-program command, built on demand.
+
+    Keeps the per-program payloads (raw attributes, or ``compile_catalogue``
+    table entries when ``compiled``) and only builds a program's
+    :class:`HonCommand` (and its parameters) when it is looked up. Built
+    programs are kept, so the values set on them survive a program switch.
+    Iterating, ``len`` and membership tests never build anything.
+    """
+
+    def __init__(self, name, programs, connector, device, *, compiled=False):
+        """Initialize the catalogue from ``{program: attributes}``."""
+        self._name = name
+        self._programs = programs
+        self._compiled = compiled
+        self._connector = connector
+        self._device = device
+        self._built = {}
+        self._setting_keys = None
+        self._parameters = {}
+        self.builds = 0
+
+    def __repr__(self):
+        return f"{self._name} programs {list(self._programs)}"
+
+    def __getitem__(self, program):
+        command = self._built.get(program)
+        if command is not None:
+            return command
+        build = HonCommand.from_spec if self._compiled else HonCommand
+        command = build(
+            self._name,
+            self._programs[program],
+            self._connector,
+            self._device,
+            multi=self,
+            program=program,
+        )
+        self.builds += 1
+        self._built[program] = command
+        return command
+
+    def __iter__(self):
+        return iter(self._programs)
+
+    def __len__(self):
+        return len(self._programs)
+
+    def __contains__(self, program):
+        return program in self._programs
+
+    @property
+    def setting_keys(self):
+        """Return the settable parameter keys across every program."""
+        if self._setting_keys is None:
+            if self._compiled:
+                self._setting_keys = frozenset(
+                    spec[1]
+                    for entry in self._programs.values()
+                    for spec in entry["parameters"]
+                    if spec[0] in SETTABLE_KINDS
+                )
+            else:
+                self._setting_keys = frozenset(
+                    key
+                    for attributes in self._programs.values()
+                    for key, parameter in attributes.get("parameters", {}).items()
+                    if parameter.get("typology") in SETTABLE_KINDS
+                )
+        return self._setting_keys
+
+    def find_parameter(self, key):
+        """Return a settable parameter ``key`` from the first program having it.
+
+        The program is found from the payloads, then built: the parameter
+        belongs to its command, so values set on it are sent with it.
+        """
+        if key in self._parameters:
+            return self._parameters[key]
+        parameter = None
+        for program, attributes in self._programs.items():
+            if self._compiled:
+                found = any(
+                    spec[1] == key and spec[0] in SETTABLE_KINDS
+                    for spec in attributes["parameters"]
+                )
+            else:
+                raw = attributes.get("parameters", {}).get(key)
+                found = raw is not None and raw.get("typology") in SETTABLE_KINDS
+            if found:
+                parameter = self[program].parameters.get(key)
+                break
+        self._parameters[key] = parameter
+        return parameter
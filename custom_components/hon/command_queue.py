@@ -0,0 +1,110 @@
+"""Debounced, serialized command sending for one appliance."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from .const import COMMAND_DEBOUNCE
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HonCommandQueue:
+    """Merge the parameter changes of one appliance into batched sends.
+
+    :meth:`async_submit` adds parameters to the pending batch and waits for
+    it: the batch is sent ``delay`` seconds after its first change, so
+    changes arriving in quick succession (fan mode, swing and temperature
+    from one automation) leave as one command, and every caller gets the
+    result of that send. A later change to the same key overrides the
+    earlier one. Sends sharing ``lock`` never overlap, and ``refresh`` runs
+    once after each successful batch. With an ``entry`` the flush is one of
+    its background tasks: unloading the entry drops the pending batch and
+    cancels its callers.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send: Callable[[dict[str, Any]], Awaitable[Any]],
+        *,
+        refresh: Callable[[], Awaitable[None]] | None = None,
+        lock: asyncio.Lock | None = None,
+        delay: float = COMMAND_DEBOUNCE,
+        entry: ConfigEntry | None = None,
+    ) -> None:
+        """Initialize an empty queue."""
+        self._hass = hass
+        self._entry = entry
+        self._send = send
+        self._refresh = refresh
+        self._lock = lock or asyncio.Lock()
+        self._delay = delay
+        self._pending: dict[str, Any] = {}
+        self._result: asyncio.Future[Any] | None = None
+        self._batches = 0
+        self._merged = 0
+
+    async def async_submit(self, parameters: dict[str, Any]) -> Any:
+        """Queue parameter changes; return the result of the batch send."""
+        self._pending.update(parameters)
+        if self._result is None:
+            self._result = self._hass.loop.create_future()
+            if self._entry is not None:
+                task = self._entry.async_create_background_task(
+                    self._hass,
+                    self._async_flush_later(),
+                    "hon command batch",
+                    eager_start=False,
+                )
+            else:
+                task = self._hass.async_create_task(
+                    self._async_flush_later(), "hon command batch", eager_start=False
+                )
+            task.add_done_callback(partial(self._drop_cancelled, self._result))
+        else:
+            self._merged += 1
+        return await asyncio.shield(self._result)
+
+    async def _async_flush_later(self) -> None:
+        """Send the pending batch once the debounce window elapsed."""
+        await asyncio.sleep(self._delay)
+        async with self._lock:
+            result, self._result = self._result, None
+            parameters, self._pending = self._pending, {}
+            self._batches += 1
+            try:
+                value = await self._send(parameters)
+            except Exception as err:
+                # Every caller of the batch gets the error of its send.
+                result.set_exception(err)
+                # Mark it retrieved in case every caller was cancelled.
+                result.exception()
+                return
+        result.set_result(value)
+        if value is not False and self._refresh is not None:
+            await self._refresh()
+
+    def _drop_cancelled(
+        self, result: asyncio.Future[Any], task: asyncio.Task[None]
+    ) -> None:
+        """Cancel the callers of a batch whose flush was cancelled (unload)."""
+        if not task.cancelled():
+            return
+        if self._result is result:
+            self._result = None
+            self._pending = {}
+        result.cancel()
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of batches sent and of changes merged into them."""
+        return {"batches": self._batches, "merged": self._merged}
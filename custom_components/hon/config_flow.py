@@ -24,12 +24,18 @@ from .api.exceptions import (
     HonRateLimitError,
 )
 from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_BATCH_POLLING,
     CONF_COGNITO_TOKEN,
     CONF_FRAMEWORK,
     CONF_ID_TOKEN,
     CONF_REFRESH_TOKEN,
+    CONF_TRACING,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_BATCH_POLLING,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TRACING,
     DOMAIN,
 )
 
@@ -301,6 +307,24 @@ class HonOptionsFlowHandler(config_entries.OptionsFlow):
                             mode=selector.NumberSelectorMode.BOX,
                         )
                     ),
+                    vol.Optional(
+                        CONF_BATCH_POLLING,
+                        default=self.config_entry.options.get(
+                            CONF_BATCH_POLLING, DEFAULT_BATCH_POLLING
+                        ),
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_ADAPTIVE_POLLING,
+                        default=self.config_entry.options.get(
+                            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+                        ),
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_TRACING,
+                        default=self.config_entry.options.get(
+                            CONF_TRACING, DEFAULT_TRACING
+                        ),
+                    ): selector.BooleanSelector(),
                 }
             ),
         )
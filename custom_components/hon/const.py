@@ -24,6 +24,35 @@ CONF_FRAMEWORK = "framework"
 CONF_UPDATE_INTERVAL = "update_interval"
 DEFAULT_SCAN_INTERVAL = 60
 
+# Batch mode: one account-wide timer refreshes every appliance instead of one
+# timer per appliance, with at most POLL_CONCURRENCY requests in flight.
+CONF_BATCH_POLLING = "batch_polling"
+DEFAULT_BATCH_POLLING = False
+POLL_CONCURRENCY = 4
+
+# Adaptive polling: the refresh interval follows the appliance activity
+# (see polling.py) instead of the fixed update interval.
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+DEFAULT_ADAPTIVE_POLLING = False
+
+# Tracing: record the duration of every refresh stage (see tracing.py); also
+# toggled at runtime by the set_tracing service.
+CONF_TRACING = "tracing"
+DEFAULT_TRACING = False
+
+# Settings changes sent to one appliance within this window (seconds) are
+# merged into a single command followed by a single refresh.
+COMMAND_DEBOUNCE = 0.5
+
+# Values written to an appliance are shown until a context confirms them, the
+# appliance reports a newer change, or this many seconds passed.
+OPTIMISTIC_TIMEOUT = 90
+
+# Lifetime statistics (cycle counters, water and energy totals) are
+# re-fetched once this many seconds passed since the last fetch, or when a
+# program ends (see statistics.py).
+STATISTICS_TTL = 6 * 3600
+
 PLATFORMS = [
     "climate",
     "water_heater",
@@ -7,14 +7,18 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
-from .api.exceptions import HonError
+from .api.exceptions import HonConnectionError, HonError, HonRateLimitError
+from .command_queue import HonCommandQueue
 from .devices.device import HonDevice
+from .polling import STATE_DISCONNECTED, activity_state
+from .statistics import HonStatisticsTracker
 
 if TYPE_CHECKING:
     from datetime import timedelta
@@ -22,6 +26,7 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from .api.client import HonConnection
+    from .polling import HonPollingProfile
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +37,10 @@ class HonBaseCoordinator(DataUpdateCoordinator[HonDevice]):
     Each appliance owned by the account gets its own coordinator. The
     coordinator holds a mutable :class:`HonDevice` instance that entities
     read through :attr:`device` (aliased to :attr:`data` once refreshed).
+    With batch polling enabled the coordinator has no ``update_interval``
+    and is refreshed by the account-wide :class:`HonPollScheduler`. With a
+    polling profile the interval follows the appliance activity (see
+    :mod:`.polling`).
     """
 
     def __init__(
@@ -39,7 +48,8 @@ class HonBaseCoordinator(DataUpdateCoordinator[HonDevice]):
         hass: HomeAssistant,
         hon: HonConnection,
         appliance: dict[str, Any],
-        update_interval: timedelta,
+        update_interval: timedelta | None,
+        polling_profile: HonPollingProfile | None = None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -51,8 +61,45 @@ class HonBaseCoordinator(DataUpdateCoordinator[HonDevice]):
         )
         self._hon = hon
         self._appliance = appliance
+        self._type_name = appliance.get("applianceTypeName", "")
+        self.tracer = hon.tracer
         self._device = HonDevice(hon, self, appliance)
         self._initial_context_loaded = False
+        # Device data version the entities were last notified at, and whether
+        # the refresh in progress left it untouched (see async_update_listeners).
+        self._listeners_version = -1
+        self._skip_fan_out = False
+        self._skipped_fan_outs = 0
+        # Adaptive polling: interval picked after each refresh, consecutive
+        # offline polls (for the backoff) and loop time of the last refresh.
+        # Without a timer of its own (batch mode) the interval only gates the
+        # scheduler ticks (see poll_due).
+        self._polling_profile = polling_profile
+        self._own_timer = update_interval is not None
+        self._poll_interval: timedelta | None = None
+        self._offline_polls = 0
+        self._last_poll: float | None = None
+        # Lifetime statistics are refreshed on their own schedule, one
+        # background fetch at a time (see statistics.py).
+        self._statistics = HonStatisticsTracker(appliance.get("applianceTypeId"))
+        self._statistics_task: asyncio.Task[None] | None = None
+        # Commands to the appliance never overlap, and settings changes made
+        # in quick succession leave as one command and one refresh.
+        self._command_lock = asyncio.Lock()
+        self._settings_queue = HonCommandQueue(
+            hass,
+            self._async_send_settings,
+            refresh=self.async_refresh,
+            lock=self._command_lock,
+            entry=self.config_entry,
+        )
+        self._set_queue = HonCommandQueue(
+            hass,
+            self._async_send_set,
+            refresh=self.async_refresh,
+            lock=self._command_lock,
+            entry=self.config_entry,
+        )
 
     @property
     def device(self) -> HonDevice:
@@ -68,6 +115,68 @@ class HonBaseCoordinator(DataUpdateCoordinator[HonDevice]):
         """
         self._appliance.clear()
         self._appliance.update(appliance)
+        self._device.invalidate_data()
+
+    @property
+    def skipped_fan_outs(self) -> int:
+        """Return how many refreshes skipped notifying the entities."""
+        return self._skipped_fan_outs
+
+    @property
+    def poll_interval(self) -> timedelta | None:
+        """Return the interval picked by the adaptive polling, if enabled."""
+        return self._poll_interval
+
+    def poll_due(self) -> bool:
+        """Return whether the adaptive interval elapsed since the last poll.
+
+        Used by the batch scheduler, whose ticks stand in for the timer;
+        a one-second slack absorbs the tick jitter.
+        """
+        if self._poll_interval is None or self._last_poll is None:
+            return True
+        elapsed = self.hass.loop.time() - self._last_poll
+        return elapsed >= self._poll_interval.total_seconds() - 1
+
+    def _adapt_interval(self) -> None:
+        """Derive the next refresh interval from the device activity."""
+        self._last_poll = self.hass.loop.time()
+        if self._polling_profile is None:
+            return
+        state = activity_state(self._device, self._polling_profile)
+        if state == STATE_DISCONNECTED:
+            self._offline_polls += 1
+        else:
+            self._offline_polls = 0
+        self._poll_interval = self._polling_profile.interval(state, self._offline_polls)
+        if self._own_timer:
+            self.update_interval = self._poll_interval
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the entities, unless the last refresh changed nothing."""
+        if self._skip_fan_out:
+            self._skip_fan_out = False
+            if self._device.data_version == self._listeners_version:
+                self._skipped_fan_outs += 1
+                return
+        self._listeners_version = self._device.data_version
+        super().async_update_listeners()
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> CALLBACK_TYPE:
+        """Listen for data updates, timed per entity class while tracing."""
+        tracer = self.tracer
+        target = type(getattr(update_callback, "__self__", update_callback)).__name__
+
+        @callback
+        def traced_update() -> None:
+            with tracer.span("entity_update", target):
+                update_callback()
+
+        return super().async_add_listener(traced_update, context)
 
     @property
     def unique_id_prefix(self) -> str:
@@ -81,23 +190,27 @@ class HonBaseCoordinator(DataUpdateCoordinator[HonDevice]):
 
         On a warm boot the command catalogue and statistics come from the
         persisted setup cache, so only the live context blocks the setup; the
-        cached payloads are then re-fetched in the background. On a cold boot
-        (or after a firmware change) the three independent requests run as a
-        single parallel batch and the results are persisted for the next boot.
+        catalogue is then re-fetched in the background, and the statistics
+        too once their TTL expired. On a cold boot (or after a firmware
+        change) the three independent requests run as a single parallel batch
+        and the results are persisted for the next boot.
         """
         device = self._device
         cached = self._hon.get_cached_setup(
             device.mac_address, self._appliance.get("fwVersion")
         )
         if cached is not None:
-            await device.load_commands(cached["commands"])
-            await device.load_statistics(cached["statistics"])
+            await device.load_commands(cached["commands"], table=cached.get("table"))
+            await device.load_statistics(
+                cached["statistics"], state=cached.get("statistics_state")
+            )
             await device.load_context()
             if self.config_entry is not None:
                 self.config_entry.async_create_background_task(
                     self.hass,
                     self._async_refresh_setup_cache(),
                     f"hon deferred setup refresh {device.appliance_type}",
+                    eager_start=False,
                 )
         else:
             commands, statistics, _ = await asyncio.gather(
@@ -110,23 +223,25 @@ class HonBaseCoordinator(DataUpdateCoordinator[HonDevice]):
                 self._appliance.get("fwVersion"),
                 commands,
                 statistics,
+                statistics_state=device.statistics_state,
             )
+        self._statistics.program_ended(device)
         self._initial_context_loaded = True
 
     async def _async_refresh_setup_cache(self) -> None:
-        """Re-fetch the catalogue and statistics that a warm boot served stale.
+        """Re-fetch the catalogue (and stale statistics) a warm boot served.
 
-        Runs in the background after a cache-backed setup: statistics evolve
-        over time and the catalogue can change server-side, so the live
-        payloads replace the cached ones and are persisted for the next boot.
-        A failure here is harmless — the cached data stays in place.
+        Runs in the background after a cache-backed setup: the catalogue can
+        change server-side, so the live payload replaces the cached one and
+        is persisted for the next boot. Statistics are only re-fetched once
+        their TTL expired. A failure here is harmless — the cached data stays
+        in place.
         """
         device = self._device
+        if self._statistics.due(device):
+            self._schedule_statistics_refresh()
         try:
-            commands, statistics = await asyncio.gather(
-                device.load_commands(),
-                device.load_statistics(),
-            )
+            commands = await device.load_commands()
         except (aiohttp.ClientError, TimeoutError, HonError) as err:
             # Log the appliance type only (MAC addresses are identifiers).
             _LOGGER.debug(
@@ -139,30 +254,114 @@ class HonBaseCoordinator(DataUpdateCoordinator[HonDevice]):
             device.mac_address,
             self._appliance.get("fwVersion"),
             commands,
-            statistics,
+            device.statistics,
+            statistics_state=device.statistics_state,
         )
         self.async_update_listeners()
 
+    def _schedule_statistics_refresh(self) -> None:
+        """Refresh the statistics in the background, unless already running."""
+        if self.config_entry is None or (
+            self._statistics_task is not None and not self._statistics_task.done()
+        ):
+            return
+        self._statistics.attempted()
+        self._statistics_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_refresh_statistics(),
+            f"hon statistics refresh {self._device.appliance_type}",
+        )
+
+    async def _async_refresh_statistics(self) -> None:
+        """Re-fetch the statistics (conditionally) and persist them."""
+        device = self._device
+        version = device.data_version
+        try:
+            await device.load_statistics()
+        except (aiohttp.ClientError, TimeoutError, HonError) as err:
+            _LOGGER.debug(
+                "Statistics refresh failed for device type [%s]: %s",
+                device.appliance_type,
+                err,
+            )
+            return
+        self._hon.store_cached_statistics(
+            device.mac_address, device.statistics, device.statistics_state
+        )
+        if device.data_version != version:
+            self.async_update_listeners()
+
     async def _async_update_data(self) -> HonDevice:
         """Refresh the device context and return the device."""
+        with self.tracer.span("update_data", self._type_name):
+            return await self._async_refresh_device()
+
+    async def _async_refresh_device(self) -> HonDevice:
+        """Load the device context and return the device.
+
+        An identical context (same fingerprint, no local write since the last
+        fan-out) on a healthy coordinator skips the listener fan-out: idle
+        appliances then cost the HTTP call and nothing else.
+        """
+        self._skip_fan_out = False
         if self._initial_context_loaded:
             self._initial_context_loaded = False
+            self._adapt_interval()
             return self._device
         try:
-            await self._device.load_context()
+            with self.tracer.span("load_context", self._type_name):
+                await self._device.load_context()
         except aiohttp.ClientError as err:
             raise UpdateFailed(f"Unable to update hOn device context: {err}") from err
         except TimeoutError as err:
             raise UpdateFailed(
                 f"Timeout while updating hOn device context: {err}"
             ) from err
+        except (HonConnectionError, HonRateLimitError) as err:
+            raise UpdateFailed(f"hOn cloud unavailable: {err}") from err
         except (KeyError, TypeError) as err:
             _LOGGER.warning("Unexpected hOn device payload: %s", err)
             raise UpdateFailed("Unexpected hOn device payload") from err
+        if self._statistics.program_ended(self._device) or self._statistics.due(
+            self._device
+        ):
+            self._schedule_statistics_refresh()
+        self._skip_fan_out = (
+            self.last_update_success
+            and self._device.data_version == self._listeners_version
+        )
+        self._adapt_interval()
         return self._device
 
+    @property
+    def command_stats(self) -> dict[str, dict[str, int]]:
+        """Return the batching counters of the command queues."""
+        return {
+            "settings": self._settings_queue.stats(),
+            "set": self._set_queue.stats(),
+        }
+
+    async def async_send_settings(self, parameters: dict[str, Any]) -> bool:
+        """Queue a ``settings`` command change; return the batch result.
+
+        Changes submitted within :data:`COMMAND_DEBOUNCE` are merged into one
+        command, sent once and followed by a single refresh.
+        """
+        return await self._settings_queue.async_submit(parameters)
+
+    async def _async_send_settings(self, parameters: dict[str, Any]) -> bool:
+        """Send a merged batch of settings changes."""
+        return await self._device.settings_command(parameters).send()
+
     async def async_set(self, parameters: dict[str, str]) -> None:
-        """Send a settings update to the cloud."""
+        """Queue a settings update for the cloud (debounced like settings).
+
+        Raises :class:`UpdateFailed` when the batch could not be sent.
+        """
+        await self._set_queue.async_submit(parameters)
+
+    async def _async_send_set(self, parameters: dict[str, str]) -> None:
+        """Send a merged batch of settings updates to the cloud."""
         try:
             result = await self._hon.async_set(
                 self._device.mac_address, self._device.appliance_type, parameters
@@ -13,7 +13,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from ..const import APPLIANCE_DEFAULT_NAME, DOMAIN
 from ..coordinator import HonBaseCoordinator
-from ..helpers import snake_case
+from ..helpers import change_key, compile_key_path, snake_case
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +23,10 @@ class HonBaseEntity(CoordinatorEntity[HonBaseCoordinator]):
 
     _attr_has_entity_name = True
 
+    # Device keys the state is computed from; when set, refreshes that did not
+    # change any of them neither recompute nor write the state.
+    _depends_on: tuple[str, ...] | None = None
+
     def __init__(
         self,
         coordinator: HonBaseCoordinator,
@@ -51,6 +55,7 @@ class HonBaseEntity(CoordinatorEntity[HonBaseCoordinator]):
         }
         self._name = self._attr_device_info["name"]
         self._uid_prefix = coordinator.unique_id_prefix
+        self._watch(self._depends_on)
 
     def _unique_id_from_key(self, key: str, fallback: str = "") -> str:
         """Build the unique id from a camelCase API key.
@@ -63,12 +68,28 @@ class HonBaseEntity(CoordinatorEntity[HonBaseCoordinator]):
             key_formatted = snake_case(fallback)
         return f"{self._uid_prefix}_{key_formatted}"
 
+    def _watch(self, keys: tuple[str, ...] | None) -> None:
+        """Only recompute the state when one of the device keys changed."""
+        self._watch_keys = (
+            None if keys is None else frozenset(change_key(key) for key in keys)
+        )
+        self._seen_version = -1
+
     @callback
     def _handle_coordinator_update(self) -> None:
         if not self.available:
+            # Write again once back, even if the data did not change.
+            self._seen_version = -1
             return
-        self.coordinator_update()
-        self.async_write_ha_state()
+        device = self._device
+        if not device.changed_since(self._seen_version, self._watch_keys):
+            return
+        self._seen_version = device.data_version
+        tracer = self.coordinator.tracer
+        with tracer.span("coordinator_update", type(self).__name__):
+            self.coordinator_update()
+        with tracer.span("write_state", type(self).__name__):
+            self.async_write_ha_state()
 
     def coordinator_update(self) -> None:
         """Refresh the entity state from the device data."""
@@ -88,12 +109,15 @@ class HonBaseBinarySensorEntity(HonBaseEntity, BinarySensorEntity):
         """Initialize the binary sensor."""
         super().__init__(coordinator, appliance)
         self._key = key
+        self._key_path = compile_key_path(key)
         self._attr_unique_id = self._unique_id_from_key(key, sensor_name)
         self._attr_translation_key = snake_case(key or sensor_name)
+        if self._depends_on is None:
+            self._watch((key,))
         self.coordinator_update()
 
     def coordinator_update(self) -> None:
-        self._attr_is_on = self._device.get(self._key) == "1"
+        self._attr_is_on = self._device.get(self._key_path) == "1"
 
 
 class HonBaseSensorEntity(HonBaseEntity, SensorEntity):
@@ -109,12 +133,15 @@ class HonBaseSensorEntity(HonBaseEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator, appliance)
         self._key = key
+        self._key_path = compile_key_path(key)
         self._attr_unique_id = self._unique_id_from_key(key, sensor_name)
         self._attr_translation_key = snake_case(key or sensor_name)
+        if self._depends_on is None:
+            self._watch((key,))
         self.coordinator_update()
 
     def coordinator_update(self) -> None:
-        self._attr_native_value = self._device.get(self._key)
+        self._attr_native_value = self._device.get(self._key_path)
 
 
 class HonBaseSwitchEntity(HonBaseEntity, SwitchEntity):
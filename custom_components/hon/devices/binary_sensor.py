@@ -6,8 +6,11 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
 )
 
+from ..helpers import compile_key_path
 from .base import HonBaseBinarySensorEntity
 
+_LAST_CONN_CATEGORY = compile_key_path("attributes.lastConnEvent.category")
+
 
 class HonBaseGenericStatus(HonBaseBinarySensorEntity):
     """Binary sensor showing a generic status attribute."""
@@ -23,6 +26,8 @@ class HonBaseGenericStatus(HonBaseBinarySensorEntity):
 class HonBaseOnOff(HonBaseBinarySensorEntity):
     """Binary sensor showing the power state."""
 
+    _depends_on = ("onOffStatus", "attributes.lastConnEvent")
+
     def __init__(self, hass, coordinator, entry, appliance) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator, appliance, "onOffStatus", "Status")
@@ -30,12 +35,10 @@ class HonBaseOnOff(HonBaseBinarySensorEntity):
         self._attr_device_class = BinarySensorDeviceClass.POWER
 
     def coordinator_update(self):
-        if self._device.has("onOffStatus"):
-            self._attr_is_on = self._device.get("onOffStatus") == "1"
+        if self._device.has(self._key_path):
+            self._attr_is_on = self._device.get(self._key_path) == "1"
         else:
-            self._attr_is_on = (
-                self._device.get("attributes.lastConnEvent.category") == "CONNECTED"
-            )
+            self._attr_is_on = self._device.get(_LAST_CONN_CATEGORY) == "CONNECTED"
 
 
 class HonBaseDoorStatus(HonBaseBinarySensorEntity):
@@ -101,7 +104,7 @@ class HonBaseDoorLockStatus(HonBaseBinarySensorEntity):
         self._attr_device_class = BinarySensorDeviceClass.LOCK
 
     def coordinator_update(self):
-        self._attr_is_on = self._device.get("doorLockStatus") == "0"
+        self._attr_is_on = self._device.get(self._key_path) == "0"
 
 
 class HonBaseChildLockStatus(HonBaseBinarySensorEntity):
@@ -115,7 +118,7 @@ class HonBaseChildLockStatus(HonBaseBinarySensorEntity):
         self._attr_device_class = BinarySensorDeviceClass.LOCK
 
     def coordinator_update(self):
-        self._attr_is_on = self._device.get("lockStatus") == "0"
+        self._attr_is_on = self._device.get(self._key_path) == "0"
 
 
 class HonBasePreheating(HonBaseBinarySensorEntity):
@@ -150,7 +153,7 @@ class HonBaseMuteStatus(HonBaseBinarySensorEntity):
         self._attr_icon = "mdi:volume-off"
 
     def coordinator_update(self):
-        self._attr_is_on = self._device.get("muteStatus") == "1"
+        self._attr_is_on = self._device.get(self._key_path) == "1"
 
 
 class HonBasePauseStatus(HonBaseBinarySensorEntity):
@@ -163,4 +166,4 @@ class HonBasePauseStatus(HonBaseBinarySensorEntity):
         self._attr_icon = "mdi:pause-circle"
 
     def coordinator_update(self):
-        self._attr_is_on = self._device.get("pause") == "1"
+        self._attr_is_on = self._device.get(self._key_path) == "1"
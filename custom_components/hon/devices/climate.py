@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -23,7 +22,6 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import callback
-from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from ..const import (
@@ -38,6 +36,15 @@ from ..parameter import HonParameterRange
 
 _LOGGER = logging.getLogger(__name__)
 
+# startProgram programs switching the air conditioner to each HVAC mode.
+HVAC_PROGRAMS = {
+    HVACMode.COOL: "iot_cool",
+    HVACMode.HEAT: "iot_heat",
+    HVACMode.DRY: "iot_dry",
+    HVACMode.AUTO: "iot_auto",
+    HVACMode.FAN_ONLY: "iot_fan",
+}
+
 
 class HonClimateEntity(CoordinatorEntity, ClimateEntity):
     """Climate entity for an hOn air conditioner."""
@@ -60,7 +67,6 @@ class HonClimateEntity(CoordinatorEntity, ClimateEntity):
         self._fwVersion = appliance["fwVersion"]
         self._unique_id = f"{coordinator.unique_id_prefix}_climate"
         self._available = True
-        self._watcher = None
         self._device = coordinator.device
 
         # Not working for Farenheit
@@ -116,72 +122,54 @@ class HonClimateEntity(CoordinatorEntity, ClimateEntity):
         """Set the sleep mode."""
         self._sleep_mode = sleep_mode
         parameters = {"silentSleepStatus": "1" if sleep_mode else "0"}
-        await self._device.settings_command(parameters).send()
+        await self._device.send_settings(parameters)
 
     async def async_set_rapid_mode(self, rapid_mode=False):
         """Set the rapid mode."""
         self._rapid_mode = rapid_mode
         parameters = {"rapidMode": "1" if rapid_mode else "0"}
-        await self._device.settings_command(parameters).send()
+        await self._device.send_settings(parameters)
 
     async def async_set_silent_mode(self, silent_mode=False):
         """Set the silent mode."""
         self._silent_mode = silent_mode
         parameters = {"muteStatus": "1" if silent_mode else "0"}
-        await self._device.settings_command(parameters).send()
+        await self._device.send_settings(parameters)
 
     async def async_set_screen_display(self, screen_display=True):
         """Set whether the display stays on."""
         self._screen_display = screen_display
         parameters = {"screenDisplayStatus": "1" if screen_display else "0"}
-        await self._device.settings_command(parameters).send()
+        await self._device.send_settings(parameters)
 
     async def async_set_echo_mode(self, echo_mode=False):
         """Set the echo mode."""
         self._echo_mode = echo_mode
         parameters = {"echoStatus": "0" if echo_mode else "1"}
-        await self._device.settings_command(parameters).send()
+        await self._device.send_settings(parameters)
 
     async def async_set_wind_direction_horizontal(self, value: int):
         """Set the horizontal wind direction."""
         self._wind_direction_horizontal = value
         parameters = {"windDirectionHorizontal": str(value)}
-        await self._device.settings_command(parameters).send()
+        await self._device.send_settings(parameters)
 
     async def async_set_wind_direction_vertical(self, value: int):
         """Set the vertical wind direction."""
         self._wind_direction_vertical = value
         parameters = {"windDirectionVertical": str(value)}
-        await self._device.settings_command(parameters).send()
+        await self._device.send_settings(parameters)
 
     async def async_set_eco_pilot_mode(self, value: int):
         """Set the eco pilot mode."""
         self._eco_pilot_mode = value
         parameters = {"humanSensingStatus": value}
-        await self._device.settings_command(parameters).send()
-
-    def start_watcher(self, timedelta=timedelta(seconds=8)):
-        """Start a short watcher that suppresses coordinator overwrites."""
-        if self._watcher is not None:
-            self._watcher()
-        self._watcher = async_call_later(
-            self._hass, timedelta, self.async_update_after_state_change
-        )
-        self.async_write_ha_state()
-
-    async def async_update_after_state_change(
-        self, now: datetime | None = None
-    ) -> None:
-        """Clear the state-change watcher."""
-        self._watcher = None
+        await self._device.send_settings(parameters)
 
     @callback
     def _handle_coordinator_update(self, update=True) -> None:
-
-        # Watcher is running, update is not allowed because the data may not be yet accurate
-        if self._watcher != None:
-            return
-
+        # Values just sent are kept by the device until a context confirms
+        # them (HonDevice.expect), so a stale refresh cannot revert them.
         self._attr_target_temperature = int(float(self._device.get("tempSel")))
         self._attr_current_temperature = float(self._device.get("tempIndoor"))
 
@@ -273,54 +261,51 @@ class HonClimateEntity(CoordinatorEntity, ClimateEntity):
         """Set new target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return False
-        await self._device.settings_command({"tempSel": temperature}).send()
+        await self._device.send_settings({"tempSel": temperature})
         self._attr_target_temperature = int(float(temperature))
-        self.start_watcher()
+        self.async_write_ha_state()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
-        command = {}
-
         if hvac_mode == HVACMode.OFF:
-            await self._device.stop_command().send()
-        elif hvac_mode == HVACMode.COOL:
-            await self._device.start_command("iot_cool").send()
-        elif hvac_mode == HVACMode.HEAT:
-            await self._device.start_command("iot_heat").send()
-        elif hvac_mode == HVACMode.DRY:
-            await self._device.start_command("iot_dry").send()
-        elif hvac_mode == HVACMode.AUTO:
-            await self._device.start_command("iot_auto").send()
-        elif hvac_mode == HVACMode.FAN_ONLY:
-            await self._device.start_command("iot_fan").send()
+            await self._device.async_send(
+                self._device.stop_command(), {"onOffStatus": "0"}
+            )
+        elif hvac_mode in HVAC_PROGRAMS:
+            await self._device.async_send(
+                self._device.start_command(HVAC_PROGRAMS[hvac_mode]),
+                {"onOffStatus": "1", "machMode": CLIMATE_HVAC_MODE[hvac_mode]},
+            )
         self._attr_hvac_mode = hvac_mode
-        self.start_watcher()
+        self.async_write_ha_state()
 
     async def async_turn_off(self) -> None:
         """Turn the device off."""
-        await self._device.stop_command().send()
+        await self._device.async_send(self._device.stop_command(), {"onOffStatus": "0"})
         self._attr_hvac_mode = HVACMode.OFF
-        self.start_watcher()
+        self.async_write_ha_state()
 
     async def async_turn_on(self) -> None:
         """Turn the device on."""
-        await self._device.start_command("iot_simple_start").send()
+        await self._device.async_send(
+            self._device.start_command("iot_simple_start"), {"onOffStatus": "1"}
+        )
         self._attr_hvac_mode = get_key(
             CLIMATE_HVAC_MODE, self._device.get("machMode"), HVACMode.OFF
         )
-        self.start_watcher()
+        self.async_write_ha_state()
 
     async def async_set_fan_mode(self, fan_mode: str):
         """Set the fan mode."""
         self._attr_fan_mode = fan_mode
-        await self._device.settings_command(
+        await self._device.send_settings(
             {
                 "windSpeed": CLIMATE_FAN_MODE.get(
                     fan_mode, CLIMATE_FAN_MODE.get(FAN_MEDIUM)
                 )
             }
-        ).send()
-        self.start_watcher()
+        )
+        self.async_write_ha_state()
 
     async def async_set_swing_mode(self, swing_mode: str):
         """Set the swing mode."""
@@ -366,11 +351,5 @@ class HonClimateEntity(CoordinatorEntity, ClimateEntity):
                 parameters["windDirectionVertical"] = ClimateSwingVertical.MIDDLE
 
         self._attr_swing_mode = swing_mode
-        await self._device.settings_command(parameters).send()
-        self.start_watcher()
-
-    async def async_will_remove_from_hass(self):
-        """When entity will be removed from hass."""
-        if self._watcher is not None:
-            self._watcher()
-            self._watcher = None
+        await self._device.send_settings(parameters)
+        self.async_write_ha_state()
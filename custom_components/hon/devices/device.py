@@ -3,18 +3,57 @@
 from __future__ import annotations
 
 import logging
+import time
+from types import MappingProxyType
+from typing import NamedTuple
 
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
 )
+from homeassistant.util import dt as dt_util
 
-from ..command import HonCommand
-from ..const import APPLIANCE_DEFAULT_NAME, DOMAIN
+from ..command import (
+    CATALOGUE_TABLE_VERSION,
+    HonCommand,
+    HonProgramCatalogue,
+    split_catalogue,
+)
+from ..const import APPLIANCE_DEFAULT_NAME, DOMAIN, OPTIMISTIC_TIMEOUT
+from ..helpers import compile_key_path, context_fingerprint
 from ..parameter import HonParameterFixed
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class PendingWrite(NamedTuple):
+    """A parameter value sent to the appliance and not yet confirmed."""
+
+    value: object
+    previous: object
+    sent_at: float
+
+
+def _same_value(current, expected):
+    """Compare a context value with a written one ("21" matches 21.0)."""
+    if current == expected or str(current) == str(expected):
+        return True
+    try:
+        return float(current) == float(expected)
+    except (TypeError, ValueError):
+        return False
+
+
+def _updated_after(shadow_parameter, timestamp):
+    """Return whether a shadow parameter changed after ``timestamp``."""
+    if not isinstance(shadow_parameter, dict):
+        return False
+    last_update = shadow_parameter.get("lastUpdate")
+    if not isinstance(last_update, str):
+        return False
+    when = dt_util.parse_datetime(last_update)
+    return when is not None and when.timestamp() > timestamp
+
+
 class HonDevice(CoordinatorEntity):
     """Model of a connected appliance: data, attributes, statistics and commands."""
 
@@ -45,33 +84,121 @@ class HonDevice(CoordinatorEntity):
         self._appliance_model = {}
         self._attributes = {}
         self._statistics = {}
+        # Wall-clock time of the last statistics fetch (or 304 confirmation)
+        # and the HTTP validators the cloud sent with it (``etag`` and
+        # ``last_modified``), for the next conditional request.
+        self._statistics_time = None
+        self._statistics_validators = {}
+
+        # Merged read view of the device data, rebuilt lazily once per
+        # data version (see ``data``).
+        self._data_version = 0
+        self._data_view = None
+        self._data_view_version = -1
+        # Flattened command settings (see ``settings``), dropped on a full
+        # invalidation.
+        self._settings_view = None
+
+        # Data version at which each change key (see ``helpers.change_key``)
+        # last changed, and the last version at which anything may have.
+        self._key_versions = {}
+        self._full_change_version = 0
+        self._changed_keys = frozenset()
+
+        # ``lastUpdate`` stamp of each shadow parameter as last parsed; an
+        # unchanged stamp lets ``_parse_shadow`` skip the value.
+        self._shadow_stamps = {}
+
+        # Fingerprint of the last parsed context and the data version it left.
+        self._context_fingerprint = None
+        self._context_version = -1
+
+        # Optimistic state: values written to the appliance, shown until an
+        # incoming context reconciles them (see ``expect``).
+        self._pending = {}
+        # Values a prepared command overwrote, by key, until the next context:
+        # ``expect`` reverts to them rather than to the prepared value.
+        self._prepared = {}
+        self._optimistic_stats = {
+            "confirmed": 0,
+            "superseded": 0,
+            "timed_out": 0,
+            "failed": 0,
+        }
 
     def __getitem__(self, item):
-        if "." in item:
-            result = self.data
-            for key in item.split("."):
-                if all([k in "0123456789" for k in key]) and type(result) is list:
-                    result = result[int(key)]
-                else:
-                    result = result[key]
-            return result
-        else:
-            if item in self.data:
-                return self.data[item]
-            if item in self.attributes["parameters"]:
-                return self.attributes["parameters"].get(item)
-            return self.appliance[item]
+        path = item if type(item) is tuple else compile_key_path(item)
+        if len(path) == 1:
+            key = path[0][0]
+            data = self.data
+            if key in data:
+                return data[key]
+            if key in self.attributes["parameters"]:
+                return self.attributes["parameters"].get(key)
+            return self.appliance[key]
+        result = self.data
+        for key, index in path:
+            if index is not None and type(result) is list:
+                result = result[index]
+            else:
+                result = result[key]
+        return result
 
     def set(self, item, value):
         """Store a value in the device data.
 
         The value is persisted in the mutable parameters store (``data``
-        rebuilds a fresh dict on every access and must not be written to).
+        is a read-only view and must not be written to).
         """
         self.attributes.setdefault("parameters", {})[item] = value
+        # Re-read the key from the next context even if its stamp is unchanged.
+        self._shadow_stamps.pop(item, None)
+        self.invalidate_data((item,))
+
+    def invalidate_data(self, keys=None):
+        """Mark the device data as changed so ``data`` is rebuilt on next read.
+
+        ``keys`` lists the change keys that changed; ``None`` means anything
+        may have; an empty ``keys`` leaves the data version unchanged. Called
+        after every load and local write; code that mutates commands or
+        parameters behind the device's back must call it too.
+        """
+        if keys is not None and not keys:
+            return
+        self._data_version += 1
+        if keys is None:
+            self._full_change_version = self._data_version
+            self._settings_view = None
+            return
+        for key in keys:
+            self._key_versions[key] = self._data_version
+
+    def changed_since(self, version, keys=None):
+        """Return whether any of the change keys changed after ``version``.
+
+        ``keys`` set to ``None`` matches any change.
+        """
+        if keys is None or version < self._full_change_version:
+            return True
+        key_versions = self._key_versions
+        return any(key_versions.get(key, -1) > version for key in keys)
+
+    @property
+    def changed_keys(self):
+        """Return the change keys that differed in the last context refresh."""
+        return self._changed_keys
+
+    @property
+    def data_version(self):
+        """Return the version counter of the device data."""
+        return self._data_version
 
     def get(self, item, default=None):
-        """Return a device value, or the default when missing."""
+        """Return a device value, or the default when missing.
+
+        ``item`` is a dotted key or a path from ``compile_key_path``; hot
+        callers pass the compiled path to skip the key parsing.
+        """
         try:
             return self[item]
         except (KeyError, IndexError):
@@ -149,37 +276,211 @@ class HonDevice(CoordinatorEntity):
     async def load_context(self):
         """Fetch the latest device context from the cloud."""
         data = await self._hon.async_get_context(self)
-        self._attributes = data or {}
-
-        shadow = self._attributes.pop("shadow", None)
+        fingerprint = context_fingerprint(data)
+        if (
+            fingerprint == self._context_fingerprint
+            and self._context_version == self._data_version
+            and not self._pending
+        ):
+            # Same payload and no local write since: nothing to re-parse.
+            self._changed_keys = frozenset()
+            return
+        previous = self._attributes
+        data = data or {}
+        # Copy rather than pop the shadow: the payload may be shared by
+        # coalesced reads of the same context.
+        self._attributes = {
+            key: value for key, value in data.items() if key != "shadow"
+        }
+        changed = self._parse_shadow(data.get("shadow"), previous.get("parameters"))
+        self._prepared.clear()
+        if self._pending:
+            # Re-applied optimistic values were already shown before.
+            changed -= self._reconcile_pending(data.get("shadow"))
+        for name in previous.keys() | self._attributes.keys():
+            if name != "parameters" and previous.get(name) != self._attributes.get(
+                name
+            ):
+                changed.add(f"attributes.{name}")
+        self._changed_keys = frozenset(changed)
+        self.invalidate_data(self._changed_keys)
+        self._context_fingerprint = fingerprint
+        self._context_version = self._data_version
+
+    def _parse_shadow(self, shadow, parameters):
+        """Update ``parameters`` in place from the context shadow.
+
+        ``parameters`` is the dict of the previous context, kept as
+        ``attributes["parameters"]``; only the entries that differ are
+        written. A parameter whose ``lastUpdate`` stamp is unchanged since
+        the last parse (and was not written locally since) is skipped
+        without reading its value. Returns the names of the parameters that
+        changed, appeared or disappeared.
+        """
         if not shadow:
             _LOGGER.warning(
                 "Unable to get device context: no shadow data in: %s", self._attributes
             )
-            return
+            self._shadow_stamps = {}
+            return set(parameters or ())
 
-        parameters = shadow.get("parameters")
-        if not parameters:
+        shadow_parameters = shadow.get("parameters")
+        if not shadow_parameters:
             _LOGGER.warning(
                 "Unable to get device context: no parameters in shadow data. %s",
                 self._attributes,
             )
-            return
+            self._shadow_stamps = {}
+            return set(parameters or ())
+
+        if parameters is None:
+            parameters = {}
+        self._attributes["parameters"] = parameters
+        stamps = self._shadow_stamps
+        pending = self._pending
+        changed = set()
+        added = False
+        for name, values in shadow_parameters.items():
+            stamp = values.get("lastUpdate")
+            if (
+                stamp is not None
+                and stamps.get(name) == stamp
+                and name not in pending
+                and name in parameters
+            ):
+                continue
+            stamps[name] = stamp
+            value = values.get("parNewVal")
+            if name not in parameters:
+                added = True
+            elif parameters[name] == value:
+                continue
+            parameters[name] = value
+            changed.add(name)
+
+        if added or len(parameters) != len(shadow_parameters):
+            # Parameters gone from the shadow (or only ever set locally).
+            for name in parameters.keys() - shadow_parameters.keys():
+                del parameters[name]
+                stamps.pop(name, None)
+                changed.add(name)
+        return changed
+
+    def expect(self, parameters):
+        """Show parameter values written to the appliance until confirmed.
+
+        The values replace the device data right away. Each incoming context
+        then reconciles them: a matching value confirms the write, a newer
+        ``lastUpdate`` on the appliance supersedes it, and after
+        ``OPTIMISTIC_TIMEOUT`` seconds the cloud value wins. Until then a
+        stale context does not revert the value.
+        """
+        now = time.time()
+        values = self.attributes.setdefault("parameters", {})
+        for key, value in parameters.items():
+            pending = self._pending.get(key)
+            if pending:
+                previous = pending.previous
+            else:
+                previous = self._prepared.get(key, values.get(key))
+            self._prepared.pop(key, None)
+            self._pending[key] = PendingWrite(value, previous, now)
+            values[key] = value
+        self.invalidate_data(tuple(parameters))
+        self._coordinator.async_update_listeners()
+
+    def discard_expected(self, keys):
+        """Drop the pending writes of ``keys`` (the send failed) and revert."""
+        values = self.attributes.setdefault("parameters", {})
+        reverted = []
+        for key in keys:
+            pending = self._pending.pop(key, None)
+            if pending is None:
+                continue
+            self._optimistic_stats["failed"] += 1
+            values[key] = pending.previous
+            self._shadow_stamps.pop(key, None)
+            reverted.append(key)
+        if reverted:
+            self.invalidate_data(tuple(reverted))
+            self._coordinator.async_update_listeners()
 
-        for name, values in parameters.items():
-            self._attributes.setdefault("parameters", {})[name] = values.get(
-                "parNewVal"
-            )
+    @property
+    def pending(self):
+        """Return the written values still awaiting confirmation."""
+        return {key: pending.value for key, pending in self._pending.items()}
+
+    @property
+    def optimistic_stats(self):
+        """Return how the pending writes were reconciled so far."""
+        return dict(self._optimistic_stats)
+
+    def _reconcile_pending(self, shadow):
+        """Settle the pending writes against a freshly parsed context.
+
+        Returns the keys whose optimistic value was re-applied over the
+        context.
+        """
+        values = self._attributes.setdefault("parameters", {})
+        shadow_parameters = (shadow or {}).get("parameters") or {}
+        now = time.time()
+        reapplied = set()
+        for key, pending in list(self._pending.items()):
+            if _same_value(values.get(key), pending.value):
+                outcome = "confirmed"
+            elif _updated_after(shadow_parameters.get(key), pending.sent_at):
+                outcome = "superseded"
+            elif now - pending.sent_at > OPTIMISTIC_TIMEOUT:
+                outcome = "timed_out"
+            else:
+                values[key] = pending.value
+                reapplied.add(key)
+                continue
+            del self._pending[key]
+            self._optimistic_stats[outcome] += 1
+        return reapplied
+
+    async def _async_send_expecting(self, send, expected):
+        """Await a send while ``expected`` is shown, reverting on failure."""
+        self.expect(expected)
+        try:
+            result = await send
+        except Exception:
+            self.discard_expected(expected)
+            raise
+        if result is False:
+            self.discard_expected(expected)
+        return result
+
+    async def async_send(self, command, expected):
+        """Send a prepared command, showing the ``expected`` values meanwhile."""
+        return await self._async_send_expecting(command.send(), expected)
+
+    async def async_set(self, parameters):
+        """Send parameters through the coordinator, shown optimistically."""
+        return await self._async_send_expecting(
+            self._coordinator.async_set(parameters), parameters
+        )
 
     @property
     def data(self):
-        """Return the combined device data."""
-        return {
-            "attributes": self.attributes,
-            "appliance": self.appliance,
-            "statistics": self.statistics,
-            **self.parameters,
-        }
+        """Return the combined device data as a read-only view.
+
+        The view is rebuilt at most once per ``data_version`` (i.e. after a
+        load or a local write), so the lookups entities run between two
+        refreshes are plain dict hits instead of a full rebuild each.
+        """
+        if self._data_view_version != self._data_version:
+            self._data_view = MappingProxyType(
+                {
+                    "attributes": self.attributes,
+                    "appliance": self.appliance,
+                    "statistics": self.statistics,
+                    **self.parameters,
+                }
+            )
+            self._data_view_version = self._data_version
+        return self._data_view
 
     @property
     def appliance_type(self):
@@ -228,12 +529,20 @@ class HonDevice(CoordinatorEntity):
 
     @property
     def settings(self):
-        """Return all command settings."""
-        result = {}
-        for name, command in self._commands.items():
-            for key, setting in command.settings.items():
-                result[f"{name}.{key}"] = setting
-        return result
+        """Return all command settings under dotted keys, as a read-only view.
+
+        Built once and kept until the next full ``invalidate_data`` (catalogue
+        load, program switch); context refreshes do not rebuild it.
+        """
+        if self._settings_view is None:
+            self._settings_view = MappingProxyType(
+                {
+                    f"{name}.{key}": setting
+                    for name, command in self._commands.items()
+                    for key, setting in command.settings.items()
+                }
+            )
+        return self._settings_view
 
     @property
     def parameters(self):
@@ -274,6 +583,24 @@ class HonDevice(CoordinatorEntity):
                     except Exception:
                         pass
 
+        self.invalidate_data()
+
+    def _store_command_values(self, command):
+        """Copy a prepared command's values into the device data.
+
+        The stamps of the written keys are dropped so the next context
+        restores the cloud values, should the command not be sent or fail;
+        the overwritten values are kept for ``expect`` to revert to.
+        """
+        values = self.attributes.setdefault("parameters", {})
+        prepared = self._prepared
+        for key, parameter in command.parameters.items():
+            if key not in prepared:
+                prepared[key] = values.get(key)
+            values[key] = parameter.value
+            self._shadow_stamps.pop(key, None)
+        self.invalidate_data()
+
     def settings_command(self, parameters={}):
         """Prepare the settings command with the given parameters."""
         if "settings" not in self._commands:
@@ -283,13 +610,27 @@ class HonDevice(CoordinatorEntity):
         self.update_command(command, parameters)
 
         # Update for next command (in case no refresh happens yet)
-        for key in command.parameters.keys():
-            self.attributes.setdefault("parameters", {})[key] = command.parameters.get(
-                key
-            ).value
+        self._store_command_values(command)
 
         return command
 
+    async def send_settings(self, parameters):
+        """Apply settings changes locally and queue them for sending.
+
+        The new values are visible right away and kept until confirmed (see
+        :meth:`expect`); the cloud command is merged with the other changes
+        of the debounce window (see
+        :meth:`HonBaseCoordinator.async_send_settings`).
+        """
+        command = self.settings_command(parameters)
+        expected = {
+            key: command.parameters[key].value if key in command.parameters else value
+            for key, value in parameters.items()
+        }
+        return await self._async_send_expecting(
+            self._coordinator.async_send_settings(parameters), expected
+        )
+
     def start_command(self, program=None, parameters={}):
         """Prepare the start program command with the given parameters."""
         if "startProgram" not in self._commands:
@@ -305,10 +646,7 @@ class HonDevice(CoordinatorEntity):
         self.update_command(command, parameters)
 
         # Update for next command (in case no refresh happens yet)
-        for key in command.parameters.keys():
-            self.attributes.setdefault("parameters", {})[key] = command.parameters.get(
-                key
-            ).value
+        self._store_command_values(command)
 
         return command
 
@@ -337,9 +675,11 @@ class HonDevice(CoordinatorEntity):
             return command
         raise ValueError("No command to stop the device")
 
-    async def load_commands(self, payload=None):
+    async def load_commands(self, payload=None, table=None):
         """Load the command catalogue (from the cloud or a cached payload).
 
+        ``table`` is the ``compile_catalogue`` table of a cached payload: the
+        commands are then rebuilt from it instead of parsing the payload.
         Returns the raw payload so callers can persist it for later boots.
         The parsing never mutates the payload for the same reason.
         """
@@ -365,41 +705,73 @@ class HonDevice(CoordinatorEntity):
             )
             return payload
 
-        commands = {
-            key: value
-            for key, value in payload.items()
-            if key not in ("applianceModel", "options", "dictionaryId")
-        }
-
-        for command, attr in commands.items():
-            if "parameters" in attr:
-                self._commands[command] = HonCommand(command, attr, self._hon, self)
-            if "setParameters" in attr and "parameters" in attr[list(attr)[0]]:
-                self._commands[command] = HonCommand(
-                    command, attr.get("setParameters"), self._hon, self
-                )
-            elif "parameters" in attr[list(attr)[0]]:
-                multi = {}
-                for program, attr2 in attr.items():
-                    program = program.split(".")[-1].lower()
-                    cmd = HonCommand(
-                        command, attr2, self._hon, self, multi=multi, program=program
+        if table is not None and table.get("version") == CATALOGUE_TABLE_VERSION:
+            self._load_command_table(table["commands"])
+        else:
+            for command, (attributes, programs) in split_catalogue(payload).items():
+                if programs is None:
+                    self._commands[command] = HonCommand(
+                        command, attributes, self._hon, self
                     )
-                    multi[program] = cmd
-                    self._commands[command] = cmd
+                    continue
+                # Only the default (last) program is built now; the others
+                # are built when selected.
+                catalogue = HonProgramCatalogue(command, programs, self._hon, self)
+                self._commands[command] = catalogue[list(programs)[-1]]
 
+        self.invalidate_data()
         return payload
 
-    async def load_statistics(self, payload=None):
+    def _load_command_table(self, commands):
+        """Rebuild the commands from a ``compile_catalogue`` table."""
+        for command, entry in commands.items():
+            if "command" in entry:
+                self._commands[command] = HonCommand.from_spec(
+                    command, entry["command"], self._hon, self
+                )
+                continue
+            programs = entry["programs"]
+            catalogue = HonProgramCatalogue(
+                command, programs, self._hon, self, compiled=True
+            )
+            self._commands[command] = catalogue[list(programs)[-1]]
+
+    async def load_statistics(self, payload=None, state=None):
         """Load the lifetime statistics (from the cloud or a cached payload).
 
-        Returns the raw payload so callers can persist it for later boots.
+        A cached payload comes with the ``statistics_state`` it was saved
+        with. Cloud fetches are conditional once the server supplied
+        validators: an unchanged answer (304) keeps the current statistics
+        and leaves the device data untouched. Returns the statistics so
+        callers can persist them for later boots.
         """
         if payload is None:
-            payload = await self._hon.load_statistics(self)
+            payload = await self._hon.load_statistics(self, self._statistics_validators)
+            self._statistics_time = time.time()
+            if payload is None:
+                return self._statistics
+        elif state is not None:
+            self._statistics_time = state.get("time")
+            self._statistics_validators = dict(state.get("validators") or {})
         self._statistics = payload
+        self.invalidate_data(("statistics",))
         return payload
 
+    @property
+    def statistics_state(self):
+        """Return the fetch time and validators of the current statistics."""
+        return {
+            "time": self._statistics_time,
+            "validators": dict(self._statistics_validators),
+        }
+
+    @property
+    def statistics_age(self):
+        """Return the seconds since the statistics were fetched, if ever."""
+        if self._statistics_time is None:
+            return None
+        return time.time() - self._statistics_time
+
     @property
     def device_info(self):
         """Return the device registry info."""
@@ -67,9 +67,7 @@ class HonSelect(HonBaseEntity, SelectEntity):
         """Select an option."""
         command_name, parameter_name = self.entity_description.key.split(".", 1)
         if command_name == "settings":
-            command = self._device.settings_command({parameter_name: option})
-            await command.send()
-            await self.coordinator.async_request_refresh()
+            await self._device.send_settings({parameter_name: option})
             return
 
         if parameter_name == "program":
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.const import (
@@ -21,13 +25,27 @@ from homeassistant.const import (
     UnitOfTime,
     UnitOfVolume,
 )
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity import EntityCategory
 
-from ..const import APPLIANCE_TYPE
-from ..helpers import snake_case
+from ..const import APPLIANCE_TYPE, DOMAIN
+from ..helpers import compile_key_path, snake_case
 from .base import HonBaseSensorEntity
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 _LOGGER = logging.getLogger(__name__)
 
+# Keys read by sensors besides their own, compiled once for every entity.
+_MACH_MODE = compile_key_path("machMode")
+_ON_OFF_STATUS = compile_key_path("onOffStatus")
+_DELAY_TIME = compile_key_path("delayTime")
+_REMAINING_TIME = compile_key_path("remainingTimeMM")
+_TOTAL_WASH_CYCLE = compile_key_path("totalWashCycle")
+_TOTAL_WATER_USED = compile_key_path("totalWaterUsed")
+_LAST_CONN_CATEGORY = compile_key_path("attributes.lastConnEvent.category")
+
 divider = 1.0
 
 
@@ -63,13 +81,19 @@ class HonBaseMode(HonBaseSensorEntity):
             self._attr_icon = "mdi:water-boiler"
 
     def coordinator_update(self):
-        mode = self._device.get("machMode")
+        mode = self._device.get(self._key_path)
         self._attr_native_value = f"{mode}"
 
 
 class HonBaseProgramName(HonBaseSensorEntity):
     """Sensor showing the current program name."""
 
+    _depends_on = (
+        "attributes.activity",
+        "attributes.programName",
+        "attributes.commandHistory",
+    )
+
     def __init__(self, hass, coordinator, entry, appliance) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, appliance, "program_name", "Program name")
@@ -130,6 +154,8 @@ class HonBaseInt(HonBaseSensorEntity):
 class HonBaseRemainingTime(HonBaseSensorEntity):
     """Sensor showing the remaining time."""
 
+    _depends_on = ("remainingTimeMM", "delayTime", "machMode")
+
     def __init__(self, hass, coordinator, entry, appliance) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, appliance, "remainingTimeMM", "Remaining time")
@@ -141,13 +167,13 @@ class HonBaseRemainingTime(HonBaseSensorEntity):
 
     def coordinator_update(self):
         delay = 0
-        remainingTime = self._device.getInt("remainingTimeMM")
-        if self._device.has("delayTime"):
-            delay = self._device.getInt("delayTime")
+        remainingTime = self._device.getInt(self._key_path)
+        if self._device.has(_DELAY_TIME):
+            delay = self._device.getInt(_DELAY_TIME)
 
         mach_mode = 0
-        if self._device.has("machMode"):
-            mach_mode = self._device.getInt("machMode")
+        if self._device.has(_MACH_MODE):
+            mach_mode = self._device.getInt(_MACH_MODE)
 
         # Logic from WASHING_MACHINE implementation
         if self._type_id == APPLIANCE_TYPE.WASHING_MACHINE:
@@ -204,7 +230,7 @@ class HonBaseIndoorVOC(HonBaseSensorEntity):
         self.translation_key = "voc"  # APPLIANCE_TYPE.PURIFIER
 
     def coordinator_update(self):
-        voc = self._device.get("vocValueIndoor")
+        voc = self._device.get(self._key_path)
         self._attr_native_value = f"{voc}"
 
 
@@ -246,7 +272,7 @@ class HonBasePreFilter(HonBaseSensorEntity):
 
     def coordinator_update(self):
         lifeperc = 100
-        lifepercvaluee = self._device.getFloat("preFilterStatus")
+        lifepercvaluee = self._device.getFloat(self._key_path)
         lifepercfinale = lifeperc - float(lifepercvaluee)
         self._attr_native_value = float(lifepercfinale)
 
@@ -264,7 +290,7 @@ class HonBaseMainFilter(HonBaseSensorEntity):
 
     def coordinator_update(self):
         lifeperc = 100
-        lifepercvaluee = self._device.getFloat("mainFilterStatus")
+        lifepercvaluee = self._device.getFloat(self._key_path)
         lifepercfinale = lifeperc - float(lifepercvaluee)
         self._attr_native_value = float(lifepercfinale)
 
@@ -277,7 +303,7 @@ class HonBaseProgram(HonBaseSensorEntity):
         super().__init__(coordinator, appliance, "prCode", "Program code")
 
     def coordinator_update(self):
-        program = self._device.get("prCode")
+        program = self._device.get(self._key_path)
         self._attr_native_value = f"{program}"
 
 
@@ -297,7 +323,7 @@ class HonBaseProgramPhase(HonBaseSensorEntity):
             self._attr_icon = "mdi:washing-machine"
 
     def coordinator_update(self):
-        programPhase = self._device.get("prPhase")
+        programPhase = self._device.get(self._key_path)
         self._attr_native_value = programPhase
 
 
@@ -324,13 +350,15 @@ class HonBaseDryLevel(HonBaseSensorEntity):
         self.translation_key = "dry_level"
 
     def coordinator_update(self):
-        drylevel = self._device.get("dryLevel")
+        drylevel = self._device.get(self._key_path)
         self._attr_native_value = f"{drylevel}"
 
 
 class HonBaseStart(HonBaseSensorEntity):
     """Sensor showing the planned start time."""
 
+    _depends_on = ("onOffStatus", "attributes.lastConnEvent", "delayTime")
+
     def __init__(self, hass, coordinator, entry, appliance) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, appliance, "", "Start time")
@@ -345,16 +373,14 @@ class HonBaseStart(HonBaseSensorEntity):
             self._on = False
 
         previous = self._on
-        if self._device.has("onOffStatus"):
-            self._on = self._device.get("onOffStatus") == "1"
+        if self._device.has(_ON_OFF_STATUS):
+            self._on = self._device.get(_ON_OFF_STATUS) == "1"
         else:
-            self._on = (
-                self._device.get("attributes.lastConnEvent.category") == "CONNECTED"
-            )
+            self._on = self._device.get(_LAST_CONN_CATEGORY) == "CONNECTED"
 
         delay = 0
-        if self._device.has("delayTime"):
-            delay = self._device.getInt("delayTime")
+        if self._device.has(_DELAY_TIME):
+            delay = self._device.getInt(_DELAY_TIME)
 
         if delay == 0:
             if self._on is True and previous is False:
@@ -371,6 +397,13 @@ class HonBaseStart(HonBaseSensorEntity):
 class HonBaseEnd(HonBaseSensorEntity):
     """Sensor showing the planned end time."""
 
+    _depends_on = (
+        "onOffStatus",
+        "attributes.lastConnEvent",
+        "delayTime",
+        "remainingTimeMM",
+    )
+
     def __init__(self, hass, coordinator, entry, appliance) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, appliance, "", "End time")
@@ -384,17 +417,15 @@ class HonBaseEnd(HonBaseSensorEntity):
         if not hasattr(self, "_on"):
             self._on = False
 
-        if self._device.has("onOffStatus"):
-            self._on = self._device.get("onOffStatus") == "1"
+        if self._device.has(_ON_OFF_STATUS):
+            self._on = self._device.get(_ON_OFF_STATUS) == "1"
         else:
-            self._on = (
-                self._device.get("attributes.lastConnEvent.category") == "CONNECTED"
-            )
+            self._on = self._device.get(_LAST_CONN_CATEGORY) == "CONNECTED"
 
         delay = 0
-        if self._device.has("delayTime"):
-            delay = self._device.getInt("delayTime")
-        remaining = self._device.getInt("remainingTimeMM")
+        if self._device.has(_DELAY_TIME):
+            delay = self._device.getInt(_DELAY_TIME)
+        remaining = self._device.getInt(_REMAINING_TIME)
 
         if remaining == 0:
             self._attr_native_value = None
@@ -412,6 +443,8 @@ class HonBaseEnd(HonBaseSensorEntity):
 class HonBaseMeanWaterConsumption(HonBaseSensorEntity):
     """Sensor showing the mean water consumption."""
 
+    _depends_on = ("totalWashCycle", "totalWaterUsed")
+
     def __init__(self, hass, coordinator, entry, appliance) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, appliance, "", "Mean water consumption")
@@ -424,12 +457,12 @@ class HonBaseMeanWaterConsumption(HonBaseSensorEntity):
         # TODO: keys totalWashCycle, totalWaterUsed must be in the list
 
     def coordinator_update(self):
-        if self._device.getInt("totalWashCycle") - 1 <= 0:
+        if self._device.getInt(_TOTAL_WASH_CYCLE) - 1 <= 0:
             self._attr_native_value = None
         else:
             self._attr_native_value = round(
-                (self._device.getFloat("totalWaterUsed"))
-                / (self._device.getFloat("totalWashCycle") - 1),
+                (self._device.getFloat(_TOTAL_WATER_USED))
+                / (self._device.getFloat(_TOTAL_WASH_CYCLE) - 1),
                 2,
             )
 
@@ -449,7 +482,7 @@ class HonBaseTotalElectricityUsed(HonBaseSensorEntity):
         self._attr_icon = "mdi:connection"
 
     def coordinator_update(self):
-        self._attr_native_value = self._device.getFloat("totalElectricityUsed")
+        self._attr_native_value = self._device.getFloat(self._key_path)
 
 
 class HonBaseTotalWashCycle(HonBaseSensorEntity):
@@ -463,7 +496,7 @@ class HonBaseTotalWashCycle(HonBaseSensorEntity):
         self._attr_icon = "mdi:counter"
 
     def coordinator_update(self):
-        self._attr_native_value = self._device.getInt("totalWashCycle") - 1
+        self._attr_native_value = self._device.getInt(self._key_path) - 1
 
 
 class HonBaseTotalWaterUsed(HonBaseSensorEntity):
@@ -479,7 +512,7 @@ class HonBaseTotalWaterUsed(HonBaseSensorEntity):
         self._attr_icon = "mdi:water-pump"
 
     def coordinator_update(self):
-        self._attr_native_value = self._device.getFloat("totalWaterUsed") / divider
+        self._attr_native_value = self._device.getFloat(self._key_path) / divider
 
 
 class HonBaseWeight(HonBaseSensorEntity):
@@ -494,7 +527,7 @@ class HonBaseWeight(HonBaseSensorEntity):
         self._attr_icon = "mdi:weight-kilogram"
 
     def coordinator_update(self):
-        self._attr_native_value = self._device.getFloat("actualWeight")
+        self._attr_native_value = self._device.getFloat(self._key_path)
 
 
 class HonBaseCurrentWaterUsed(HonBaseSensorEntity):
@@ -512,7 +545,7 @@ class HonBaseCurrentWaterUsed(HonBaseSensorEntity):
         self._attr_icon = "mdi:water"
 
     def coordinator_update(self):
-        self._attr_native_value = self._device.getFloat("currentWaterUsed") / divider
+        self._attr_native_value = self._device.getFloat(self._key_path) / divider
 
 
 class HonBaseError(HonBaseSensorEntity):
@@ -529,7 +562,7 @@ class HonBaseError(HonBaseSensorEntity):
             self.translation_key = "washingmachine_error"
 
     def coordinator_update(self):
-        error = self._device.get("errors")
+        error = self._device.get(self._key_path)
         self._attr_native_value = f"{error}"
 
 
@@ -548,14 +581,14 @@ class HonBaseCurrentElectricityUsed(HonBaseSensorEntity):
         self._attr_icon = "mdi:lightning-bolt"
 
     def coordinator_update(self):
-        self._attr_native_value = (
-            self._device.getFloat("currentElectricityUsed") / divider
-        )
+        self._attr_native_value = self._device.getFloat(self._key_path) / divider
 
 
 class HonBaseSpinSpeed(HonBaseSensorEntity):
     """Sensor showing the spin speed."""
 
+    _depends_on = ("spinSpeed", "machMode")
+
     def __init__(self, hass, coordinator, entry, appliance) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, appliance, "spinSpeed", "Spin speed")
@@ -565,10 +598,10 @@ class HonBaseSpinSpeed(HonBaseSensorEntity):
         self._attr_icon = "mdi:speedometer"
 
     def coordinator_update(self):
-        self._attr_native_value = self._device.getInt("spinSpeed")
+        self._attr_native_value = self._device.getInt(self._key_path)
 
         if self._type_id == APPLIANCE_TYPE.WASHING_MACHINE:
-            if self._device.get("machMode") in ("1", "6"):
+            if self._device.get(_MACH_MODE) in ("1", "6"):
                 self._attr_native_value = 0
 
 
@@ -584,7 +617,7 @@ class HonBaseVolume(HonBaseSensorEntity):
         self._attr_native_unit_of_measurement = PERCENTAGE
 
     def coordinator_update(self):
-        self._attr_native_value = self._device.getInt("volume")
+        self._attr_native_value = self._device.getInt(self._key_path)
 
 
 class HonBaseDisplayedApp(HonBaseSensorEntity):
@@ -597,7 +630,7 @@ class HonBaseDisplayedApp(HonBaseSensorEntity):
         self._attr_icon = "mdi:application"
 
     def coordinator_update(self):
-        app = self._device.get("displayedApp")
+        app = self._device.get(self._key_path)
         self._attr_native_value = f"{app}"
 
 
@@ -615,7 +648,7 @@ class HonBaseProgramsCounter(HonBaseSensorEntity):
         self._attr_icon = "mdi:counter"
 
     def coordinator_update(self):
-        value = self._device.get("statistics.programsCounter")
+        value = self._device.get(self._key_path)
         if value is not None:
             self._attr_native_value = int(value)
 
@@ -633,7 +666,7 @@ class HonBaseCurrentWashCycle(HonBaseSensorEntity):
         self._attr_icon = "mdi:counter"
 
     def coordinator_update(self):
-        self._attr_native_value = self._device.getInt("currentWashCycle")
+        self._attr_native_value = self._device.getInt(self._key_path)
 
 
 class HonBaseDetergentPercent(HonBaseSensorEntity):
@@ -648,7 +681,7 @@ class HonBaseDetergentPercent(HonBaseSensorEntity):
         self._attr_icon = "mdi:bottle-tonic"
 
     def coordinator_update(self):
-        self._attr_native_value = self._device.getInt("detergentPercent")
+        self._attr_native_value = self._device.getInt(self._key_path)
 
 
 class HonBaseDetergentWeight(HonBaseSensorEntity):
@@ -664,7 +697,7 @@ class HonBaseDetergentWeight(HonBaseSensorEntity):
         self._attr_icon = "mdi:bottle-tonic"
 
     def coordinator_update(self):
-        self._attr_native_value = self._device.getFloat(self._key)
+        self._attr_native_value = self._device.getFloat(self._key_path)
 
 
 class HonBaseWaterHardness(HonBaseSensorEntity):
@@ -678,7 +711,7 @@ class HonBaseWaterHardness(HonBaseSensorEntity):
         self._attr_icon = "mdi:water-opacity"
 
     def coordinator_update(self):
-        self._attr_native_value = self._device.getInt("waterHard")
+        self._attr_native_value = self._device.getInt(self._key_path)
 
 
 class HonBaseDelayTime(HonBaseSensorEntity):
@@ -693,7 +726,7 @@ class HonBaseDelayTime(HonBaseSensorEntity):
         self._attr_icon = "mdi:timer-sand"
 
     def coordinator_update(self):
-        self._attr_native_value = self._device.getInt("delayTime")
+        self._attr_native_value = self._device.getInt(self._key_path)
 
 
 class HonBasePower(HonBaseSensorEntity):
@@ -709,7 +742,7 @@ class HonBasePower(HonBaseSensorEntity):
         self._attr_icon = "mdi:lightning-bolt"
 
     def coordinator_update(self):
-        self._attr_native_value = self._device.getInt("power")
+        self._attr_native_value = self._device.getInt(self._key_path)
 
 
 class HonBaseWorkTime(HonBaseSensorEntity):
@@ -725,4 +758,80 @@ class HonBaseWorkTime(HonBaseSensorEntity):
         self._attr_icon = "mdi:timer-cog"
 
     def coordinator_update(self):
-        self._attr_native_value = self._device.getInt("totalWorkTime")
+        self._attr_native_value = self._device.getInt(self._key_path)
+
+
+@dataclass(frozen=True, kw_only=True)
+class HonCloudSensorEntityDescription(SensorEntityDescription):
+    """Cloud request metric sensor description."""
+
+    value_fn: Callable[[dict[str, Any]], Any]
+
+
+CLOUD_SENSORS = (
+    HonCloudSensorEntityDescription(
+        key="cloud_requests",
+        translation_key="cloud_requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda totals: totals["requests"],
+    ),
+    HonCloudSensorEntityDescription(
+        key="cloud_failed_requests",
+        translation_key="cloud_failed_requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda totals: totals["failures"],
+    ),
+    HonCloudSensorEntityDescription(
+        key="cloud_retries",
+        translation_key="cloud_retries",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda totals: totals["retries"],
+    ),
+    HonCloudSensorEntityDescription(
+        key="cloud_reauths",
+        translation_key="cloud_reauths",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda totals: totals["reauths"],
+    ),
+    HonCloudSensorEntityDescription(
+        key="cloud_latency_p95",
+        translation_key="cloud_latency_p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda totals: totals["latency_p95"],
+    ),
+)
+
+
+class HonCloudSensor(SensorEntity):
+    """Request metrics of the account's hOn cloud connection.
+
+    Attached to a service device of the config entry, disabled by default
+    and polled, since the metrics move with every request rather than with
+    an appliance refresh.
+    """
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_should_poll = True
+
+    entity_description: HonCloudSensorEntityDescription
+
+    def __init__(self, hon, entry, entity_description) -> None:
+        """Initialize the sensor."""
+        self.entity_description = entity_description
+        self._hon = hon
+        self._attr_unique_id = f"{entry.unique_id}_{entity_description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry.unique_id}_cloud")},
+            name="hOn cloud",
+            manufacturer="Haier",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def native_value(self):
+        """Return the metric from the connection totals."""
+        return self.entity_description.value_fn(self._hon.request_totals)
@@ -73,7 +73,9 @@ class HonSwitchEntity(HonBaseSwitchEntity):
                 setting.value = (
                     setting.max if isinstance(setting, HonParameterRange) else 1
                 )
-            await self._device.commands["settings"].send()
+            await self._device.send_settings(
+                {self.entity_description.key: setting.value}
+            )
             value = str(setting.value)
         else:
             value = self._target_value(True)
@@ -97,7 +99,9 @@ class HonSwitchEntity(HonBaseSwitchEntity):
                 setting.value = (
                     setting.min if isinstance(setting, HonParameterRange) else 0
                 )
-            await self._device.commands["settings"].send()
+            await self._device.send_settings(
+                {self.entity_description.key: setting.value}
+            )
             value = str(setting.value)
         else:
             value = self._target_value(False)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.components.water_heater import (
@@ -17,7 +16,6 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import callback
-from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from ..const import DOMAIN
@@ -59,7 +57,6 @@ class HonWaterHeaterEntity(CoordinatorEntity, WaterHeaterEntity):
         self._fw_version = appliance["fwVersion"]
         self._unique_id = f"{coordinator.unique_id_prefix}_water_heater"
         self._device = coordinator.device
-        self._watcher = None
 
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         self._attr_operation_list = [STATE_OFF, *WH_MODES.keys()]
@@ -90,20 +87,6 @@ class HonWaterHeaterEntity(CoordinatorEntity, WaterHeaterEntity):
     def _is_on(self) -> bool:
         return self._device.get("onOffStatus") == "1"
 
-    def start_watcher(self, delay=timedelta(seconds=8)):
-        """Suppress coordinator overwrites briefly so optimistic state sticks."""
-        if self._watcher is not None:
-            self._watcher()
-        self._watcher = async_track_time_interval(
-            self._hass, self._clear_watcher, delay
-        )
-
-    async def _clear_watcher(self, now: datetime | None = None) -> None:
-        if self._watcher is not None:
-            self._watcher()
-        self._watcher = None
-        await self._coordinator.async_request_refresh()
-
     def _update_from_device(self, write=True):
         self._attr_current_temperature = float(self._device.get("temp") or 0)
         self._attr_target_temperature = float(self._device.get("tempSel") or 0)
@@ -121,9 +104,8 @@ class HonWaterHeaterEntity(CoordinatorEntity, WaterHeaterEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        # Watcher running: data may still reflect the pre-command state
-        if self._watcher is not None:
-            return
+        # Values just sent are kept by the device until a context confirms
+        # them (HonDevice.expect), so a stale refresh cannot revert them.
         if self._coordinator.data is False:
             return
         self._update_from_device()
@@ -134,48 +116,47 @@ class HonWaterHeaterEntity(CoordinatorEntity, WaterHeaterEntity):
         """Set the target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
-        await self._device.settings_command({"tempSel": int(temperature)}).send()
+        await self._device.send_settings({"tempSel": int(temperature)})
         self._attr_target_temperature = int(temperature)
-        self.start_watcher()
         self.async_write_ha_state()
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Set the operation mode."""
         if operation_mode == STATE_OFF:
-            await self._device.stop_command().send()
+            await self._device.async_send(
+                self._device.stop_command(), {"onOffStatus": "0"}
+            )
         else:
             machmode, program = WH_MODES[operation_mode]
             if self._is_on():
                 # Live mode change keeps the current target temperature
-                await self._device.settings_command({"machMode": machmode}).send()
+                await self._device.send_settings({"machMode": machmode})
             else:
                 # Powered off: (re)start with the matching program
-                await self._device.start_command(program).send()
+                await self._device.async_send(
+                    self._device.start_command(program),
+                    {"onOffStatus": "1", "machMode": machmode},
+                )
         self._attr_current_operation = operation_mode
-        self.start_watcher()
         self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the water heater on."""
         mode = MACHMODE_TO_MODE.get(str(self._device.get("machMode")), "Eco")
-        await self._device.start_command(WH_MODES[mode][1]).send()
+        machmode, program = WH_MODES[mode]
+        await self._device.async_send(
+            self._device.start_command(program),
+            {"onOffStatus": "1", "machMode": machmode},
+        )
         self._attr_current_operation = mode
-        self.start_watcher()
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the water heater off."""
-        await self._device.stop_command().send()
+        await self._device.async_send(self._device.stop_command(), {"onOffStatus": "0"})
         self._attr_current_operation = STATE_OFF
-        self.start_watcher()
         self.async_write_ha_state()
 
-    async def async_will_remove_from_hass(self):
-        """Clean up the watcher when the entity is removed."""
-        if self._watcher is not None:
-            self._watcher()
-            self._watcher = None
-
     # ----- attributes ----------------------------------------------------
 
     @property
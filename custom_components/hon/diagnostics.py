@@ -26,14 +26,30 @@ TO_REDACT = {
 }
 
 
+def _boot_report(hon: Any) -> dict[str, Any] | None:
+    """Return the boot report with its appliances keyed anonymously.
+
+    The profiler keys appliances by MAC address; the diagnostics list them
+    as ``appliance_<n>`` in the same order instead.
+    """
+    if hon.boot_profiler is None:
+        return None
+    report = hon.boot_profiler.report
+    report["appliances"] = {
+        f"appliance_{index}": appliance
+        for index, appliance in enumerate(report["appliances"].values(), 1)
+    }
+    return report
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry.
 
-    Exposes the raw entry data (redacted), the appliances (redacted) and a
-    snapshot of every device context — redacting tokens, credentials and
-    serial numbers.
+    Exposes the raw entry data (redacted), the appliances (redacted), a
+    snapshot of every device context and the boot report — redacting
+    tokens, credentials and serial numbers.
     """
     hon = entry.runtime_data
 
@@ -43,6 +59,14 @@ async def async_get_config_entry_diagnostics(
             continue
         coordinators[coordinator.device.mac_address] = {
             "last_update_success": coordinator.last_update_success,
+            "skipped_fan_outs": coordinator.skipped_fan_outs,
+            "poll_interval": (
+                coordinator.poll_interval.total_seconds()
+                if coordinator.poll_interval is not None
+                else None
+            ),
+            "commands": coordinator.command_stats,
+            "optimistic": coordinator.device.optimistic_stats,
             "data": coordinator.device.attributes,
         }
 
@@ -65,6 +89,10 @@ async def async_get_config_entry_diagnostics(
         "options": async_redact_data(entry.options, TO_REDACT),
         "appliances": async_redact_data(hon.appliances, TO_REDACT),
         "coordinators": async_redact_data(coordinators, TO_REDACT),
+        "rate_limit": hon.rate_limit_stats,
+        "coalesced_requests": hon.coalesced_requests,
+        "endpoints": hon.endpoint_stats,
+        "boot": _boot_report(hon),
         "entities": registry_entities,
         "devices": [
             async_redact_data(
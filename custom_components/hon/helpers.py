@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+# Distinct device keys are bounded by the entity set (a few hundred at most);
+# the bound only guards against callers compiling arbitrary user input.
+KEY_PATH_CACHE_SIZE = 1024
+
+type KeyPath = tuple[tuple[str, int | None], ...]
+
 
 def snake_case(value: str) -> str:
     """Convert a camelCase string to snake_case.
@@ -34,3 +43,54 @@ def get_key(
 def minutes_until(target: datetime, now: datetime) -> int:
     """Return the number of whole minutes until the target time."""
     return max(0, int((target - now).total_seconds() / 60))
+
+
+@lru_cache(maxsize=KEY_PATH_CACHE_SIZE)
+def compile_key_path(key: str) -> KeyPath:
+    """Compile a dotted device key into its lookup steps.
+
+    Each step pairs the raw segment with the list index it maps to (for
+    all-digit segments), so ``HonDevice`` resolves a compiled path without
+    re-splitting and re-checking the key on every read. Entities compile
+    their keys once and reuse the path on every update.
+
+    >>> compile_key_path("attributes.errors.1")
+    (('attributes', None), ('errors', None), ('1', 1))
+    """
+    return tuple(
+        (part, int(part) if part.isascii() and part.isdigit() else None)
+        for part in key.split(".")
+    )
+
+
+def change_key(key: str) -> str:
+    """Return the key under which ``HonDevice`` tracks changes of ``key``.
+
+    Shadow parameters are tracked one by one, context attributes per
+    top-level attribute and everything else (statistics, commands) as a
+    whole, e.g. ``attributes.lastConnEvent.category`` -> ``attributes.lastConnEvent``.
+    """
+    parts = key.split(".", 2)
+    if parts[0] == "attributes" and len(parts) > 1:
+        return f"attributes.{parts[1]}"
+    return parts[0]
+
+
+def context_fingerprint(payload: dict[str, Any] | None) -> bytes:
+    """Return a digest of the context values the device reads.
+
+    Covers the shadow parameter values and every other context attribute;
+    per-parameter metadata (update timestamps) is left out so a payload that
+    only re-stamps unchanged values hashes the same.
+    """
+    payload = payload or {}
+    shadow = payload.get("shadow") or {}
+    parameters = shadow.get("parameters") or {}
+    content = {
+        "parameters": {
+            name: values.get("parNewVal") for name, values in parameters.items()
+        },
+        "attributes": {k: v for k, v in payload.items() if k != "shadow"},
+    }
+    raw = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
@@ -10,12 +10,14 @@ from homeassistant.helpers.entity import EntityCategory
 
 from .devices.number import HonNumber, default_values
 from .parameter import HonParameterRange
+from .profiler import profile_platform_setup
 
 _LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 1
 
 
+@profile_platform_setup
 async def async_setup_entry(hass, entry, async_add_entities) -> None:
     """Set up the number platform."""
 
@@ -3,21 +3,78 @@
 from __future__ import annotations
 
 import logging
+import sys
+from functools import lru_cache
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _intern(value):
+    """Intern a catalogue string so every program shares one copy."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@lru_cache(maxsize=1024)
+def _shared_values(values):
+    """Return one shared tuple per distinct list of enum values.
+
+    A multi-program catalogue repeats the same ``enumValues`` for every
+    program; each equal tuple is only kept once.
+    """
+    return values
+
+
+@lru_cache(maxsize=1024)
+def _enum_index(values):
+    """Return the sorted string tuple and the membership set of enum values.
+
+    Cached like ``_shared_values`` so parameters with the same values share
+    the index as well.
+    """
+    allowed = tuple(sorted(str(value) for value in values))
+    return allowed, frozenset(allowed)
+
+
 class HonParameter:
-    """A command parameter with its API attributes."""
+    """A command parameter with its API attributes.
+
+    Catalogues hold one instance per parameter per program for the lifetime
+    of the entry, hence the ``__slots__`` layout and interned strings.
+    """
+
+    __slots__ = ("_key", "_category", "_typology", "_mandatory", "_value")
+
+    _kind = None
 
     def __init__(self, key, attributes):
         """Initialize the parameter from its attributes."""
-        self._key = key
-        self._category = attributes.get("category")
-        self._typology = attributes.get("typology")
+        self._key = _intern(key)
+        self._category = _intern(attributes.get("category"))
+        self._typology = _intern(attributes.get("typology"))
         self._mandatory = attributes.get("mandatory")
         self._value = ""
 
+    def spec(self):
+        """Return the parsed parameter as a flat, JSON-serializable list.
+
+        :func:`parameter_from_spec` rebuilds an equal parameter from it
+        without parsing the API attributes again.
+        """
+        return [
+            self._kind,
+            self._key,
+            self._category,
+            self._typology,
+            self._mandatory,
+            *self._spec_fields(),
+        ]
+
+    def _spec_fields(self):
+        return []
+
+    def _restore(self, fields):
+        """Set the subclass fields from ``_spec_fields`` output."""
+
     @property
     def key(self):
         """Return the parameter key."""
@@ -47,10 +104,21 @@ class HonParameter:
 class HonParameterFixed(HonParameter):
     """A parameter whose value is fixed by the appliance."""
 
+    __slots__ = ()
+
+    _kind = "fixed"
+
     def __init__(self, key, attributes):
         """Initialize the parameter with its fixed value."""
         super().__init__(key, attributes)
-        self._value = attributes.get("fixedValue", None)
+        self._value = _intern(attributes.get("fixedValue", None))
+
+    def _spec_fields(self):
+        return [self._value]
+
+    def _restore(self, fields):
+        (value,) = fields
+        self._value = _intern(value)
 
     def __repr__(self):
         return f"{self.__class__} (<{self.key}> fixed)"
@@ -71,6 +139,10 @@ class HonParameterFixed(HonParameter):
 class HonParameterRange(HonParameter):
     """A numeric parameter with a min/max range and step."""
 
+    __slots__ = ("_min", "_max", "_step", "_default")
+
+    _kind = "range"
+
     def __init__(self, key, attributes):
         """Initialize the parameter from its range attributes."""
         super().__init__(key, attributes)
@@ -88,6 +160,13 @@ class HonParameterRange(HonParameter):
             )
         self._value = self._default
 
+    def _spec_fields(self):
+        return [self._min, self._max, self._step, self._default]
+
+    def _restore(self, fields):
+        self._min, self._max, self._step, self._default = fields
+        self._value = self._default
+
     def __repr__(self):
         return f"{self.__class__} (<{self.key}> [{self._min} - {self._max}])"
 
@@ -136,17 +215,39 @@ class HonParameterRange(HonParameter):
 
 
 class HonParameterEnum(HonParameter):
-    """A parameter restricted to a set of enum values."""
+    """A parameter restricted to a set of enum values.
+
+    The allowed values are indexed once (sorted string tuple plus a
+    frozenset for membership), so reads and validations do not re-sort.
+    """
+
+    __slots__ = ("_default", "_values", "_sorted", "_allowed")
+
+    _kind = "enum"
 
     def __init__(self, key, attributes):
         """Initialize the parameter from its enum attributes."""
         super().__init__(key, attributes)
-        self._default = attributes.get("defaultValue")
+        self._restore([attributes.get("enumValues"), attributes.get("defaultValue")])
+
+    def _spec_fields(self):
+        return [None if self._values is None else list(self._values), self._default]
+
+    def _restore(self, fields):
+        values, default = fields
+        self._default = _intern(default)
         self._value = self._default or "0"
-        self._values = attributes.get("enumValues")
+        if values is not None:
+            values = _shared_values(tuple(_intern(value) for value in values))
+        self._values = values
+        self._index_values()
 
     def __repr__(self):
-        return f"{self.__class__} (<{self.key}> {self.values})"
+        return f"{self.__class__} (<{self.key}> {list(self.values)})"
+
+    def _index_values(self):
+        """(Re)build the sorted tuple and membership set of the values."""
+        self._sorted, self._allowed = _enum_index(tuple(self._values or ()))
 
     def dump(self):
         """Return a text description of the allowed values."""
@@ -159,8 +260,8 @@ class HonParameterEnum(HonParameter):
 
     @property
     def values(self):
-        """Return the allowed values as sorted strings."""
-        return sorted([str(value) for value in self._values])
+        """Return the allowed values as a sorted tuple of strings."""
+        return self._sorted
 
     @property
     def valuesBase(self):
@@ -170,21 +271,23 @@ class HonParameterEnum(HonParameter):
     @property
     def value(self):
         """Return the current parameter value."""
-        return self._value if self._value is not None else self.values[0]
+        return self._value if self._value is not None else self._sorted[0]
 
     @value.setter
     def value(self, value):
-        if value in self.values:
+        if value in self._allowed:
             self._value = value
         else:
             raise ValueError(
-                f"ParameterEnum [{self.key}] Invalid value: {value} Allowed values: {self.values}"
+                f"ParameterEnum [{self.key}] Invalid value: {value} Allowed values: {list(self._sorted)}"
             )
 
 
 class HonParameterProgram(HonParameterEnum):
     """An enum parameter bound to a program selection."""
 
+    __slots__ = ("_command",)
+
     def __init__(self, key, command):
         """Initialize the parameter from its parent command."""
         super().__init__(key, {})
@@ -192,6 +295,7 @@ class HonParameterProgram(HonParameterEnum):
         self._value = command._program
         self._values = command._multi
         self._typology = "enum"
+        self._index_values()
 
     def dump(self):
         """Return the current program as text."""
@@ -202,6 +306,21 @@ class HonParameterProgram(HonParameterEnum):
         """Return the default program."""
         return self._value
 
+    def _refresh_index(self):
+        """Re-index the programs if the shared programs dict changed size.
+
+        The dict is shared by every program of the command and still grows
+        while the catalogue loads.
+        """
+        if len(self._values) != len(self._sorted):
+            self._index_values()
+
+    @property
+    def values(self):
+        """Return the program names as a sorted tuple."""
+        self._refresh_index()
+        return self._sorted
+
     @property
     def value(self):
         """Return the currently selected program."""
@@ -209,7 +328,26 @@ class HonParameterProgram(HonParameterEnum):
 
     @value.setter
     def value(self, value):
-        if value in self.values:
+        self._refresh_index()
+        if value in self._allowed:
             self._command.set_program(value)
         else:
             raise ValueError(f"Allowed values {self._values}")
+
+
+_SPEC_KINDS = {
+    parameter_class._kind: parameter_class
+    for parameter_class in (HonParameterFixed, HonParameterRange, HonParameterEnum)
+}
+
+
+def parameter_from_spec(spec):
+    """Rebuild a parameter from its :meth:`HonParameter.spec` list."""
+    kind, key, category, typology, mandatory, *fields = spec
+    parameter = object.__new__(_SPEC_KINDS[kind])
+    parameter._key = _intern(key)
+    parameter._category = _intern(category)
+    parameter._typology = _intern(typology)
+    parameter._mandatory = mandatory
+    parameter._restore(fields)
+    return parameter
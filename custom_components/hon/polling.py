@@ -0,0 +1,109 @@
+"""Adaptive polling intervals derived from the appliance activity."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from .const import APPLIANCE_TYPE
+from .helpers import compile_key_path
+
+if TYPE_CHECKING:
+    from .devices.device import HonDevice
+
+STATE_RUNNING = "running"
+STATE_IDLE = "idle"
+STATE_OFF = "off"
+STATE_DISCONNECTED = "disconnected"
+
+_MACH_MODE = compile_key_path("machMode")
+_ON_OFF_STATUS = compile_key_path("onOffStatus")
+_REMAINING_TIME = compile_key_path("remainingTimeMM")
+_LAST_CONN_CATEGORY = compile_key_path("attributes.lastConnEvent.category")
+
+
+@dataclass(frozen=True)
+class HonPollingProfile:
+    """Refresh intervals (seconds) of an appliance type per activity state.
+
+    ``idle_modes`` lists the ``machMode`` values of a program-based appliance
+    that mean "no program in progress"; ``None`` marks appliances that run
+    continuously while switched on (climate, water heater...). An offline
+    appliance is polled every ``disconnected`` seconds, doubling on every
+    consecutive offline poll up to ``max_disconnected``.
+    """
+
+    running: int
+    idle: int
+    off: int
+    disconnected: int = 120
+    max_disconnected: int = 600
+    idle_modes: frozenset[str] | None = None
+
+    def interval(self, state: str, offline_polls: int = 0) -> timedelta:
+        """Return the refresh interval for an activity state."""
+        if state == STATE_DISCONNECTED:
+            backoff = self.disconnected * 2 ** max(0, offline_polls - 1)
+            return timedelta(seconds=min(backoff, self.max_disconnected))
+        return timedelta(seconds=getattr(self, state))
+
+
+# Washing machines, dryers, dishwashers and ovens run programs with a
+# countdown: fast while a program runs, slow once it ended.
+PROGRAM_PROFILE = HonPollingProfile(
+    running=30, idle=120, off=600, idle_modes=frozenset({"0", "1", "6"})
+)
+# Climate, heat pumps, water heaters and purifiers work continuously while on.
+CONTINUOUS_PROFILE = HonPollingProfile(running=60, idle=60, off=300)
+# Fridges, wine coolers and TVs rarely change state at all.
+STATIC_PROFILE = HonPollingProfile(running=300, idle=300, off=600)
+
+POLLING_PROFILES: dict[int, HonPollingProfile] = {
+    APPLIANCE_TYPE.WASHING_MACHINE: PROGRAM_PROFILE,
+    APPLIANCE_TYPE.WASH_DRYER: PROGRAM_PROFILE,
+    APPLIANCE_TYPE.TUMBLE_DRYER: PROGRAM_PROFILE,
+    APPLIANCE_TYPE.DISH_WASHER: PROGRAM_PROFILE,
+    APPLIANCE_TYPE.OVEN: PROGRAM_PROFILE,
+    APPLIANCE_TYPE.CLIMATE: CONTINUOUS_PROFILE,
+    APPLIANCE_TYPE.AIR_TO_WATER: CONTINUOUS_PROFILE,
+    APPLIANCE_TYPE.WATER_HEATER: CONTINUOUS_PROFILE,
+    APPLIANCE_TYPE.PURIFIER: CONTINUOUS_PROFILE,
+    APPLIANCE_TYPE.FRIDGE: STATIC_PROFILE,
+    APPLIANCE_TYPE.WINE_COOLER: STATIC_PROFILE,
+    APPLIANCE_TYPE.TV: STATIC_PROFILE,
+}
+
+# Shortest interval of any profile: the batch scheduler ticks at it so that
+# ``HonBaseCoordinator.poll_due`` can honour every adaptive interval.
+SHORTEST_POLL_INTERVAL = timedelta(
+    seconds=min(
+        min(profile.running, profile.idle, profile.off, profile.disconnected)
+        for profile in POLLING_PROFILES.values()
+    )
+)
+
+
+def polling_profile(appliance_type_id: int) -> HonPollingProfile:
+    """Return the polling profile of an appliance type."""
+    return POLLING_PROFILES.get(appliance_type_id, PROGRAM_PROFILE)
+
+
+def activity_state(device: HonDevice, profile: HonPollingProfile) -> str:
+    """Classify the device activity from its latest context."""
+    if device.get(_LAST_CONN_CATEGORY) == "DISCONNECTED":
+        return STATE_DISCONNECTED
+    if device.get(_ON_OFF_STATUS) == "0":
+        return STATE_OFF
+    if profile.idle_modes is None:
+        return STATE_RUNNING
+    try:
+        remaining = int(device.get(_REMAINING_TIME, 0) or 0)
+    except (TypeError, ValueError):
+        remaining = 0
+    mach_mode = device.get(_MACH_MODE)
+    if remaining > 0 or (
+        mach_mode is not None and str(mach_mode) not in profile.idle_modes
+    ):
+        return STATE_RUNNING
+    return STATE_IDLE
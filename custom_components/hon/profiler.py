@@ -0,0 +1,144 @@
+"""Boot-time profiling of the config entry setup."""
+
+from __future__ import annotations
+
+import functools
+import logging
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
+    from .coordinator import HonBaseCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+
+class HonBootProfiler:
+    """Record where the setup of a config entry spends its time.
+
+    ``async_setup_entry`` times its phases (setup cache load, session
+    restore or login, first refreshes, platform setups) with :meth:`phase`,
+    each appliance's first refresh with :meth:`first_refresh`, and every
+    platform decorated with :func:`profile_platform_setup` records its entity
+    construction. Phases of a warm boot overlap, so their sum may exceed the
+    total. :attr:`report` is the structured boot report (milliseconds)
+    exposed in the diagnostics.
+    """
+
+    def __init__(self) -> None:
+        """Start the boot clock."""
+        self._start = time.perf_counter()
+        self._total: float | None = None
+        self._phases: dict[str, float] = {}
+        self._appliances: dict[str, dict[str, Any]] = {}
+        self._platforms: dict[str, float] = {}
+        self.warm = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the ``name`` phase of the setup."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases[name] = time.perf_counter() - start
+
+    async def timed(self, name: str, awaitable: Awaitable[Any]) -> Any:
+        """Await ``awaitable`` as the ``name`` phase (for use in a gather)."""
+        with self.phase(name):
+            return await awaitable
+
+    async def first_refresh(
+        self, coordinator: HonBaseCoordinator, *, preloaded: bool = False
+    ) -> None:
+        """Run and time an appliance's first refresh, failed or not.
+
+        ``preloaded`` refreshes come from the setup cache and overlap the
+        session probe of a warm boot.
+        """
+        start = time.perf_counter()
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        finally:
+            self._appliances[coordinator.device.mac_address] = {
+                "first_refresh": time.perf_counter() - start,
+                "preloaded": preloaded,
+            }
+
+    def record_platform(self, platform: str, seconds: float) -> None:
+        """Record the entity construction time of a platform."""
+        self._platforms[platform] = seconds
+
+    def finish(self) -> None:
+        """Stop the boot clock and log a one-line summary."""
+        self._total = time.perf_counter() - self._start
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            return
+        # Appliances are summarized (MAC addresses are identifiers); the
+        # per-appliance detail is in the diagnostics.
+        phases = ", ".join(
+            f"{name} {_ms(seconds):.0f} ms" for name, seconds in self._phases.items()
+        )
+        refreshes = [entry["first_refresh"] for entry in self._appliances.values()]
+        slowest_platform = max(
+            self._platforms.items(), key=lambda item: item[1], default=None
+        )
+        _LOGGER.debug(
+            "%s boot took %.0f ms (%s); %d first refreshes, slowest %.0f ms; "
+            "slowest platform %s",
+            "Warm" if self.warm else "Cold",
+            _ms(self._total),
+            phases,
+            len(refreshes),
+            _ms(max(refreshes, default=0.0)),
+            (
+                f"{slowest_platform[0]} {_ms(slowest_platform[1]):.0f} ms"
+                if slowest_platform
+                else "none"
+            ),
+        )
+
+    @property
+    def report(self) -> dict[str, Any]:
+        """Return the boot report, in milliseconds."""
+        return {
+            "boot": "warm" if self.warm else "cold",
+            "total": _ms(self._total) if self._total is not None else None,
+            "phases": {name: _ms(seconds) for name, seconds in self._phases.items()},
+            "appliances": {
+                mac: {
+                    "first_refresh": _ms(entry["first_refresh"]),
+                    "preloaded": entry["preloaded"],
+                }
+                for mac, entry in self._appliances.items()
+            },
+            "platforms": {
+                platform: _ms(seconds) for platform, seconds in self._platforms.items()
+            },
+        }
+
+
+def profile_platform_setup(
+    setup: Callable[..., Awaitable[None]],
+) -> Callable[..., Awaitable[None]]:
+    """Record a platform's ``async_setup_entry`` time in the boot report."""
+    platform = setup.__module__.rsplit(".", 1)[-1]
+
+    @functools.wraps(setup)
+    async def wrapper(hass: Any, entry: Any, async_add_entities: Any) -> None:
+        start = time.perf_counter()
+        try:
+            await setup(hass, entry, async_add_entities)
+        finally:
+            profiler = entry.runtime_data.boot_profiler
+            if isinstance(profiler, HonBootProfiler):
+                profiler.record_platform(platform, time.perf_counter() - start)
+
+    return wrapper
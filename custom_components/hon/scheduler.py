@@ -0,0 +1,92 @@
+"""Account-wide batched context polling for the hOn integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+import aiohttp
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .api.exceptions import HonError
+from .const import POLL_CONCURRENCY
+
+if TYPE_CHECKING:
+    from datetime import datetime, timedelta
+
+    from homeassistant.core import HomeAssistant
+
+    from .api.client import HonConnection
+    from .coordinator import HonBaseCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HonPollScheduler:
+    """Refresh every appliance of an account from a single timer.
+
+    In batch mode the per-appliance coordinators have no timer of their own:
+    the scheduler wakes up once per interval, checks the session once and
+    refreshes all coordinators concurrently, at most ``max_concurrency`` at
+    a time. The requests then go out as one burst over a warm keep-alive
+    connection instead of N uncoordinated wake-ups. With adaptive polling
+    the ticks only refresh the coordinators whose own interval elapsed.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        hon: HonConnection,
+        interval: timedelta,
+        max_concurrency: int = POLL_CONCURRENCY,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._hon = hon
+        self._interval = interval
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._lock = asyncio.Lock()
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start polling; return the callback that stops it."""
+        return async_track_time_interval(
+            self._hass,
+            self._async_poll,
+            self._interval,
+            name="hon batched poll",
+            cancel_on_shutdown=True,
+        )
+
+    async def _async_poll(self, now: datetime | None = None) -> None:
+        """Refresh every coordinator once (skipped if a poll is running)."""
+        if self._lock.locked():
+            _LOGGER.debug("Previous batched poll still running, skipping")
+            return
+        async with self._lock:
+            await self.async_refresh_all()
+
+    async def async_refresh_all(self) -> None:
+        """Refresh the due coordinators concurrently through the semaphore."""
+        coordinators = [
+            coordinator
+            for coordinator in self._hon.coordinators.values()
+            if coordinator.poll_due()
+        ]
+        if not coordinators:
+            return
+        try:
+            await self._hon.async_ensure_session()
+        except (aiohttp.ClientError, TimeoutError, HonError) as err:
+            # Each coordinator retries and reports the failure on its own.
+            _LOGGER.debug("Session check before batched poll failed: %s", err)
+        await asyncio.gather(
+            *(self._async_refresh(coordinator) for coordinator in coordinators)
+        )
+
+    async def _async_refresh(self, coordinator: HonBaseCoordinator) -> None:
+        """Refresh one coordinator once a slot is free."""
+        async with self._semaphore:
+            await coordinator.async_refresh()
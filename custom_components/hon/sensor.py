@@ -6,6 +6,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from .devices.sensor import (
+    CLOUD_SENSORS,
     HonBaseAIRquality,
     HonBaseCOlevel,
     HonBaseCurrentElectricityUsed,
@@ -44,7 +45,9 @@ from .devices.sensor import (
     HonBaseWaterHardness,
     HonBaseWeight,
     HonBaseWorkTime,
+    HonCloudSensor,
 )
+from .profiler import profile_platform_setup
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -55,6 +58,7 @@ _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = 0
 
 
+@profile_platform_setup
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ) -> None:
@@ -514,4 +518,9 @@ async def async_setup_entry(
                 [HonBaseProgramsCounter(hass, coordinator, entry, appliance)]
             )
 
+    # Account-level request metrics (disabled by default).
+    appliances.extend(
+        HonCloudSensor(hon, entry, description) for description in CLOUD_SENSORS
+    )
+
     async_add_entities(appliances)
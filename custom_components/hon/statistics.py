@@ -0,0 +1,59 @@
+"""When to re-fetch the lifetime statistics of an appliance."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from .const import STATISTICS_TTL
+from .helpers import compile_key_path
+from .polling import polling_profile
+
+if TYPE_CHECKING:
+    from .devices.device import HonDevice
+
+# Seconds between two TTL-driven attempts, so an unreachable statistics
+# endpoint is not retried on every poll.
+STATISTICS_RETRY = 900
+
+_MACH_MODE = compile_key_path("machMode")
+
+
+class HonStatisticsTracker:
+    """Decide when an appliance's statistics are worth a cloud round-trip.
+
+    The counters only move when a program ends, so they are re-fetched when
+    ``machMode`` goes from a running mode to one of the idle modes of the
+    appliance's polling profile, or once :data:`STATISTICS_TTL` elapsed
+    since the last fetch. Appliances without idle modes (climate, water
+    heaters...) rely on the TTL alone.
+    """
+
+    def __init__(self, appliance_type_id: int | None) -> None:
+        """Initialize the tracker for an appliance type."""
+        self._idle_modes = polling_profile(appliance_type_id).idle_modes
+        self._mach_mode: str | None = None
+        self._last_attempt: float | None = None
+
+    def due(self, device: HonDevice) -> bool:
+        """Return whether the statistics are missing or older than the TTL."""
+        if (
+            self._last_attempt is not None
+            and time.monotonic() - self._last_attempt < STATISTICS_RETRY
+        ):
+            return False
+        age = device.statistics_age
+        return age is None or age >= STATISTICS_TTL
+
+    def attempted(self) -> None:
+        """Record that a refresh was started."""
+        self._last_attempt = time.monotonic()
+
+    def program_ended(self, device: HonDevice) -> bool:
+        """Record the latest ``machMode``; return whether a program just ended."""
+        mach_mode = device.get(_MACH_MODE)
+        mach_mode = None if mach_mode is None else str(mach_mode)
+        previous, self._mach_mode = self._mach_mode, mach_mode
+        if self._idle_modes is None or previous is None or mach_mode is None:
+            return False
+        return previous not in self._idle_modes and mach_mode in self._idle_modes
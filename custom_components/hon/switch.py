@@ -6,6 +6,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from .devices.switch import HonSwitchEntity, HonSwitchEntityDescription
+from .profiler import profile_platform_setup
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -16,6 +17,7 @@ _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = 1
 
 
+@profile_platform_setup
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ) -> None:
@@ -26,6 +26,7 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
 
     hon = entries[0].runtime_data
     coordinators = list(hon._coordinator_dict.values())
+    totals = hon.request_totals
 
     return {
         "can_reach_server": await system_health.async_check_can_reach_url(
@@ -34,4 +35,14 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         "appliances": len(hon.appliances),
         "all_updates_ok": bool(coordinators)
         and all(c.last_update_success for c in coordinators),
+        "open_circuits": ", ".join(hon.open_circuits) or "none",
+        "requests": totals["requests"],
+        "failed_requests": totals["failures"],
+        "retries": totals["retries"],
+        "reauths": totals["reauths"],
+        "latency_p95": (
+            f"{totals['latency_p95']:.0f} ms"
+            if totals["latency_p95"] is not None
+            else "n/a"
+        ),
     }
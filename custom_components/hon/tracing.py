@@ -0,0 +1,133 @@
+"""Opt-in tracing of the refresh hot path."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import defaultdict, deque
+from contextlib import nullcontext
+from typing import Any
+
+# Most recent spans kept for the dump, besides the per-target aggregates.
+TRACE_BUFFER = 10000
+
+_DISABLED = nullcontext()
+
+
+class _Aggregate:
+    """Count, total and maximum duration of the spans of one target."""
+
+    __slots__ = ("count", "max", "total")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.count, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class _Span:
+    __slots__ = ("_name", "_start", "_started", "_target", "_tracer")
+
+    def __init__(self, tracer: HonTracer, name: str, target: str) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._target = target
+
+    def __enter__(self) -> None:
+        self._started = time.time()
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._tracer.record(
+            self._name,
+            self._target,
+            self._started,
+            time.perf_counter() - self._start,
+        )
+
+
+class HonTracer:
+    """Record the duration of the refresh stages while enabled.
+
+    Spans are named after the stage (``update_data``, ``load_context``,
+    ``entity_update``, ``coordinator_update``, ``write_state``) and
+    attributed to a target: the appliance type for the coordinator stages,
+    the entity class for the fan-out. Durations are aggregated per stage and
+    target; the last :data:`TRACE_BUFFER` spans are also kept for
+    :meth:`snapshot`. While disabled, :meth:`span` returns a shared no-op
+    context manager, so the hooks cost next to nothing.
+    """
+
+    def __init__(self, *, enabled: bool = False) -> None:
+        """Initialize an empty tracer."""
+        self.enabled = enabled
+        self._aggregates: defaultdict[str, defaultdict[str, _Aggregate]] = defaultdict(
+            lambda: defaultdict(_Aggregate)
+        )
+        self._spans: deque[tuple[str, str, float, float]] = deque(maxlen=TRACE_BUFFER)
+
+    def span(self, name: str, target: str) -> Any:
+        """Return a context manager timing one ``name`` span of ``target``."""
+        if not self.enabled:
+            return _DISABLED
+        return _Span(self, name, target)
+
+    def record(self, name: str, target: str, started: float, duration: float) -> None:
+        """Record a span that started at ``started`` (epoch seconds)."""
+        self._aggregates[name][target].add(duration)
+        self._spans.append((name, target, started, duration))
+
+    def reset(self) -> None:
+        """Drop every recorded span."""
+        self._aggregates.clear()
+        self._spans.clear()
+
+    def stats(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Return the aggregates as ``{stage: {target: stats}}``."""
+        return {
+            name: {target: aggregate.stats() for target, aggregate in targets.items()}
+            for name, targets in self._aggregates.items()
+        }
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the aggregates and the recent spans, JSON-serializable."""
+        return {
+            "enabled": self.enabled,
+            "aggregates": self.stats(),
+            "spans": [
+                {
+                    "name": name,
+                    "target": target,
+                    "start": started,
+                    "duration_ms": round(duration * 1000, 3),
+                }
+                for name, target, started, duration in self._spans
+            ],
+        }
+
+
+def write_trace(path: str, payload: dict[str, Any]) -> None:
+    """Write a trace dump to ``path`` as JSON.
+
+    Does blocking I/O and must run in the executor.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(payload, file, indent=2)
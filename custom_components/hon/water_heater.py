@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 
 from .const import APPLIANCE_TYPE
 from .devices.water_heater import HonWaterHeaterEntity
+from .profiler import profile_platform_setup
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -17,6 +18,7 @@ _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = 1
 
 
+@profile_platform_setup
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities
 ) -> None:
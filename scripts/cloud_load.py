@@ -0,0 +1,128 @@
+"""Measure boot time and poll throughput against the offline hOn cloud.
+
+Starts :class:`tests.simulator.HonCloudSimulator` with N synthetic
+appliances, then drives the real :class:`HonConnection` request path:
+a login, a cold boot (catalogue, statistics and context of every appliance,
+concurrently) and a number of poll rounds (one context per appliance,
+bounded like the batch poller). Reports wall-clock times, the requests the
+simulator served and the client-side failures.
+
+The client rate limiter is on by default, as in production; pass
+``--no-rate-limit`` to measure the request path alone.
+
+Usage: ``python scripts/cloud_load.py [--appliances 100] [--latency 0.05]
+[--jitter 0.02] [--error-rate 0.01] [--polls 5] [--no-rate-limit]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.hon.api.client import HonConnection  # noqa: E402
+from custom_components.hon.api.exceptions import HonError  # noqa: E402
+from custom_components.hon.const import POLL_CONCURRENCY  # noqa: E402
+from custom_components.hon.devices.device import HonDevice  # noqa: E402
+from tests.conftest import EMAIL, PASSWORD  # noqa: E402
+from tests.simulator import HonCloudSimulator  # noqa: E402
+
+
+async def _bounded(coroutines, limit):
+    """Run ``coroutines`` with at most ``limit`` in flight; count failures."""
+    semaphore = asyncio.Semaphore(limit)
+    failures = 0
+
+    async def run(coroutine):
+        nonlocal failures
+        async with semaphore:
+            try:
+                await coroutine
+            except HonError:
+                failures += 1
+
+    await asyncio.gather(*(run(coroutine) for coroutine in coroutines))
+    return failures
+
+
+async def run(args):
+    """Run the scenario and print the report."""
+    async with HonCloudSimulator(
+        appliances=args.appliances,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        programs=args.programs,
+    ) as cloud:
+        limits = {}
+        if args.no_rate_limit:
+            limits = {"read_limit": (1e9, 10**9), "write_limit": (1e9, 10**9)}
+        connection = HonConnection(None, None, EMAIL, PASSWORD, **limits)
+        connection._session = cloud.session()
+
+        start = time.perf_counter()
+        await connection.async_authorize()
+        login = time.perf_counter() - start
+        devices = [
+            HonDevice(connection, MagicMock(), appliance)
+            for appliance in connection.appliances
+        ]
+
+        start = time.perf_counter()
+        boot_failures = await _bounded(
+            (
+                asyncio.gather(
+                    device.load_commands(),
+                    device.load_statistics(),
+                    device.load_context(),
+                )
+                for device in devices
+            ),
+            len(devices),
+        )
+        boot = time.perf_counter() - start
+
+        poll_times = []
+        poll_failures = 0
+        for _ in range(args.polls):
+            start = time.perf_counter()
+            poll_failures += await _bounded(
+                (device.load_context() for device in devices), POLL_CONCURRENCY
+            )
+            poll_times.append(time.perf_counter() - start)
+
+        served = sum(cloud.requests.values())
+        print(f"appliances: {len(devices)}")
+        print(f"login: {login * 1000:.0f} ms")
+        print(f"cold boot: {boot * 1000:.0f} ms ({boot_failures} appliances failed)")
+        if poll_times:
+            average = sum(poll_times) / len(poll_times)
+            print(
+                f"poll round: {average * 1000:.0f} ms average, "
+                f"{len(devices) / average:.1f} contexts/s "
+                f"({poll_failures} failed polls)"
+            )
+        statuses = dict(sorted(cloud.statuses.items()))
+        print(f"requests served: {served}, statuses: {statuses}")
+        print(f"coalesced reads: {connection.coalesced_requests}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--appliances", type=int, default=100)
+    parser.add_argument("--programs", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--polls", type=int, default=3)
+    parser.add_argument("--no-rate-limit", action="store_true")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Measure the memory held by one appliance's parsed command catalogue.
+
+Builds a synthetic washer-dryer catalogue (a multi-program ``startProgram``
+plus the single-program commands) and reports the bytes retained per
+appliance once it is loaded, as measured by :mod:`tracemalloc`. The raw
+payload is counted too, as the setup cache keeps it for the entry lifetime.
+
+Usage: ``python scripts/memory_benchmark.py [--programs 40] [--appliances 10]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.hon.devices.device import HonDevice  # noqa: E402
+
+
+def _range(minimum, maximum, step, default):
+    return {
+        "category": "regular",
+        "typology": "range",
+        "mandatory": 1,
+        "minimumValue": str(minimum),
+        "maximumValue": str(maximum),
+        "incrementValue": str(step),
+        "defaultValue": str(default),
+    }
+
+
+def _enum(values, default):
+    return {
+        "category": "regular",
+        "typology": "enum",
+        "mandatory": 1,
+        "enumValues": [str(value) for value in values],
+        "defaultValue": str(default),
+    }
+
+
+def _fixed(value):
+    return {
+        "category": "regular",
+        "typology": "fixed",
+        "mandatory": 1,
+        "fixedValue": str(value),
+    }
+
+
+def _program_parameters(index):
+    parameters = {
+        "temp": _range(0, 90, 10, 40),
+        "spinSpeed": _range(0, 1400, 200, 1000),
+        "delayTime": _range(0, 1440, 30, 0),
+        "dryLevel": _enum(range(4), 0),
+        "dryTime": _range(0, 240, 30, 0),
+        "rinseIterations": _enum(range(1, 6), 2),
+        "mainWashTime": _range(5, 60, 1, 15),
+        "extraRinse1": _enum((0, 1), 0),
+        "extraRinse2": _enum((0, 1), 0),
+        "extraRinse3": _enum((0, 1), 0),
+        "steamLevel": _enum(range(4), 0),
+        "stainType": _enum(range(12), 0),
+        "soilLevel": _enum(range(3), 1),
+        "autoDetergent": _enum((0, 1), 1),
+        "autoSoftener": _enum((0, 1), 1),
+        "lang": _fixed(1),
+        "haier_MainWashSpeed": _fixed(50),
+        "haier_SoakPrewashSelection": _fixed(0),
+        "prCode": _fixed(index),
+        "prStr": _fixed(f"PROGRAM_{index}"),
+    }
+    return {
+        "parameters": parameters,
+        "ancillaryParameters": {
+            "programFamily": _fixed("[standard]"),
+            "remoteActionable": _fixed(1),
+            "remoteVisible": _fixed(1),
+        },
+    }
+
+
+def build_catalogue(programs):
+    """Return a synthetic command catalogue payload."""
+    settings = _program_parameters(0)
+    return {
+        "applianceModel": {"applianceModelId": 1},
+        "options": {},
+        "dictionaryId": "dict",
+        "settings": settings,
+        "stopProgram": {"parameters": {"onOffStatus": _fixed(0)}},
+        "startProgram": {
+            f"PROGRAMS.WD.PROGRAM_{index}": _program_parameters(index)
+            for index in range(programs)
+        },
+    }
+
+
+def _appliance(index):
+    return {
+        "brand": "haier",
+        "applianceTypeName": "WD",
+        "applianceTypeId": 1,
+        "macAddress": f"00-00-00-00-00-{index:02x}",
+        "modelName": "HWD100",
+        "applianceModelId": 1,
+        "serialNumber": f"SN{index}",
+        "fwVersion": "1.0",
+    }
+
+
+async def _load(appliances, programs):
+    devices = []
+    for index in range(appliances):
+        device = HonDevice(MagicMock(), MagicMock(), _appliance(index))
+        # Every appliance gets its own decoded payload, as from the cloud,
+        # and keeps it: HonConnection holds it in the setup cache anyway.
+        payload = json.loads(json.dumps(build_catalogue(programs)))
+        await device.load_commands(payload)
+        devices.append((device, payload))
+    return devices
+
+
+def measure(appliances, programs):
+    """Return the bytes retained per appliance for loaded catalogues."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    devices = asyncio.run(_load(appliances, programs))
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del devices
+    return (after - before) / appliances
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--programs", type=int, default=40)
+    parser.add_argument("--appliances", type=int, default=10)
+    args = parser.parse_args()
+    per_appliance = measure(args.appliances, args.programs)
+    print(
+        f"{args.programs} programs, {args.appliances} appliances: "
+        f"{per_appliance / 1024:.1f} KiB per appliance"
+    )
+
+
+if __name__ == "__main__":
+    main()
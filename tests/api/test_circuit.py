@@ -0,0 +1,100 @@
+"""Tests for the per-endpoint circuit breaker."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.hon.api.circuit import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+)
+from custom_components.hon.api.exceptions import HonConnectionError
+
+
+class FakeClock:
+    """A manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock: FakeClock) -> CircuitBreaker:
+    """A breaker opening after two failures for ten seconds."""
+    return CircuitBreaker("/commands/v1/context", 2, 10.0, clock=clock)
+
+
+def fail(breaker: CircuitBreaker) -> None:
+    """Let one request through and record it as failed."""
+    breaker.before_request()
+    breaker.record(False)
+
+
+def test_opens_after_consecutive_failures() -> None:
+    """The breaker opens at the threshold and then rejects requests."""
+    breaker = make_breaker(FakeClock())
+    fail(breaker)
+    assert breaker.state == STATE_CLOSED
+    fail(breaker)
+    assert breaker.state == STATE_OPEN
+    with pytest.raises(HonConnectionError, match="unavailable"):
+        breaker.before_request()
+    stats = breaker.stats()
+    assert stats["trips"] == 1
+    assert stats["rejected"] == 1
+
+
+def test_success_resets_the_failure_count() -> None:
+    """Failures must be consecutive to open the breaker."""
+    breaker = make_breaker(FakeClock())
+    fail(breaker)
+    breaker.before_request()
+    breaker.record(True)
+    fail(breaker)
+    assert breaker.state == STATE_CLOSED
+
+
+def test_half_open_lets_a_single_probe_through() -> None:
+    """After the reset timeout one probe passes; others keep failing fast."""
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    fail(breaker)
+    fail(breaker)
+    clock.now = 10.0
+    assert breaker.state == STATE_HALF_OPEN
+    breaker.before_request()
+    with pytest.raises(HonConnectionError):
+        breaker.before_request()
+    breaker.record(True)
+    assert breaker.state == STATE_CLOSED
+
+
+def test_failed_probe_reopens_for_another_window() -> None:
+    """A failing probe re-opens the breaker without waiting for the threshold."""
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    fail(breaker)
+    fail(breaker)
+    clock.now = 10.0
+    fail(breaker)
+    assert breaker.state == STATE_OPEN
+    clock.now = 15.0
+    assert breaker.state == STATE_OPEN
+    assert breaker.stats()["trips"] == 1
+
+
+def test_abandoned_probe_frees_the_slot() -> None:
+    """A probe cancelled before an answer lets the next caller probe."""
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    fail(breaker)
+    fail(breaker)
+    clock.now = 10.0
+    breaker.before_request()
+    breaker.record(None)
+    assert breaker.state == STATE_HALF_OPEN
+    breaker.before_request()
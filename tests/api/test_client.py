@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
+import json as json_module
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.hon.api.client import (
     HonConnection,
+    _parse_retry_after,
     async_remove_setup_cache,
     get_hOn_mac,
 )
@@ -21,7 +25,15 @@ from custom_components.hon.api.exceptions import (
     HonPasswordChangeRequiredError,
     HonRateLimitError,
 )
-from custom_components.hon.const import APP_VERSION, CONF_UPDATE_INTERVAL, DOMAIN
+from custom_components.hon.api.ratelimit import TokenBucket
+from custom_components.hon.command import compile_catalogue
+from custom_components.hon.const import (
+    APP_VERSION,
+    CONF_ADAPTIVE_POLLING,
+    CONF_BATCH_POLLING,
+    CONF_UPDATE_INTERVAL,
+    DOMAIN,
+)
 from custom_components.hon.coordinator import HonBaseCoordinator
 from tests.conftest import EMAIL, MAC, PASSWORD, build_appliance
 
@@ -33,11 +45,16 @@ class FakeResponse:
     """An aiohttp response stand-in usable as an async context manager."""
 
     def __init__(
-        self, status: int, json_data: Any = None, exc: Exception | None = None
+        self,
+        status: int,
+        json_data: Any = None,
+        exc: Exception | None = None,
+        headers: dict[str, str] | None = None,
     ) -> None:
         self.status = status
         self._json_data = json_data
         self._exc = exc
+        self.headers = headers or {}
 
     async def __aenter__(self) -> FakeResponse:
         if self._exc is not None:
@@ -47,6 +64,9 @@ class FakeResponse:
     async def __aexit__(self, *exc_info: Any) -> bool:
         return False
 
+    async def read(self) -> bytes:
+        return json_module.dumps(self._json_data).encode()
+
     async def json(self) -> Any:
         return self._json_data
 
@@ -65,6 +85,9 @@ class FakeTextResponse(FakeResponse):
     async def json(self) -> Any:
         raise aiohttp.ContentTypeError(None, ()) from None
 
+    async def read(self) -> bytes:
+        return self._text.encode()
+
     async def text(self) -> str:
         return self._text
 
@@ -126,6 +149,15 @@ def make_entry(options: dict[str, Any] | None = None) -> MagicMock:
     return entry
 
 
+def make_config_entry(hass: Any) -> MockConfigEntry:
+    """Build a config entry owning the setup cache of ``entry-1``."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=make_entry().data, unique_id=EMAIL, entry_id="entry-1"
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
 def make_connection(
     responses: list[FakeResponse] | None = None, entry: Any | None = None
 ) -> HonConnection:
@@ -365,7 +397,83 @@ async def test_async_request_retries_on_500() -> None:
     ) as sleep_mock:
         result = await connection._async_request("GET", "https://example.test/x")
     assert result == {"ok": True}
-    sleep_mock.assert_awaited_once_with(1)
+    sleep_mock.assert_awaited_once()
+    assert 1 <= sleep_mock.await_args.args[0] <= 3
+
+
+async def test_async_request_backoff_is_jittered_and_capped() -> None:
+    """Consecutive retries draw decorrelated delays bounded by the cap."""
+    connection = make_connection(
+        [FakeResponse(503, {})] * 3 + [FakeResponse(200, {"ok": True})]
+    )
+    with (
+        patch(
+            "custom_components.hon.api.client.random.uniform",
+            side_effect=lambda low, high: high,
+        ),
+        patch(
+            "custom_components.hon.api.client.asyncio.sleep", AsyncMock()
+        ) as sleep_mock,
+    ):
+        await connection._async_request("GET", "https://example.test/x")
+    assert [call.args[0] for call in sleep_mock.await_args_list] == [3, 8, 8]
+
+
+async def test_async_request_honors_retry_after_seconds() -> None:
+    """A 429 with Retry-After waits exactly that long instead of backing off."""
+    connection = make_connection(
+        [
+            FakeResponse(429, {}, headers={"Retry-After": "5"}),
+            FakeResponse(200, {"ok": True}),
+        ]
+    )
+    with patch(
+        "custom_components.hon.api.client.asyncio.sleep", AsyncMock()
+    ) as sleep_mock:
+        result = await connection._async_request("GET", "https://example.test/x")
+    assert result == {"ok": True}
+    sleep_mock.assert_awaited_once()
+    assert 4 < sleep_mock.await_args.args[0] <= 5
+
+
+async def test_async_request_retry_after_cooldown_is_shared() -> None:
+    """A Retry-After pause also delays the other requests of the connection."""
+    connection = make_connection([FakeResponse(200, {"ok": True})])
+    connection._start_cooldown(10)
+    with patch(
+        "custom_components.hon.api.client.asyncio.sleep", AsyncMock()
+    ) as sleep_mock:
+        await connection._async_request("GET", "https://example.test/x")
+    sleep_mock.assert_awaited_once()
+    assert 9 < sleep_mock.await_args.args[0] <= 10
+
+
+async def test_async_request_long_retry_after_fails_fast() -> None:
+    """A pause longer than MAX_RETRY_AFTER raises instead of blocking."""
+    connection = make_connection(
+        [FakeResponse(429, {}, headers={"Retry-After": "3600"})]
+    )
+    with (
+        patch(
+            "custom_components.hon.api.client.asyncio.sleep", AsyncMock()
+        ) as sleep_mock,
+        pytest.raises(HonRateLimitError),
+    ):
+        await connection._async_request("GET", "https://example.test/x")
+    sleep_mock.assert_not_awaited()
+    # The next request fails fast too while the cooldown lasts.
+    with pytest.raises(HonRateLimitError):
+        await connection._async_request("GET", "https://example.test/x")
+
+
+def test_parse_retry_after() -> None:
+    """Retry-After accepts delta-seconds and HTTP-dates."""
+    future = datetime.now(UTC) + timedelta(seconds=30)
+    assert _parse_retry_after("120") == 120
+    assert 28 <= _parse_retry_after(format_datetime(future, usegmt=True)) <= 30
+    assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert _parse_retry_after("soon") is None
+    assert _parse_retry_after(None) is None
 
 
 async def test_async_request_rate_limit_after_retries() -> None:
@@ -390,6 +498,131 @@ async def test_async_request_connection_error_after_retries() -> None:
         await connection._async_request("GET", "https://example.test/x")
 
 
+async def test_async_request_open_circuit_fails_fast() -> None:
+    """Once an endpoint keeps failing, calls fail without any request."""
+    connection = make_connection([FakeResponse(500, {})] * 2)
+    url = "https://example.test/commands/v1/context"
+    with patch("custom_components.hon.api.client.CIRCUIT_FAILURE_THRESHOLD", 2):
+        for _ in range(2):
+            with pytest.raises(HonConnectionError, match="returned 500"):
+                await connection._async_request("GET", url, retries=0)
+        with pytest.raises(HonConnectionError, match="unavailable"):
+            await connection._async_request("GET", url, params={"macAddress": MAC})
+    assert len(connection._session.calls) == 2
+    assert connection.open_circuits == ["/commands/v1/context"]
+    assert connection.circuit_breaker_stats["/commands/v1/context"]["rejected"] == 1
+
+
+async def test_async_request_client_errors_keep_circuit_closed() -> None:
+    """A 4xx answer shows the endpoint is up and never opens the breaker."""
+    connection = make_connection([FakeResponse(404, {})] * 6)
+    for _ in range(6):
+        with pytest.raises(HonConnectionError, match="returned 404"):
+            await connection._async_request("GET", "https://example.test/x")
+    assert connection.open_circuits == []
+
+
+class SlowResponse(FakeResponse):
+    """A response that only answers once ``release`` is set."""
+
+    def __init__(self, release: asyncio.Event, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._release = release
+
+    async def __aenter__(self) -> FakeResponse:
+        await self._release.wait()
+        return await super().__aenter__()
+
+
+async def test_async_request_coalesces_identical_reads() -> None:
+    """Concurrent identical authenticated GETs share one request."""
+    release = asyncio.Event()
+    connection = make_connection([SlowResponse(release, 200, {"payload": 1})])
+    url = "https://example.test/commands/v1/context"
+    params = {"macAddress": MAC, "category": "CYCLE"}
+    calls = [
+        asyncio.ensure_future(
+            connection._async_request("GET", url, params=params, authenticated=True)
+        )
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*calls)
+    assert results == [{"payload": 1}] * 3
+    assert len(connection._session.calls) == 1
+    assert connection.coalesced_requests == 2
+    assert connection._inflight == {}
+
+
+async def test_async_request_does_not_coalesce_other_requests() -> None:
+    """Different parameters, writes and unauthenticated calls are not shared."""
+    connection = make_connection([FakeResponse(200, {"ok": i}) for i in range(4)])
+    url = "https://example.test/commands/v1/context"
+    await asyncio.gather(
+        connection._async_request(
+            "GET", url, params={"macAddress": "a"}, authenticated=True
+        ),
+        connection._async_request(
+            "GET", url, params={"macAddress": "b"}, authenticated=True
+        ),
+        connection._async_request("POST", url, json={}, authenticated=True),
+        connection._async_request("GET", url, params={"macAddress": "a"}),
+    )
+    assert len(connection._session.calls) == 4
+    assert connection.coalesced_requests == 0
+
+
+async def test_load_statistics_coalesces_conditional_reads() -> None:
+    """Concurrent statistics loads with the same validators share a request."""
+    device = MagicMock()
+    device.mac_address = MAC
+    device.appliance_type = "WM"
+    release = asyncio.Event()
+    connection = make_connection(
+        [
+            SlowResponse(
+                release, 200, {"payload": {"k": "v"}}, headers={"ETag": '"v2"'}
+            ),
+            FakeResponse(304),
+        ]
+    )
+    validators = {"etag": '"v1"'}
+    other = {"etag": '"v1"'}
+    calls = [
+        asyncio.ensure_future(connection.load_statistics(device, validators)),
+        asyncio.ensure_future(connection.load_statistics(device, other)),
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*calls) == [{"k": "v"}] * 2
+    assert len(connection._session.calls) == 1
+    assert connection.coalesced_requests == 1
+    assert connection._inflight == {}
+    assert validators == other == {"etag": '"v2"'}
+    # Different validators are a different conditional request.
+    assert await connection.load_statistics(device, {"etag": '"v0"'}) is None
+    assert len(connection._session.calls) == 2
+
+
+async def test_async_request_cancelled_caller_keeps_shared_read() -> None:
+    """Cancelling one waiter leaves the shared request to the others."""
+    release = asyncio.Event()
+    connection = make_connection([SlowResponse(release, 200, {"ok": True})])
+    url = "https://example.test/commands/v1/statistics"
+    first = asyncio.ensure_future(
+        connection._async_request("GET", url, authenticated=True)
+    )
+    second = asyncio.ensure_future(
+        connection._async_request("GET", url, authenticated=True)
+    )
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+    assert await second == {"ok": True}
+    assert first.cancelled()
+
+
 async def test_async_request_refreshes_on_401() -> None:
     """A 401 triggers a token refresh then the request is retried."""
     connection = make_connection(
@@ -404,6 +637,46 @@ async def test_async_request_refreshes_on_401() -> None:
     assert connection._cognito_token == "cognito"
 
 
+async def test_async_request_records_endpoint_metrics() -> None:
+    """Attempts, retries, statuses and bytes are counted per endpoint."""
+    connection = make_connection(
+        [
+            FakeResponse(503, {}),
+            FakeResponse(200, {}, exc=aiohttp.ClientError("boom")),
+            FakeResponse(200, {"ok": True}),
+        ]
+    )
+    with patch("custom_components.hon.api.client.asyncio.sleep", AsyncMock()):
+        await connection._async_request("GET", "https://example.test/x?a=1")
+    stats = connection.endpoint_stats["/x"]
+    assert stats["requests"] == 1
+    assert stats["retries"] == 2
+    assert stats["errors"] == 1
+    assert stats["statuses"] == {"503": 1, "200": 1}
+    assert stats["response_bytes"] == len(b'{"ok": true}')
+    assert stats["latency_ms"]["p99"] is not None
+    totals = connection.request_totals
+    assert totals["failures"] == 2
+    assert totals["latency_p95"] is not None
+
+
+async def test_async_request_records_reauth_metrics() -> None:
+    """A 401 answered by a re-login counts as a re-auth, not a retry."""
+    connection = make_connection(
+        [
+            FakeResponse(401, {}),
+            *authorize_responses(),
+            FakeResponse(200, {"final": True}),
+        ]
+    )
+    await connection._async_request("GET", "https://example.test/x")
+    stats = connection.endpoint_stats["/x"]
+    assert stats["reauths"] == 1
+    assert stats["retries"] == 0
+    assert stats["auth_wait"] >= 0
+    assert connection.request_totals["reauths"] == 1
+
+
 async def test_async_request_raises_on_4xx() -> None:
     """Any other >= 400 status raises HonConnectionError."""
     connection = make_connection([FakeResponse(400, {})])
@@ -463,6 +736,32 @@ async def test_load_statistics() -> None:
     assert result == {"k": "v"}
 
 
+async def test_load_statistics_conditional() -> None:
+    """Validators make the request conditional and a 304 returns None."""
+    device = MagicMock()
+    device.mac_address = MAC
+    device.appliance_type = "WM"
+    connection = make_connection(
+        [
+            FakeResponse(
+                200,
+                {"payload": {"k": "v"}},
+                headers={"ETag": '"v1"', "Last-Modified": "Sun, 18 Oct 2026"},
+            ),
+            FakeResponse(304),
+        ]
+    )
+    validators: dict[str, str] = {}
+    assert await connection.load_statistics(device, validators) == {"k": "v"}
+    assert validators == {"etag": '"v1"', "last_modified": "Sun, 18 Oct 2026"}
+    assert await connection.load_statistics(device, validators) is None
+    headers = connection._session.calls[1][2]["headers"]
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == "Sun, 18 Oct 2026"
+    assert "cognito-token" in headers
+    assert validators == {"etag": '"v1"', "last_modified": "Sun, 18 Oct 2026"}
+
+
 async def test_async_set_success() -> None:
     """async_set returns True on a zero resultCode."""
     connection = make_connection([FakeResponse(200, {"payload": {"resultCode": "0"}})])
@@ -519,6 +818,69 @@ async def test_async_get_coordinator_default_interval(hass) -> None:
     assert coordinator.update_interval == timedelta(seconds=60)
 
 
+async def test_async_get_coordinator_batch_polling(hass) -> None:
+    """In batch mode coordinators have no timer of their own."""
+    entry = make_entry(options={CONF_UPDATE_INTERVAL: 120, CONF_BATCH_POLLING: True})
+    connection = make_connection(entry=entry)
+    coordinator = await connection.async_get_coordinator(build_appliance())
+    assert coordinator.update_interval is None
+    assert connection.update_interval == timedelta(seconds=120)
+
+
+async def test_async_get_coordinator_adaptive_polling(hass) -> None:
+    """Adaptive polling gives the coordinator its appliance type profile."""
+    from custom_components.hon.polling import PROGRAM_PROFILE
+
+    entry = make_entry(options={CONF_ADAPTIVE_POLLING: True})
+    connection = make_connection(entry=entry)
+    coordinator = await connection.async_get_coordinator(build_appliance())
+    assert coordinator._polling_profile is PROGRAM_PROFILE
+
+
+async def test_batch_poll_interval_follows_adaptive_profiles(hass) -> None:
+    """Adaptive batch polling ticks often enough for the running interval."""
+    from custom_components.hon.polling import PROGRAM_PROFILE
+
+    options = {CONF_UPDATE_INTERVAL: 120, CONF_BATCH_POLLING: True}
+    connection = make_connection(entry=make_entry(options=options))
+    assert connection.batch_poll_interval == timedelta(seconds=120)
+    connection = make_connection(
+        entry=make_entry(options={**options, CONF_ADAPTIVE_POLLING: True})
+    )
+    assert connection.batch_poll_interval == timedelta(seconds=PROGRAM_PROFILE.running)
+
+
+async def test_send_command_takes_only_a_write_token() -> None:
+    """Commands consume the write budget, never the read one."""
+    device = MagicMock()
+    device.mac_address = MAC
+    device.appliance_type = "AC"
+    device.commands_options = {}
+    connection = make_connection(
+        [FakeResponse(200, {"payload": {"resultCode": "0"}}) for _ in range(4)]
+    )
+    connection._read_bucket = TokenBucket(0.001, 1)
+    for _ in range(3):
+        assert await connection.send_command(device, "settings", {}, {}) is True
+    stats = connection.rate_limit_stats
+    assert stats["read"]["acquired"] == 0
+    assert stats["write"]["acquired"] == 3
+    # The read budget is intact for the next poll.
+    await asyncio.wait_for(
+        connection._async_request("GET", "https://x", authenticated=True), 1
+    )
+    assert connection.rate_limit_stats["read"]["delayed"] == 0
+
+
+async def test_rate_limiter_delays_requests_over_budget() -> None:
+    """Requests beyond the burst wait for the bucket instead of bursting."""
+    connection = make_connection([FakeResponse(200, {"payload": {}}) for _ in range(3)])
+    connection._read_bucket = TokenBucket(100.0, 1)
+    for _ in range(3):
+        await connection._async_request("GET", "https://x", authenticated=True)
+    assert connection.rate_limit_stats["read"]["delayed"] == 2
+
+
 async def test_async_get_existing_coordinator() -> None:
     """async_get_existing_coordinator returns only known MACs."""
     connection = make_connection()
@@ -528,6 +890,16 @@ async def test_async_get_existing_coordinator() -> None:
     assert await connection.async_get_existing_coordinator("00-00") is None
 
 
+async def test_coordinators_view() -> None:
+    """coordinators is a live, read-only view of the registered coordinators."""
+    connection = make_connection()
+    coordinators = connection.coordinators
+    connection._coordinator_dict[MAC] = existing = MagicMock()
+    assert dict(coordinators) == {MAC: existing}
+    with pytest.raises(TypeError):
+        coordinators["00-00"] = MagicMock()
+
+
 async def test_get_device() -> None:
     """get_device resolves the coordinator registered for a MAC."""
     connection = make_connection()
@@ -604,19 +976,19 @@ async def test_headers() -> None:
 
 
 async def test_ensure_session_refreshes_when_expired() -> None:
-    """_ensure_session re-authenticates when the session is stale."""
+    """async_ensure_session re-authenticates when the session is stale."""
     connection = make_connection()
     connection._start_time = 0
     connection.async_authorize = AsyncMock(return_value=True)
-    await connection._ensure_session()
+    await connection.async_ensure_session()
     connection.async_authorize.assert_awaited_once()
 
 
 async def test_ensure_session_skips_when_fresh() -> None:
-    """_ensure_session does nothing for a fresh session."""
+    """async_ensure_session does nothing for a fresh session."""
     connection = make_connection()
     connection.async_authorize = AsyncMock(return_value=True)
-    await connection._ensure_session()
+    await connection.async_ensure_session()
     connection.async_authorize.assert_not_awaited()
 
 
@@ -669,15 +1041,22 @@ async def test_session_provider_uses_hass_session(hass) -> None:
     get_session.assert_called_once_with(hass)
 
 
+@pytest.fixture
+def tmp_config_dir(hass, tmp_path) -> Any:
+    """Point the config dir (and the setup cache blobs) at a temp dir."""
+    hass.config.config_dir = str(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.usefixtures("tmp_config_dir")
 async def test_setup_cache_roundtrip(hass) -> None:
     """store_setup_cache feeds get_cached_setup and keys on fw/app versions."""
-    entry = make_entry()
-    entry.entry_id = "entry-1"
-    connection = HonConnection(hass, entry)
+    connection = HonConnection(hass, make_config_entry(hass))
     await connection.async_load_setup_cache()
     assert connection.get_cached_setup(MAC, "5.30.0") is None
 
     connection.store_setup_cache(MAC, "5.30.0", {"applianceModel": {}}, {"s": 1})
+    await hass.async_block_till_done(wait_background_tasks=True)
     cached = connection.get_cached_setup(MAC, "5.30.0")
     assert cached is not None
     assert cached["commands"] == {"applianceModel": {}}
@@ -686,27 +1065,53 @@ async def test_setup_cache_roundtrip(hass) -> None:
     assert connection.get_cached_setup(MAC, "6.0.0") is None
 
 
+@pytest.mark.usefixtures("tmp_config_dir")
 async def test_get_cached_setup_app_version_mismatch(hass) -> None:
     """An integration app-version bump invalidates the cached entry."""
-    entry = make_entry()
-    entry.entry_id = "entry-1"
-    connection = HonConnection(hass, entry)
+    connection = HonConnection(hass, make_config_entry(hass))
     await connection.async_load_setup_cache()
     connection.store_setup_cache(MAC, "5.30.0", {}, {})
+    await hass.async_block_till_done(wait_background_tasks=True)
     connection._setup_cache[MAC]["app_version"] = "0.0.0"
     assert connection.get_cached_setup(MAC, "5.30.0") is None
 
 
+@pytest.mark.usefixtures("tmp_config_dir")
 async def test_store_setup_cache_schedules_save(hass) -> None:
     """store_setup_cache schedules a coalesced disk write."""
+    connection = HonConnection(hass, make_config_entry(hass))
+    await connection.async_load_setup_cache()
+    catalogue = {"settings": {"parameters": {}}}
+    with patch.object(connection._setup_store, "async_delay_save") as delay_save:
+        connection.store_setup_cache(MAC, "5.30.0", catalogue, {"s": 2})
+        await hass.async_block_till_done(wait_background_tasks=True)
+    delay_save.assert_called_once()
+    index = delay_save.call_args.args[0]()
+    # The catalogue and its table are referenced by digest, the statistics
+    # stay inline.
+    assert "commands" not in index[MAC]
+    assert "table" not in index[MAC]
+    assert index[MAC]["table_blob"] != index[MAC]["commands_blob"]
+    assert index[MAC]["statistics"] == {"s": 2}
+    assert connection.get_cached_setup(MAC, "5.30.0")["commands"] == catalogue
+
+
+async def test_store_cached_statistics_updates_entry(hass) -> None:
+    """A statistics refresh updates the cached entry and saves the index."""
     entry = make_entry()
     entry.entry_id = "entry-1"
     connection = HonConnection(hass, entry)
     await connection.async_load_setup_cache()
+    connection.store_cached_statistics(MAC, {"s": 1}, {"time": 1.0})  # no entry
+    assert MAC not in connection._setup_cache
+    connection._setup_cache[MAC] = {"statistics": {}}
     with patch.object(connection._setup_store, "async_delay_save") as delay_save:
-        connection.store_setup_cache(MAC, "5.30.0", {}, {})
+        connection.store_cached_statistics(MAC, {"s": 2}, {"time": 2.0})
     delay_save.assert_called_once()
-    assert delay_save.call_args.args[0]() is connection._setup_cache
+    assert connection._setup_cache[MAC] == {
+        "statistics": {"s": 2},
+        "statistics_state": {"time": 2.0},
+    }
 
 
 async def test_setup_cache_noop_without_entry() -> None:
@@ -718,6 +1123,7 @@ async def test_setup_cache_noop_without_entry() -> None:
     assert connection.get_cached_setup(MAC, "5.30.0") is None
 
 
+@pytest.mark.usefixtures("tmp_config_dir")
 async def test_async_load_setup_cache_restores(hass, hass_storage) -> None:
     """A persisted cache is restored from disk on the next boot."""
     key = f"{DOMAIN}.setup_cache_entry-1"
@@ -742,12 +1148,51 @@ async def test_async_load_setup_cache_restores(hass, hass_storage) -> None:
     assert cached["commands"] == {"c": 1}
 
 
-async def test_async_remove_setup_cache(hass, hass_storage) -> None:
-    """Removing the cache deletes the on-disk store."""
+async def test_async_remove_setup_cache(hass, hass_storage, tmp_config_dir) -> None:
+    """Removing the cache deletes the on-disk store and its blobs."""
     key = f"{DOMAIN}.setup_cache_entry-1"
     hass_storage[key] = {"version": 1, "key": key, "data": {}}
+    blobs = tmp_config_dir / ".storage" / f"{key}.blobs"
+    blobs.mkdir(parents=True)
+    (blobs / "x.json.z").write_bytes(b"")
     await async_remove_setup_cache(hass, "entry-1")
     assert key not in hass_storage
+    assert not blobs.exists()
+
+
+async def test_setup_cache_blobs_roundtrip(hass, hass_storage, tmp_config_dir) -> None:
+    """Catalogues round-trip through shared blobs; orphans are pruned."""
+    entry = make_config_entry(hass)
+    connection = HonConnection(hass, entry)
+    await connection.async_load_setup_cache()
+    catalogue = {"startProgram": {"p1": {"parameters": {}}}}
+    other = "08-b6-1f-de-c9-15"
+    connection.store_setup_cache(MAC, "5.30.0", catalogue, {"s": 1})
+    connection.store_setup_cache(other, "5.30.0", dict(catalogue), {"s": 2})
+    await hass.async_block_till_done(wait_background_tasks=True)
+    blob = connection._setup_cache[MAC]["commands_blob"]
+    assert connection._setup_cache[other]["commands_blob"] == blob
+
+    key = f"{DOMAIN}.setup_cache_entry-1"
+    index = connection._setup_cache_index()
+    index["stale"] = {"commands_blob": "0" * 32}
+    hass_storage[key] = {"version": 1, "key": key, "data": index}
+    orphan = tmp_config_dir / ".storage" / f"{key}.blobs" / ("f" * 32 + ".json.z")
+    orphan.write_bytes(b"junk")
+
+    restored = HonConnection(hass, entry)
+    await restored.async_load_setup_cache()
+    first = restored.get_cached_setup(MAC, "5.30.0")
+    second = restored.get_cached_setup(other, "5.30.0")
+    assert first["commands"] == catalogue
+    assert second["commands"] is first["commands"]
+    # The pre-parsed table comes back along with the catalogue.
+    assert first["table"] == compile_catalogue(catalogue)
+    assert second["table"] is first["table"]
+    assert second["statistics"] == {"s": 2}
+    # A blob that went missing just drops the catalogue from the entry.
+    assert "commands" not in restored._setup_cache["stale"]
+    assert not orphan.exists()
 
 
 async def test_concurrent_authorize_single_login() -> None:
@@ -790,6 +1235,7 @@ async def test_request_retry_uses_fresh_tokens() -> None:
     assert calls[-1][2]["headers"]["id-token"] == "id"
 
 
+@pytest.mark.usefixtures("tmp_config_dir")
 async def test_appliances_cache_roundtrip(hass) -> None:
     """The appliance list persists and restores through the setup cache."""
     entry = make_entry()
@@ -803,6 +1249,7 @@ async def test_appliances_cache_roundtrip(hass) -> None:
     assert connection.get_cached_appliances() == [build_appliance()]
 
 
+@pytest.mark.usefixtures("tmp_config_dir")
 async def test_appliances_cache_app_version_mismatch(hass) -> None:
     """An integration app-version bump invalidates the cached list."""
     entry = make_entry()
@@ -0,0 +1,40 @@
+"""Tests for the per-endpoint request metrics."""
+
+from __future__ import annotations
+
+from custom_components.hon.api.metrics import EndpointMetrics, percentile
+
+
+def test_percentile_nearest_rank() -> None:
+    """Percentiles pick the nearest-rank sample."""
+    samples = [float(value) for value in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 95) == 95.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([7.0], 99) == 7.0
+
+
+def test_latency_window_follows_recent_responses() -> None:
+    """Only the most recent responses make the latency percentiles."""
+    metrics = EndpointMetrics(window=4)
+    assert metrics.latency() == {"p50": None, "p95": None, "p99": None}
+    for _ in range(4):
+        metrics.record_response(200, 0.010)
+    for _ in range(4):
+        metrics.record_response(200, 0.500)
+    assert metrics.latency() == {"p50": 500.0, "p95": 500.0, "p99": 500.0}
+
+
+def test_stats_and_failures() -> None:
+    """Error statuses and transport errors count as failures."""
+    metrics = EndpointMetrics()
+    metrics.requests = 3
+    metrics.record_response(200, 0.1)
+    metrics.record_response(503, 0.2)
+    metrics.record_response(404, 0.3)
+    metrics.record_error()
+    assert metrics.failures == 3
+    stats = metrics.stats()
+    assert stats["statuses"] == {"200": 1, "503": 1, "404": 1}
+    assert stats["errors"] == 1
+    assert stats["latency_ms"]["p50"] == 200.0
@@ -0,0 +1,57 @@
+"""Tests for the request token bucket."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.hon.api.ratelimit import TokenBucket
+
+
+async def test_burst_is_served_without_waiting() -> None:
+    """Up to ``capacity`` tokens are handed out immediately."""
+    bucket = TokenBucket(1.0, 3)
+    assert [await bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.stats()["acquired"] == 3
+    assert bucket.stats()["delayed"] == 0
+
+
+async def test_empty_bucket_waits_for_refill() -> None:
+    """Once empty, callers wait for the refill and the wait is recorded."""
+    bucket = TokenBucket(100.0, 1)
+    await bucket.acquire()
+    waited = await bucket.acquire()
+    assert waited > 0
+    stats = bucket.stats()
+    assert stats["delayed"] == 1
+    assert stats["max_wait"] == stats["total_wait"] > 0
+
+
+async def test_priority_waiters_are_served_first() -> None:
+    """Commands queued after polls still get the next token first."""
+    bucket = TokenBucket(50.0, 1)
+    await bucket.acquire()
+    order: list[str] = []
+
+    async def take(name: str, priority: bool) -> None:
+        await bucket.acquire(priority=priority)
+        order.append(name)
+
+    poll = asyncio.ensure_future(take("poll", False))
+    await asyncio.sleep(0)
+    command = asyncio.ensure_future(take("command", True))
+    await asyncio.gather(poll, command)
+    assert order == ["command", "poll"]
+
+
+async def test_cancelled_waiter_does_not_leak_tokens() -> None:
+    """A waiter cancelled in the queue leaves its turn to the next one."""
+    bucket = TokenBucket(50.0, 1)
+    await bucket.acquire()
+    cancelled = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert await asyncio.wait_for(bucket.acquire(), 1) > 0
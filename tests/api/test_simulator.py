@@ -0,0 +1,125 @@
+"""Tests of the real request path against the offline hOn cloud simulator."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.hon.api.client import HonConnection
+from custom_components.hon.api.exceptions import HonConnectionError
+from custom_components.hon.devices.device import HonDevice
+from tests.conftest import EMAIL, PASSWORD
+from tests.simulator import HonCloudSimulator
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+CONTEXT = "/commands/v1/context"
+
+
+@pytest.fixture(autouse=True)
+def fast_backoff() -> None:
+    """Shrink the retry backoff so retries do not sleep for seconds."""
+    with (
+        patch("custom_components.hon.api.client.BACKOFF_BASE", 0.001),
+        patch("custom_components.hon.api.client.BACKOFF_CAP", 0.001),
+    ):
+        yield
+
+
+@pytest.fixture
+async def cloud(socket_enabled: None) -> AsyncIterator[HonCloudSimulator]:
+    """A simulated cloud with three appliances (on a local socket)."""
+    async with HonCloudSimulator(appliances=3) as simulator:
+        yield simulator
+
+
+async def _connect(cloud: HonCloudSimulator) -> HonConnection:
+    connection = HonConnection(
+        None,
+        None,
+        EMAIL,
+        PASSWORD,
+        read_limit=(1000.0, 1000),
+        write_limit=(1000.0, 1000),
+    )
+    connection._session = cloud.session()
+    assert await connection.async_authorize()
+    return connection
+
+
+async def test_simulated_boot(cloud: HonCloudSimulator) -> None:
+    """Login, catalogue, statistics and context load for every appliance."""
+    connection = await _connect(cloud)
+    assert len(connection.appliances) == 3
+    devices = [
+        HonDevice(connection, MagicMock(), appliance)
+        for appliance in connection.appliances
+    ]
+    await asyncio.gather(
+        *(
+            asyncio.gather(
+                device.load_commands(), device.load_statistics(), device.load_context()
+            )
+            for device in devices
+        )
+    )
+    for device in devices:
+        assert "startProgram" in device.commands
+        assert device.statistics == cloud.statistics
+        assert device.get("machMode") == "2"
+    assert cloud.requests[CONTEXT] == 3
+    assert await devices[0].commands["stopProgram"].send()
+    assert cloud.commands[0]["commandName"] == "stopProgram"
+
+
+async def test_simulated_token_expiry_single_relogin(cloud: HonCloudSimulator) -> None:
+    """Concurrent requests hitting revoked tokens share one re-login."""
+    connection = await _connect(cloud)
+    device = HonDevice(connection, MagicMock(), connection.appliances[0])
+    cloud.expire_tokens()
+    others = [
+        HonDevice(connection, MagicMock(), appliance)
+        for appliance in connection.appliances[1:]
+    ]
+    await asyncio.gather(*(d.load_context() for d in (device, *others)))
+    assert cloud.requests["/ciam/token"] == 2
+    assert cloud.statuses[401] == 3
+    assert device.get("remainingTimeMM") == "60"
+
+
+async def test_simulated_throttling_and_errors_are_retried(
+    cloud: HonCloudSimulator,
+) -> None:
+    """429 (with Retry-After) and 5xx answers are retried transparently."""
+    connection = await _connect(cloud)
+    device = HonDevice(connection, MagicMock(), connection.appliances[0])
+    cloud.inject(CONTEXT, 429, retry_after="0")
+    cloud.inject(CONTEXT, 503, 502)
+    await device.load_context()
+    assert cloud.requests[CONTEXT] == 4
+    assert device.get("onOffStatus") == "1"
+
+
+async def test_simulated_outage_fails_after_retries(cloud: HonCloudSimulator) -> None:
+    """An endpoint failing every request surfaces a HonConnectionError."""
+    connection = await _connect(cloud)
+    device = HonDevice(connection, MagicMock(), connection.appliances[0])
+    cloud.error_rate = 1.0
+    with pytest.raises(HonConnectionError):
+        await device.load_context()
+    assert cloud.statuses[503] == 4  # first attempt + MAX_RETRIES
+
+
+async def test_simulated_statistics_not_modified(cloud: HonCloudSimulator) -> None:
+    """The simulator honours the statistics ETag with a 304."""
+    connection = await _connect(cloud)
+    device = HonDevice(connection, MagicMock(), connection.appliances[0])
+    await device.load_statistics()
+    version = device.data_version
+    await device.load_statistics()
+    assert cloud.statuses[304] == 1
+    assert device.data_version == version
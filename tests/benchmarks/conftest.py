@@ -0,0 +1,215 @@
+"""Shared fixtures for the benchmark suite.
+
+The benchmarks use pytest-benchmark. A plain ``pytest`` run executes each
+of them once (``--benchmark-disable``, see ``pyproject.toml``) so they stay
+correct; ``scripts/benchmark`` times them and compares with the stored
+baseline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.hon.devices.device import HonDevice
+from tests.conftest import build_appliance
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Iterator
+
+# Shadow parameters of a washer-dryer context, with representative values.
+WASHER_PARAMETERS = {
+    "onOffStatus": "1",
+    "machMode": "2",
+    "prCode": "12",
+    "prPhase": "3",
+    "prTime": "95",
+    "remainingTimeMM": "42",
+    "delayTime": "0",
+    "temp": "40",
+    "tempSel": "40",
+    "spinSpeed": "1200",
+    "dryLevel": "2",
+    "dryTime": "0",
+    "totalWashCycle": "311",
+    "currentWashCycle": "3",
+    "totalWaterUsed": "15230",
+    "currentWaterUsed": "12",
+    "totalElectricityUsed": "412",
+    "currentElectricityUsed": "1",
+    "actualWeight": "4",
+    "errors": "00000000",
+    "doorLockStatus": "1",
+    "lockStatus": "0",
+    "pause": "0",
+    "remoteCtrValid": "1",
+    "steamLevel": "0",
+    "stainType": "0",
+    "soilLevel": "1",
+    "rinseIterations": "2",
+    "mainWashTime": "15",
+    "autoDetergent": "1",
+    "autoSoftener": "1",
+    "detergentPercent": "60",
+    "waterHard": "2",
+    "haier_DetergentWeight": "35",
+    "haier_SoftenerWeight": "20",
+    "energySavingStatus": "0",
+    "extraRinse1": "0",
+    "extraRinse2": "0",
+    "extraRinse3": "0",
+    "goodNight": "0",
+    "acquaplus": "0",
+    "antiAllergyStatus": "0",
+    "anticreaseTime": "0",
+    "autoDoseSoftener": "1",
+    "autoDoseDetergent": "1",
+    "prewashStatus": "0",
+    "hygieneStatus": "0",
+    "nightWashStatus": "0",
+    "steamStatus": "0",
+    "weight": "4",
+    "lang": "1",
+    "chipVersion": "5.30",
+    "wifiSignal": "-54",
+    "cleaningNeeded": "0",
+    "filterCleaningWarning": "0",
+    "lastUpdate": "0",
+    "timeZone": "1",
+    "dirtyLevel": "1",
+    "dryingStatus": "0",
+    "laundryLoad": "4",
+}
+
+
+def build_context(round_: int = 0) -> dict[str, Any]:
+    """Return a context payload; ``round_`` changes the countdown values."""
+    parameters = dict(WASHER_PARAMETERS)
+    parameters["remainingTimeMM"] = str(42 - round_ % 40)
+    parameters["prTime"] = str(95 - round_ % 40)
+    return {
+        "shadow": {
+            "parameters": {
+                name: {
+                    "parNewVal": value,
+                    "lastUpdate": f"2026-10-18T10:{round_ % 60:02d}:00Z"
+                    if name in ("remainingTimeMM", "prTime")
+                    else "2026-10-18T09:00:00Z",
+                }
+                for name, value in parameters.items()
+            }
+        },
+        "lastConnEvent": {"category": "CONNECTED"},
+        "commandHistory": {"command": {"commandName": "startProgram"}},
+    }
+
+
+def _range(minimum: int, maximum: int, step: int, default: int) -> dict[str, Any]:
+    return {
+        "category": "regular",
+        "typology": "range",
+        "mandatory": 1,
+        "minimumValue": str(minimum),
+        "maximumValue": str(maximum),
+        "incrementValue": str(step),
+        "defaultValue": str(default),
+    }
+
+
+def _enum(values: range | tuple[int, ...], default: int) -> dict[str, Any]:
+    return {
+        "category": "regular",
+        "typology": "enum",
+        "mandatory": 1,
+        "enumValues": [str(value) for value in values],
+        "defaultValue": str(default),
+    }
+
+
+def _fixed(value: Any) -> dict[str, Any]:
+    return {
+        "category": "regular",
+        "typology": "fixed",
+        "mandatory": 1,
+        "fixedValue": str(value),
+    }
+
+
+def _program(index: int) -> dict[str, Any]:
+    return {
+        "parameters": {
+            "temp": _range(0, 90, 10, 40),
+            "spinSpeed": _range(0, 1400, 200, 1000),
+            "delayTime": _range(0, 1440, 30, 0),
+            "dryLevel": _enum(range(4), 0),
+            "dryTime": _range(0, 240, 30, 0),
+            "rinseIterations": _enum(range(1, 6), 2),
+            "mainWashTime": _range(5, 60, 1, 15),
+            "extraRinse1": _enum((0, 1), 0),
+            "steamLevel": _enum(range(4), 0),
+            "stainType": _enum(range(12), 0),
+            "soilLevel": _enum(range(3), 1),
+            "autoDetergent": _enum((0, 1), 1),
+            "autoSoftener": _enum((0, 1), 1),
+            "lang": _fixed(1),
+            "prCode": _fixed(index),
+            "prStr": _fixed(f"PROGRAM_{index}"),
+        },
+        "ancillaryParameters": {
+            "programFamily": _fixed("[standard]"),
+            "remoteActionable": _fixed(1),
+        },
+    }
+
+
+def build_catalogue(programs: int = 40) -> dict[str, Any]:
+    """Return a washer-dryer catalogue with ``programs`` start programs."""
+    return {
+        "applianceModel": {"applianceModelId": 1},
+        "options": {},
+        "dictionaryId": "dict",
+        "settings": _program(0),
+        "stopProgram": {"parameters": {"onOffStatus": _fixed(0)}},
+        "startProgram": {
+            f"PROGRAMS.WD.PROGRAM_{index}": _program(index) for index in range(programs)
+        },
+    }
+
+
+class FakeCloud:
+    """Serves contexts without any mock call overhead."""
+
+    def __init__(self) -> None:
+        self.context: dict[str, Any] = build_context()
+
+    async def async_get_context(self, device: HonDevice) -> dict[str, Any]:
+        return self.context
+
+
+@pytest.fixture
+def run() -> Iterator[Callable[[Coroutine[Any, Any, Any]], Any]]:
+    """Run a coroutine to completion on a private event loop."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture
+def cloud() -> FakeCloud:
+    """The context source of the benchmarked devices."""
+    return FakeCloud()
+
+
+@pytest.fixture
+def washer(cloud: FakeCloud, run: Callable[..., Any]) -> HonDevice:
+    """A washer-dryer with its catalogue and a context loaded."""
+    device = HonDevice(
+        cloud, MagicMock(), build_appliance(appliance_type="WD", appliance_type_id=2)
+    )
+    run(device.load_commands(build_catalogue()))
+    run(device.load_statistics({"totalWashCycle": "311"}))
+    run(device.load_context())
+    return device
@@ -0,0 +1,47 @@
+"""Benchmarks of the command settings views and parameter setters."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from custom_components.hon.parameter import HonParameterEnum
+
+if TYPE_CHECKING:
+    from custom_components.hon.devices.device import HonDevice
+
+
+def test_command_settings_cached(benchmark, washer: HonDevice) -> None:
+    """``settings``/``setting_keys`` of a built command (cached views)."""
+    command = washer.commands["startProgram"]
+
+    def read() -> tuple:
+        return command.settings, command.setting_keys
+
+    benchmark(read)
+    assert "program" in command.setting_keys
+
+
+def test_command_settings_rebuild(benchmark, washer: HonDevice) -> None:
+    """Rebuilding the views after a program switch invalidated them."""
+    command = washer.commands["startProgram"]
+
+    def rebuild() -> object:
+        command.invalidate_settings()
+        return command.settings
+
+    benchmark(rebuild)
+    assert "temp" in command.settings
+
+
+def test_enum_value_setter(benchmark) -> None:
+    """Validating and assigning enum values."""
+    parameter = HonParameterEnum(
+        "stainType", {"enumValues": [str(value) for value in range(12)]}
+    )
+
+    def assign() -> None:
+        for value in ("1", "5", "11"):
+            parameter.value = value
+
+    benchmark(assign)
+    assert parameter.value == "11"
@@ -0,0 +1,57 @@
+"""Benchmark of a coordinator refresh fanned out to every entity."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockEntityPlatform
+
+from custom_components.hon.binary_sensor import async_setup_entry as setup_binary
+from custom_components.hon.const import DOMAIN
+from custom_components.hon.coordinator import HonBaseCoordinator
+from custom_components.hon.sensor import async_setup_entry as setup_sensor
+from tests.benchmarks.conftest import build_catalogue, build_context
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+
+async def test_refresh_fan_out(
+    benchmark, hass: HomeAssistant, mock_connection, appliance
+) -> None:
+    """A context refresh notifying the sensors and binary sensors."""
+    appliance = dict(appliance, applianceTypeName="WD", applianceTypeId=2)
+    mock_connection.appliances = [appliance]
+    mock_connection.async_get_context = AsyncMock(return_value=build_context())
+    # No update interval: the benchmark drives the refreshes itself.
+    coordinator = HonBaseCoordinator(hass, mock_connection, appliance, None)
+    device = coordinator.device
+    await device.load_commands(build_catalogue())
+    await device.load_statistics({"totalWashCycle": "311"})
+    await device.load_context()
+    coordinator.async_set_updated_data(device)
+    mock_connection.async_get_coordinator = AsyncMock(return_value=coordinator)
+    entry = MagicMock(runtime_data=mock_connection)
+
+    entities = []
+    for domain, setup in (("sensor", setup_sensor), ("binary_sensor", setup_binary)):
+        added = []
+        await setup(hass, entry, added.extend)
+        platform = MockEntityPlatform(hass, domain=domain, platform_name=DOMAIN)
+        await platform.async_add_entities(added)
+        # Disabled-by-default entities (the cloud metrics) get no state.
+        entities.extend(
+            entity for entity in added if entity.entity_registry_enabled_default
+        )
+
+    def refresh() -> None:
+        # A full invalidation makes every entity recompute and write.
+        device.invalidate_data()
+        coordinator.async_update_listeners()
+
+    benchmark(refresh)
+    assert len(hass.states.async_all()) == len(entities) > 20
@@ -0,0 +1,93 @@
+"""Benchmarks of the device read path, context and catalogue loading."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+from custom_components.hon.command import compile_catalogue
+from custom_components.hon.devices.device import HonDevice
+from custom_components.hon.helpers import compile_key_path
+from tests.benchmarks.conftest import build_catalogue, build_context
+from tests.conftest import build_appliance
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from tests.benchmarks.conftest import FakeCloud
+
+KEYS = ("tempSel", "remainingTimeMM", "attributes.lastConnEvent.category")
+
+
+def test_device_getitem(benchmark, washer: HonDevice) -> None:
+    """Dotted lookups through ``__getitem__``."""
+
+    def lookup() -> None:
+        for key in KEYS:
+            washer[key]
+
+    benchmark(lookup)
+    assert washer["tempSel"] == "40"
+
+
+def test_device_get_compiled(benchmark, washer: HonDevice) -> None:
+    """``get`` with the precompiled paths the entities use."""
+    paths = [compile_key_path(key) for key in (*KEYS, "missing.key")]
+
+    def lookup() -> None:
+        for path in paths:
+            washer.get(path)
+
+    benchmark(lookup)
+    assert washer.get(paths[1]) == "42"
+
+
+def test_device_has(benchmark, washer: HonDevice) -> None:
+    """``has`` on present and missing keys (platform setup)."""
+
+    def lookup() -> None:
+        for key in ("machMode", "tempSel", "humidity", "statistics.totalWashCycle"):
+            washer.has(key)
+
+    benchmark(lookup)
+    assert washer.has("machMode")
+
+
+def test_load_context_changed(
+    benchmark, washer: HonDevice, cloud: FakeCloud, run: Callable[..., Any]
+) -> None:
+    """A context whose countdown moved: parse, diff and invalidate."""
+    contexts = [build_context(round_) for round_ in range(2)]
+    state = {"round": 0}
+
+    def load() -> None:
+        state["round"] ^= 1
+        cloud.context = contexts[state["round"]]
+        run(washer.load_context())
+
+    benchmark(load)
+    assert washer.get("remainingTimeMM") in ("41", "42")
+
+
+def test_load_context_unchanged(
+    benchmark, washer: HonDevice, run: Callable[..., Any]
+) -> None:
+    """An identical context, skipped by its fingerprint."""
+    benchmark(lambda: run(washer.load_context()))
+
+
+def test_load_commands_raw(benchmark, run: Callable[..., Any]) -> None:
+    """Cold boot: parse a 40-program catalogue."""
+    payload = build_catalogue()
+    device = HonDevice(MagicMock(), MagicMock(), build_appliance())
+    benchmark(lambda: run(device.load_commands(payload)))
+    assert len(device.commands["startProgram"].get_programs()) == 40
+
+
+def test_load_commands_from_table(benchmark, run: Callable[..., Any]) -> None:
+    """Warm boot: rebuild a 40-program catalogue from its compiled table."""
+    payload = build_catalogue()
+    table = compile_catalogue(payload)
+    device = HonDevice(MagicMock(), MagicMock(), build_appliance())
+    benchmark(lambda: run(device.load_commands(payload, table=table)))
+    assert len(device.commands["startProgram"].get_programs()) == 40
@@ -8,6 +8,7 @@ import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.hon.const import DOMAIN
+from custom_components.hon.tracing import HonTracer
 
 EMAIL = "test@example.com"
 PASSWORD = "test-password"
@@ -101,12 +102,14 @@ def mock_connection() -> MagicMock:
     connection.async_set = AsyncMock(return_value=True)
     connection.send_command = AsyncMock(return_value=True)
     connection.entry = None
+    connection.batch_polling = False
     connection.async_load_setup_cache = AsyncMock()
     connection.get_cached_setup = MagicMock(return_value=None)
     connection.store_setup_cache = MagicMock()
     connection.get_cached_appliances = MagicMock(return_value=None)
     connection.store_cached_appliances = MagicMock()
     connection.prune_coordinators = MagicMock()
+    connection.tracer = HonTracer()
     return connection
 
 
@@ -12,6 +12,13 @@ from custom_components.hon.coordinator import HonBaseCoordinator
 from tests.conftest import MAC
 
 
+def _key(item: Any) -> str:
+    """Turn a compiled key path back into its dotted key."""
+    if isinstance(item, tuple):
+        return ".".join(part for part, _ in item)
+    return item
+
+
 class FakeDevice:
     """A minimal HonDevice stand-in backed by a plain dict."""
 
@@ -25,8 +32,10 @@ class FakeDevice:
         self.attributes: dict[str, Any] = {}
         self.settings: dict[str, Any] = {}
         self.commands: dict[str, Any] = {}
+        self.expected: dict[str, Any] = {}
 
-    def get(self, item: str, default: Any = None) -> Any:
+    def get(self, item: Any, default: Any = None) -> Any:
+        item = _key(item)
         if item.startswith("attributes."):
             result: Any = self.attributes
             try:
@@ -37,15 +46,20 @@ class FakeDevice:
                 return default
         return self._data.get(item, default)
 
-    def getInt(self, item: str) -> int:
-        return int(self._data.get(item, 0))
+    def getInt(self, item: Any) -> int:
+        return int(self._data.get(_key(item), 0))
 
-    def getFloat(self, item: str) -> float:
-        return float(self._data.get(item, 0))
+    def getFloat(self, item: Any) -> float:
+        return float(self._data.get(_key(item), 0))
 
-    def has(self, item: str) -> bool:
+    def has(self, item: Any) -> bool:
         return self.get(item) is not None
 
+    data_version = 0
+
+    def changed_since(self, version: int, keys: Any = None) -> bool:
+        return True
+
     def getProgramName(self) -> Any:
         return self._program_name
 
@@ -71,6 +85,19 @@ class FakeDevice:
         self._last_command = command
         return command
 
+    def expect(self, parameters: dict) -> None:
+        self.expected.update(parameters)
+        self._data.update(parameters)
+
+    async def async_send(self, command: Any, expected: dict) -> Any:
+        self.expect(expected)
+        return await command.send()
+
+    async def send_settings(self, parameters: dict) -> bool:
+        # Sent straight away: batching is covered by the coordinator tests.
+        self.expect(parameters)
+        return await self.settings_command(parameters).send()
+
     def stop_command(self, parameters: dict | None = None):
         command = MagicMock()
         command.send = AsyncMock(return_value=True)
@@ -15,6 +15,7 @@ from homeassistant.components.climate import (
 from homeassistant.const import ATTR_TEMPERATURE
 
 from custom_components.hon.const import (
+    CLIMATE_HVAC_MODE,
     DOMAIN,
     ClimateSwingHorizontal,
     ClimateSwingVertical,
@@ -139,7 +140,7 @@ def test_climate_update_swing_mode(climate) -> None:
 
 async def test_climate_set_sleep_mode(climate) -> None:
     """async_set_sleep_mode sends the matching parameter."""
-    with patch.object(climate, "start_watcher", MagicMock()):
+    with patch.object(climate, "async_write_ha_state", MagicMock()):
         await climate.async_set_sleep_mode(True)
     climate._device._last_command.send.assert_awaited_once()
 
@@ -163,55 +164,14 @@ async def test_climate_set_sleep_mode(climate) -> None:
 )
 async def test_climate_setters(climate, method: str, kwargs, parameter: str) -> None:
     """The mode setters send a settings command."""
-    with patch.object(climate, "start_watcher", MagicMock()):
+    with patch.object(climate, "async_write_ha_state", MagicMock()):
         await getattr(climate, method)(**kwargs)
     climate._device._last_command.send.assert_awaited_once()
 
 
-def test_climate_start_watcher(climate) -> None:
-    """start_watcher schedules a state-change watcher."""
-    with (
-        patch("custom_components.hon.devices.climate.async_call_later") as call_later,
-        patch.object(climate, "async_write_ha_state", MagicMock()),
-    ):
-        call_later.return_value = MagicMock()
-        climate.start_watcher()
-    call_later.assert_called_once()
-    assert climate._watcher is not None
-
-
-def test_climate_start_watcher_cancels_previous(climate) -> None:
-    """start_watcher cancels any previous watcher."""
-    previous = MagicMock()
-    climate._watcher = previous
-    with (
-        patch("custom_components.hon.devices.climate.async_call_later") as call_later,
-        patch.object(climate, "async_write_ha_state", MagicMock()),
-    ):
-        call_later.return_value = MagicMock()
-        climate.start_watcher()
-    previous.assert_called_once()
-
-
-async def test_climate_update_after_state_change(climate) -> None:
-    """The watcher callback clears the watcher."""
-    climate._watcher = MagicMock()
-    await climate.async_update_after_state_change()
-    assert climate._watcher is None
-
-
-async def test_climate_will_remove_from_hass(climate) -> None:
-    """Removal cancels the watcher."""
-    watcher = MagicMock()
-    climate._watcher = watcher
-    await climate.async_will_remove_from_hass()
-    watcher.assert_called_once()
-    assert climate._watcher is None
-
-
 async def test_climate_set_temperature(climate) -> None:
     """async_set_temperature sends the new target."""
-    with patch.object(climate, "start_watcher", MagicMock()):
+    with patch.object(climate, "async_write_ha_state", MagicMock()):
         await climate.async_set_temperature(**{ATTR_TEMPERATURE: 25})
     climate._device._last_command.send.assert_awaited_once()
     assert climate.target_temperature == 25
@@ -236,18 +196,22 @@ async def test_climate_set_temperature_missing(climate) -> None:
 )
 async def test_climate_set_hvac_mode(climate, mode, command: str) -> None:
     """Each hvac mode maps to a stop/start command."""
-    with patch.object(climate, "start_watcher", MagicMock()):
+    with patch.object(climate, "async_write_ha_state", MagicMock()):
         await climate.async_set_hvac_mode(mode)
+    climate._device._last_command.send.assert_awaited_once()
     if command == "stop":
-        climate._device._last_command.send.assert_awaited_once()
+        assert climate._device.expected == {"onOffStatus": "0"}
     else:
-        climate._device._last_command.send.assert_awaited_once()
+        assert climate._device.expected == {
+            "onOffStatus": "1",
+            "machMode": CLIMATE_HVAC_MODE[mode],
+        }
     assert climate.hvac_mode == mode
 
 
 async def test_climate_turn_off(climate) -> None:
     """async_turn_off stops the device."""
-    with patch.object(climate, "start_watcher", MagicMock()):
+    with patch.object(climate, "async_write_ha_state", MagicMock()):
         await climate.async_turn_off()
     climate._device._last_command.send.assert_awaited_once()
     assert climate.hvac_mode == HVACMode.OFF
@@ -255,14 +219,14 @@ async def test_climate_turn_off(climate) -> None:
 
 async def test_climate_turn_on(climate) -> None:
     """async_turn_on starts the device."""
-    with patch.object(climate, "start_watcher", MagicMock()):
+    with patch.object(climate, "async_write_ha_state", MagicMock()):
         await climate.async_turn_on()
     climate._device._last_command.send.assert_awaited_once()
 
 
 async def test_climate_set_fan_mode(climate) -> None:
     """async_set_fan_mode sends the wind speed mapping."""
-    with patch.object(climate, "start_watcher", MagicMock()):
+    with patch.object(climate, "async_write_ha_state", MagicMock()):
         await climate.async_set_fan_mode("auto")
     climate._device._last_command.send.assert_awaited_once()
     assert climate.fan_mode == "auto"
@@ -270,7 +234,7 @@ async def test_climate_set_fan_mode(climate) -> None:
 
 async def test_climate_set_swing_mode_both(climate) -> None:
     """SWING_BOTH sets both directions to auto."""
-    with patch.object(climate, "start_watcher", MagicMock()):
+    with patch.object(climate, "async_write_ha_state", MagicMock()):
         await climate.async_set_swing_mode(SWING_BOTH)
     climate._device._last_command.send.assert_awaited_once()
     assert climate.swing_mode == SWING_BOTH
@@ -279,7 +243,7 @@ async def test_climate_set_swing_mode_both(climate) -> None:
 async def test_climate_set_swing_mode_horizontal(climate) -> None:
     """SWING_HORIZONTAL with a vertical auto keeps horizontal auto."""
     climate._device = make_device({"windDirectionVertical": ClimateSwingVertical.AUTO})
-    with patch.object(climate, "start_watcher", MagicMock()):
+    with patch.object(climate, "async_write_ha_state", MagicMock()):
         await climate.async_set_swing_mode(SWING_HORIZONTAL)
     climate._device._last_command.send.assert_awaited_once()
 
@@ -289,7 +253,7 @@ async def test_climate_set_swing_mode_vertical(climate) -> None:
     climate._device = make_device(
         {"windDirectionHorizontal": ClimateSwingHorizontal.AUTO}
     )
-    with patch.object(climate, "start_watcher", MagicMock()):
+    with patch.object(climate, "async_write_ha_state", MagicMock()):
         await climate.async_set_swing_mode(SWING_VERTICAL)
     climate._device._last_command.send.assert_awaited_once()
 
@@ -302,19 +266,12 @@ async def test_climate_set_swing_mode_off(climate) -> None:
             "windDirectionVertical": ClimateSwingVertical.AUTO,
         }
     )
-    with patch.object(climate, "start_watcher", MagicMock()):
+    with patch.object(climate, "async_write_ha_state", MagicMock()):
         await climate.async_set_swing_mode(SWING_OFF)
     climate._device._last_command.send.assert_awaited_once()
     assert climate.swing_mode == SWING_OFF
 
 
-def test_climate_watcher_blocks_update(climate) -> None:
-    """A running watcher suppresses coordinator updates."""
-    climate._watcher = MagicMock()
-    climate._handle_coordinator_update()
-    assert climate._watcher is not None
-
-
 def test_climate_float_temperature_step(hass, coordinator, appliance_climate) -> None:
     """A float temperature step is honoured from the setting."""
     device = make_device()
@@ -341,13 +298,13 @@ def test_climate_float_temperature_step(hass, coordinator, appliance_climate) ->
 
 async def test_climate_set_swing_mode_horizontal_plain(climate) -> None:
     """SWING_HORIZONTAL with a non-auto vertical keeps horizontal auto."""
-    with patch.object(climate, "start_watcher", MagicMock()):
+    with patch.object(climate, "async_write_ha_state", MagicMock()):
         await climate.async_set_swing_mode(SWING_HORIZONTAL)
     climate._device._last_command.send.assert_awaited_once()
 
 
 async def test_climate_set_swing_mode_vertical_plain(climate) -> None:
     """SWING_VERTICAL with a non-auto horizontal keeps vertical auto."""
-    with patch.object(climate, "start_watcher", MagicMock()):
+    with patch.object(climate, "async_write_ha_state", MagicMock()):
         await climate.async_set_swing_mode(SWING_VERTICAL)
     climate._device._last_command.send.assert_awaited_once()
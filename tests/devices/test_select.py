@@ -74,7 +74,7 @@ async def test_hon_select_select_option_settings(
     entity = HonSelect(None, coordinator, appliance, make_description())
 
     await entity.async_select_option("2")
-    coordinator.async_request_refresh.assert_awaited_once()
+    device._last_command.send.assert_awaited_once()
 
 
 async def test_hon_select_select_option_start_program(
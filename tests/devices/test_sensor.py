@@ -495,6 +495,40 @@ def test_hon_base_entity_coordinator_update_unavailable(
     update.assert_not_called()
 
 
+async def test_hon_base_entity_skips_unchanged_keys(
+    coordinator, appliance, mock_connection
+) -> None:
+    """Refreshes that leave the entity's keys untouched do not write state."""
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from tests.conftest import context_payload
+
+    mock_connection.async_get_context = AsyncMock(
+        side_effect=[
+            context_payload()["payload"],
+            context_payload({"tempSel": "60"})["payload"],
+            context_payload({"tempSel": "60", "machMode": "2"})["payload"],
+        ]
+    )
+    device = coordinator.device
+    await device.load_context()
+    entity = HonBaseSensorEntity(coordinator, appliance, "tempSel", "T")
+    with patch.object(entity, "async_write_ha_state", MagicMock()) as write:
+        entity._handle_coordinator_update()
+        assert write.call_count == 1
+        entity._handle_coordinator_update()
+        assert write.call_count == 1
+
+        await device.load_context()
+        entity._handle_coordinator_update()
+        assert write.call_count == 2
+        assert entity.native_value == "60"
+
+        await device.load_context()
+        entity._handle_coordinator_update()
+        assert write.call_count == 2
+
+
 def test_hon_base_entity_coordinator_update_not_implemented(
     coordinator, appliance, make_device
 ) -> None:
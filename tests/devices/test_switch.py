@@ -220,7 +220,7 @@ async def test_switch_turn_on_range_setting(
         await entity.async_turn_on()
 
     assert setting.value == 5
-    command.send.assert_awaited_once()
+    coordinator._device._last_command.send.assert_awaited_once()
     coordinator._device.set.assert_called_once_with("muteStatus", "5")
 
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from homeassistant.const import STATE_OFF
@@ -89,10 +89,7 @@ def test_water_heater_name(water_heater, appliance) -> None:
 
 async def test_water_heater_set_temperature(water_heater) -> None:
     """async_set_temperature sends the new target."""
-    with (
-        patch.object(water_heater, "start_watcher", MagicMock()),
-        patch.object(water_heater, "async_write_ha_state", MagicMock()),
-    ):
+    with patch.object(water_heater, "async_write_ha_state", MagicMock()):
         await water_heater.async_set_temperature(temperature=65)
     water_heater._device._last_command.send.assert_awaited_once()
     assert water_heater.target_temperature == 65
@@ -106,10 +103,7 @@ async def test_water_heater_set_temperature_missing(water_heater) -> None:
 
 async def test_water_heater_set_operation_mode_off(water_heater) -> None:
     """Turning the operation off stops the device."""
-    with (
-        patch.object(water_heater, "start_watcher", MagicMock()),
-        patch.object(water_heater, "async_write_ha_state", MagicMock()),
-    ):
+    with patch.object(water_heater, "async_write_ha_state", MagicMock()):
         await water_heater.async_set_operation_mode(STATE_OFF)
     water_heater._device._last_command.send.assert_awaited_once()
     assert water_heater.current_operation == STATE_OFF
@@ -117,10 +111,7 @@ async def test_water_heater_set_operation_mode_off(water_heater) -> None:
 
 async def test_water_heater_set_operation_mode_live(water_heater) -> None:
     """A live mode change keeps the current temperature."""
-    with (
-        patch.object(water_heater, "start_watcher", MagicMock()),
-        patch.object(water_heater, "async_write_ha_state", MagicMock()),
-    ):
+    with patch.object(water_heater, "async_write_ha_state", MagicMock()):
         await water_heater.async_set_operation_mode("Max")
     water_heater._device._last_command.send.assert_awaited_once()
     assert water_heater.current_operation == "Max"
@@ -129,65 +120,29 @@ async def test_water_heater_set_operation_mode_live(water_heater) -> None:
 async def test_water_heater_set_operation_mode_powered_off(water_heater) -> None:
     """Starting a mode while off restarts with the matching program."""
     water_heater._device = make_device({"onOffStatus": "0"})
-    with (
-        patch.object(water_heater, "start_watcher", MagicMock()),
-        patch.object(water_heater, "async_write_ha_state", MagicMock()),
-    ):
+    with patch.object(water_heater, "async_write_ha_state", MagicMock()):
         await water_heater.async_set_operation_mode("BPS")
     water_heater._device._last_command.send.assert_awaited_once()
+    assert water_heater._device.expected == {"onOffStatus": "1", "machMode": "3"}
     assert water_heater.current_operation == "BPS"
 
 
 async def test_water_heater_turn_on(water_heater) -> None:
     """async_turn_on starts the current mode's program."""
-    with (
-        patch.object(water_heater, "start_watcher", MagicMock()),
-        patch.object(water_heater, "async_write_ha_state", MagicMock()),
-    ):
+    with patch.object(water_heater, "async_write_ha_state", MagicMock()):
         await water_heater.async_turn_on()
     water_heater._device._last_command.send.assert_awaited_once()
 
 
 async def test_water_heater_turn_off(water_heater) -> None:
     """async_turn_off stops the device."""
-    with (
-        patch.object(water_heater, "start_watcher", MagicMock()),
-        patch.object(water_heater, "async_write_ha_state", MagicMock()),
-    ):
+    with patch.object(water_heater, "async_write_ha_state", MagicMock()):
         await water_heater.async_turn_off()
     water_heater._device._last_command.send.assert_awaited_once()
+    assert water_heater._device.expected == {"onOffStatus": "0"}
     assert water_heater.current_operation == STATE_OFF
 
 
-def test_water_heater_watcher(water_heater) -> None:
-    """start_watcher tracks a time interval and is cleared on callback."""
-    with patch(
-        "custom_components.hon.devices.water_heater.async_track_time_interval"
-    ) as track:
-        track.return_value = MagicMock()
-        water_heater.start_watcher()
-    track.assert_called_once()
-    assert water_heater._watcher is not None
-
-
-def test_water_heater_watcher_cleared(water_heater) -> None:
-    """The watcher callback clears the watcher and requests a refresh."""
-    watcher = MagicMock()
-    water_heater._watcher = watcher
-    water_heater._coordinator.async_request_refresh = AsyncMock()
-    water_heater._watcher = watcher
-
-    import asyncio
-
-    async def run():
-        await water_heater._clear_watcher()
-        watcher.assert_called_once()
-        assert water_heater._watcher is None
-        water_heater._coordinator.async_request_refresh.assert_awaited_once()
-
-    asyncio.run(run())
-
-
 async def test_water_heater_handle_coordinator_update(water_heater) -> None:
     """The coordinator update refreshes the device values."""
     with patch.object(water_heater, "async_write_ha_state", MagicMock()):
@@ -195,34 +150,6 @@ async def test_water_heater_handle_coordinator_update(water_heater) -> None:
     assert water_heater.current_temperature == 40.0
 
 
-async def test_water_heater_handle_coordinator_update_watcher(water_heater) -> None:
-    """A running watcher suppresses coordinator updates."""
-    water_heater._watcher = MagicMock()
-    water_heater._handle_coordinator_update()
-    assert water_heater._watcher is not None
-
-
-async def test_water_heater_will_remove_from_hass(water_heater) -> None:
-    """Removal cancels the watcher."""
-    watcher = MagicMock()
-    water_heater._watcher = watcher
-    await water_heater.async_will_remove_from_hass()
-    watcher.assert_called_once()
-    assert water_heater._watcher is None
-
-
-def test_water_heater_watcher_cancels_previous(water_heater) -> None:
-    """start_watcher cancels any previous watcher."""
-    previous = MagicMock()
-    water_heater._watcher = previous
-    with patch(
-        "custom_components.hon.devices.water_heater.async_track_time_interval"
-    ) as track:
-        track.return_value = MagicMock()
-        water_heater.start_watcher()
-    previous.assert_called_once()
-
-
 async def test_water_heater_handle_coordinator_update_data_false(
     water_heater,
 ) -> None:
@@ -0,0 +1,316 @@
+"""Offline stand-in for the hOn cloud, for load and failure testing.
+
+:class:`HonCloudSimulator` serves the endpoints :class:`HonConnection`
+talks to (CIAM login, appliance list, command catalogue, context,
+statistics and command sending) from a local aiohttp server, for any number
+of synthetic appliances built with :func:`tests.conftest.build_appliance`.
+Latency, random error rates and scripted 401/429 answers make the real
+request path (rate limiter, retries, backoff, re-auth, circuit breakers)
+run exactly as against the cloud::
+
+    async with HonCloudSimulator(appliances=50, latency=0.05) as cloud:
+        connection = HonConnection(None, None, EMAIL, PASSWORD)
+        connection._session = cloud.session()
+        await connection.async_authorize()
+
+The server answers on ``127.0.0.1``; :meth:`HonCloudSimulator.session`
+returns a client session that sends requests for ``API_URL`` to it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import random
+import secrets
+from collections import Counter, defaultdict, deque
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from custom_components.hon.const import API_URL
+from tests.conftest import EMAIL, PASSWORD, build_appliance
+
+# Per-parameter catalogue attributes of the synthetic washing machines.
+_PROGRAM_PARAMETERS = {
+    "temp": {
+        "typology": "range",
+        "minimumValue": "0",
+        "maximumValue": "90",
+        "incrementValue": "10",
+        "defaultValue": "40",
+    },
+    "spinSpeed": {
+        "typology": "range",
+        "minimumValue": "0",
+        "maximumValue": "1400",
+        "incrementValue": "200",
+        "defaultValue": "1000",
+    },
+    "dryLevel": {"typology": "enum", "enumValues": ["0", "1", "2", "3"]},
+    "lang": {"typology": "fixed", "fixedValue": "1"},
+}
+
+
+def simulated_mac(index: int) -> str:
+    """Return the MAC address of the ``index``-th synthetic appliance."""
+    return "02-00-" + "-".join(f"{byte:02x}" for byte in index.to_bytes(4, "big"))
+
+
+def build_catalogue(programs: int = 10) -> dict[str, Any]:
+    """Return a command catalogue with a multi-program ``startProgram``."""
+    return {
+        "applianceModel": {"applianceModelId": "model-1"},
+        "options": {},
+        "dictionaryId": "dictionary",
+        "settings": {"parameters": dict(_PROGRAM_PARAMETERS)},
+        "stopProgram": {
+            "parameters": {"onOffStatus": {"typology": "fixed", "fixedValue": "0"}}
+        },
+        "startProgram": {
+            f"PROGRAMS.WM.PROGRAM_{index}": {
+                "parameters": {
+                    **_PROGRAM_PARAMETERS,
+                    "prCode": {"typology": "fixed", "fixedValue": str(index)},
+                }
+            }
+            for index in range(programs)
+        },
+    }
+
+
+class HonCloudSimulator:
+    """A scriptable, in-process hOn cloud.
+
+    ``latency`` (plus a uniform ``jitter``) delays every answer, and
+    ``error_rate`` answers that share of the API requests with a 503.
+    :meth:`inject` scripts the next answers of one endpoint and
+    :meth:`expire_tokens` revokes the issued tokens, so the client has to
+    log in again. ``requests`` and ``statuses`` count what was served.
+    """
+
+    def __init__(
+        self,
+        appliances: int = 1,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        programs: int = 10,
+        seed: int | None = 0,
+    ) -> None:
+        """Initialize the simulator with ``appliances`` synthetic washers."""
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.appliances = [
+            build_appliance(
+                mac=simulated_mac(index),
+                nick_name=f"Washer {index}",
+                extra={"serialNumber": f"SN{index:06d}"},
+            )
+            for index in range(appliances)
+        ]
+        self.catalogue = build_catalogue(programs)
+        self.statistics = {"totalWashCycle": "12", "totalWaterUsed": "540"}
+        self.requests: Counter[str] = Counter()
+        self.statuses: Counter[int] = Counter()
+        self.commands: list[dict[str, Any]] = []
+        self._random = random.Random(seed)
+        self._scripted: dict[str, deque[tuple[int, dict[str, str]]]] = defaultdict(
+            deque
+        )
+        self._challenges: dict[str, str] = {}
+        self._tokens: tuple[str, str] | None = None
+        self._polls: Counter[str] = Counter()
+        self._server: TestServer | None = None
+        self._sessions: list[aiohttp.ClientSession] = []
+
+    async def __aenter__(self) -> HonCloudSimulator:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    @property
+    def url(self) -> str:
+        """Return the base URL the simulator answers on."""
+        assert self._server is not None
+        return str(self._server.make_url("")).rstrip("/")
+
+    async def start(self) -> None:
+        """Start serving on an ephemeral local port."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/ciam/authorize", self._authorize)
+        app.router.add_post("/ciam/token", self._token)
+        app.router.add_post("/unified-api/v1/view/appliance-list", self._list)
+        app.router.add_get("/commands/v1/retrieve", self._retrieve)
+        app.router.add_get("/commands/v1/context", self._context)
+        app.router.add_get("/commands/v1/statistics", self._statistics)
+        app.router.add_post("/commands/v1/send", self._send)
+        self._server = TestServer(app, host="127.0.0.1")
+        await self._server.start_server()
+
+    async def close(self) -> None:
+        """Close the client sessions handed out, then the server."""
+        for session in self._sessions:
+            await session.close()
+        self._sessions.clear()
+        if self._server is not None:
+            await self._server.close()
+            self._server = None
+
+    def session(self, **kwargs: Any) -> SimulatorSession:
+        """Return a client session sending the ``API_URL`` requests here."""
+        session = aiohttp.ClientSession(**kwargs)
+        self._sessions.append(session)
+        return SimulatorSession(session, self.url)
+
+    def inject(self, path: str, *statuses: int, **headers: str) -> None:
+        """Answer the next requests to ``path`` with ``statuses``, in order.
+
+        ``headers`` are added to these answers, e.g.
+        ``inject("/commands/v1/context", 429, retry_after="1")``.
+        """
+        extra = {
+            name.replace("_", "-").title(): value for name, value in headers.items()
+        }
+        self._scripted[path].extend((status, extra) for status in statuses)
+
+    def expire_tokens(self) -> None:
+        """Revoke the issued tokens: authenticated requests now get a 401."""
+        self._tokens = None
+
+    @web.middleware
+    async def _middleware(
+        self, request: web.Request, handler: Any
+    ) -> web.StreamResponse:
+        path = request.path
+        self.requests[path] += 1
+        delay = self.latency + (
+            self._random.uniform(0, self.jitter) if self.jitter else 0
+        )
+        if delay:
+            await asyncio.sleep(delay)
+        response: web.StreamResponse
+        if self._scripted[path]:
+            status, headers = self._scripted[path].popleft()
+            response = web.json_response({}, status=status, headers=headers)
+        elif not path.startswith("/ciam/") and not self._authenticated(request):
+            response = web.json_response({}, status=401)
+        elif self.error_rate and self._random.random() < self.error_rate:
+            response = web.json_response({}, status=503)
+        else:
+            response = await handler(request)
+        self.statuses[response.status] += 1
+        return response
+
+    def _authenticated(self, request: web.Request) -> bool:
+        return (
+            self._tokens is not None
+            and (
+                request.headers.get("cognito-token"),
+                request.headers.get("id-token"),
+            )
+            == self._tokens
+        )
+
+    async def _authorize(self, request: web.Request) -> web.Response:
+        query = request.query
+        if query.get("username") != EMAIL or query.get("password") != PASSWORD:
+            return web.json_response({})
+        session_id = secrets.token_hex(8)
+        self._challenges[session_id] = query.get("code_challenge", "")
+        return web.json_response({"session_id": session_id})
+
+    async def _token(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        challenge = self._challenges.pop(body.get("session_id"), None)
+        verifier = body.get("code_verifier", "").encode()
+        expected = (
+            base64.urlsafe_b64encode(hashlib.sha256(verifier).digest())
+            .rstrip(b"=")
+            .decode()
+        )
+        if challenge is None or challenge != expected:
+            return web.json_response({}, status=401)
+        self._tokens = (secrets.token_hex(8), secrets.token_hex(8))
+        return web.json_response(
+            {
+                "tokens": {
+                    "cognito_token": self._tokens[0],
+                    "id_token": self._tokens[1],
+                    "refresh_token": secrets.token_hex(8),
+                }
+            }
+        )
+
+    async def _list(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"modules": {"applianceList": {"payload": {"appliances": self.appliances}}}}
+        )
+
+    async def _retrieve(self, request: web.Request) -> web.Response:
+        return web.json_response({"payload": {"resultCode": "0", **self.catalogue}})
+
+    async def _context(self, request: web.Request) -> web.Response:
+        # Every poll of an appliance advances its countdown by a minute.
+        mac = request.query.get("macAddress", "")
+        poll = self._polls[mac]
+        self._polls[mac] += 1
+        remaining = max(0, 60 - poll)
+        parameters = {
+            "onOffStatus": "1",
+            "machMode": "2" if remaining else "1",
+            "remainingTimeMM": str(remaining),
+            "temp": "40",
+        }
+        return web.json_response(
+            {
+                "payload": {
+                    "shadow": {
+                        "parameters": {
+                            name: {"parNewVal": value, "lastUpdate": f"{name}-{poll}"}
+                            for name, value in parameters.items()
+                        }
+                    },
+                    "lastConnEvent": {"category": "CONNECTED"},
+                }
+            }
+        )
+
+    async def _statistics(self, request: web.Request) -> web.Response:
+        etag = '"' + hashlib.sha1(repr(self.statistics).encode()).hexdigest() + '"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.json_response({"payload": self.statistics}, headers={"ETag": etag})
+
+    async def _send(self, request: web.Request) -> web.Response:
+        self.commands.append(await request.json())
+        return web.json_response({"payload": {"resultCode": "0"}})
+
+
+class SimulatorSession:
+    """A client session redirecting the ``API_URL`` requests to a simulator.
+
+    Only :meth:`request` (what :class:`HonConnection` uses) is provided.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, url: str) -> None:
+        """Initialize the session over a real aiohttp session."""
+        self._session = session
+        self._url = url
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send ``method`` to the simulator instead of the hOn cloud."""
+        if url.startswith(API_URL):
+            url = self._url + url[len(API_URL) :]
+        return self._session.request(method, url, **kwargs)
+
+    async def close(self) -> None:
+        """Close the underlying session."""
+        await self._session.close()
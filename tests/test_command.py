@@ -4,7 +4,11 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock
 
-from custom_components.hon.command import HonCommand
+from custom_components.hon.command import (
+    HonCommand,
+    HonProgramCatalogue,
+    compile_catalogue,
+)
 from custom_components.hon.parameter import (
     HonParameterEnum,
     HonParameterFixed,
@@ -50,6 +54,11 @@ def test_command_creates_typed_parameters() -> None:
     assert isinstance(command.parameters["lockStatus"], HonParameterFixed)
 
 
+def test_command_uses_slots() -> None:
+    """Commands carry no per-instance __dict__."""
+    assert not hasattr(make_command(), "__dict__")
+
+
 def test_command_ancillary_parameters() -> None:
     """ancillary_parameters returns the current values."""
     command = make_command()
@@ -153,3 +162,120 @@ def test_command_dump() -> None:
     assert "machMode" in text
     assert "lockStatus" not in text
     assert example == "{'tempSel':3,'machMode':None}"
+
+
+def _programs(count: int) -> dict:
+    """Build raw per-program payloads for a catalogue."""
+    return {
+        f"program{index}": {
+            "parameters": {
+                "tempSel": {
+                    "typology": "range",
+                    "minimumValue": "0",
+                    "maximumValue": "6",
+                    "incrementValue": "1",
+                    "defaultValue": str(index % 6),
+                },
+                f"only{index}": {"typology": "enum", "enumValues": ["0", "1"]},
+                "prCode": {"typology": "fixed", "fixedValue": str(index)},
+            }
+        }
+        for index in range(count)
+    }
+
+
+def test_program_catalogue_builds_on_demand() -> None:
+    """Listing programs builds nothing; lookups build and keep one command."""
+    device = MagicMock()
+    catalogue = HonProgramCatalogue("startProgram", _programs(10), MagicMock(), device)
+    assert len(catalogue) == 10
+    assert "program3" in catalogue
+    assert list(catalogue)[0] == "program0"
+    assert catalogue.builds == 0
+
+    command = catalogue["program3"]
+    assert catalogue["program3"] is command
+    assert catalogue.builds == 1
+    assert command.get_programs() is catalogue
+    assert command.parameters["program"].values[:2] == ("program0", "program1")
+
+    command.parameters["tempSel"].value = 5
+    for index in range(10):
+        catalogue[f"program{index}"]
+    # Built programs are kept with the values set on them.
+    assert catalogue["program3"] is command
+    assert command.parameters["tempSel"].value == 5
+    assert catalogue.builds == 10
+
+
+def test_program_catalogue_settings_of_other_programs() -> None:
+    """setting_keys come from the payloads, settings from built programs."""
+    catalogue = HonProgramCatalogue(
+        "startProgram", _programs(3), MagicMock(), MagicMock()
+    )
+    command = catalogue["program0"]
+    assert set(command.setting_keys) == {
+        "tempSel",
+        "only0",
+        "only1",
+        "only2",
+        "program",
+    }
+    assert catalogue.builds == 1
+    settings = command.settings
+    assert settings["tempSel"] is command.parameters["tempSel"]
+    assert settings["only2"].values == ("0", "1")
+    # A setting of another program belongs to that program's command.
+    assert settings["only2"] is catalogue["program2"].parameters["only2"]
+    assert catalogue.builds == 3
+
+
+def test_program_catalogue_set_program() -> None:
+    """set_program builds the selected program and makes it active."""
+    device = MagicMock()
+    device.commands = {}
+    catalogue = HonProgramCatalogue("startProgram", _programs(3), MagicMock(), device)
+    command = catalogue["program0"]
+    command.parameters["program"].value = "program2"
+    assert device.commands["startProgram"] is catalogue["program2"]
+    assert device.commands["startProgram"].parameters["prCode"].value == "2"
+
+
+def test_command_settings_are_cached() -> None:
+    """setting_keys/settings are built once until invalidated."""
+    command = make_command()
+    assert command.settings is command.settings
+    assert command.setting_keys is command.setting_keys
+    command.invalidate_settings()
+    assert set(command.settings) == {"tempSel", "machMode"}
+
+
+def test_compile_catalogue_roundtrip() -> None:
+    """Commands rebuilt from the compiled table match the parsed ones."""
+    table = compile_catalogue({"applianceModel": {}, "startProgram": base_attributes()})
+    spec = table["commands"]["startProgram"]["command"]
+    restored = HonCommand.from_spec("startProgram", spec, MagicMock(), MagicMock())
+    command = make_command()
+    assert list(restored.parameters) == list(command.parameters)
+    for key, parameter in command.parameters.items():
+        assert type(restored.parameters[key]) is type(parameter)
+        assert restored.parameters[key].spec() == parameter.spec()
+        assert restored.parameters[key].value == parameter.value
+    assert restored.ancillary_parameters == command.ancillary_parameters
+    assert restored.setting_keys == command.setting_keys
+
+
+def test_program_catalogue_compiled() -> None:
+    """A catalogue over compiled entries builds the same programs."""
+    payload = {"startProgram": _programs(3)}
+    programs = compile_catalogue(payload)["commands"]["startProgram"]["programs"]
+    compiled = HonProgramCatalogue(
+        "startProgram", programs, MagicMock(), MagicMock(), compiled=True
+    )
+    raw = HonProgramCatalogue("startProgram", _programs(3), MagicMock(), MagicMock())
+    assert list(compiled) == list(raw)
+    assert compiled.setting_keys == raw.setting_keys
+    assert compiled.find_parameter("only1").values == ("0", "1")
+    assert compiled.find_parameter("prCode") is None
+    assert compiled["program2"].parameters["prCode"].value == "2"
+    assert compiled.builds == 2
@@ -0,0 +1,125 @@
+"""Tests for the debounced per-appliance command queue."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.hon.command_queue import HonCommandQueue
+from custom_components.hon.coordinator import HonBaseCoordinator
+from tests.conftest import MAC
+
+
+async def test_changes_in_window_are_sent_once(hass) -> None:
+    """Changes submitted together leave as one merged send and one refresh."""
+    send = AsyncMock(return_value=True)
+    refresh = AsyncMock()
+    queue = HonCommandQueue(hass, send, refresh=refresh, delay=0)
+
+    results = await asyncio.gather(
+        queue.async_submit({"windSpeed": "2"}),
+        queue.async_submit({"tempSel": "21", "windSpeed": "3"}),
+        queue.async_submit({"windDirectionVertical": "8"}),
+    )
+
+    assert results == [True, True, True]
+    send.assert_awaited_once_with(
+        {"windSpeed": "3", "tempSel": "21", "windDirectionVertical": "8"}
+    )
+    refresh.assert_awaited_once()
+    assert queue.stats() == {"batches": 1, "merged": 2}
+
+
+async def test_sends_sharing_a_lock_never_overlap(hass) -> None:
+    """Two queues of one appliance wait for each other's send."""
+    lock = asyncio.Lock()
+    running: list[str] = []
+    overlaps: list[list[str]] = []
+
+    def make_send(name: str) -> Any:
+        async def send(parameters: dict[str, Any]) -> bool:
+            running.append(name)
+            overlaps.append(list(running))
+            await asyncio.sleep(0)
+            running.remove(name)
+            return True
+
+        return send
+
+    first = HonCommandQueue(hass, make_send("first"), lock=lock, delay=0)
+    second = HonCommandQueue(hass, make_send("second"), lock=lock, delay=0)
+    await asyncio.gather(first.async_submit({"a": 1}), second.async_submit({"b": 2}))
+    assert overlaps == [["first"], ["second"]]
+
+
+async def test_send_error_reaches_every_caller(hass) -> None:
+    """A failed send raises in every caller and skips the refresh."""
+    refresh = AsyncMock()
+    queue = HonCommandQueue(
+        hass, AsyncMock(side_effect=TimeoutError), refresh=refresh, delay=0
+    )
+    results = await asyncio.gather(
+        queue.async_submit({"a": 1}),
+        queue.async_submit({"b": 2}),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, TimeoutError) for result in results)
+    refresh.assert_not_awaited()
+
+
+async def test_rejected_send_skips_the_refresh(hass) -> None:
+    """A send rejected by the cloud (False) does not trigger a refresh."""
+    refresh = AsyncMock()
+    queue = HonCommandQueue(
+        hass, AsyncMock(return_value=False), refresh=refresh, delay=0
+    )
+    assert await queue.async_submit({"a": 1}) is False
+    refresh.assert_not_awaited()
+
+
+async def test_next_change_starts_a_new_batch(hass) -> None:
+    """A change made after a batch was sent goes out in the next one."""
+    send = AsyncMock(return_value=True)
+    queue = HonCommandQueue(hass, send, delay=0)
+    await queue.async_submit({"a": 1})
+    await queue.async_submit({"a": 2})
+    assert [call.args[0] for call in send.await_args_list] == [{"a": 1}, {"a": 2}]
+
+
+async def test_unload_cancels_pending_batch(hass, config_entry) -> None:
+    """Unloading the entry drops the pending batch and cancels its callers."""
+    send = AsyncMock(return_value=True)
+    queue = HonCommandQueue(hass, send, delay=60, entry=config_entry)
+    call = asyncio.ensure_future(queue.async_submit({"a": 1}))
+    await asyncio.sleep(0)
+    assert config_entry._background_tasks
+
+    await config_entry._async_process_on_unload(hass)
+
+    assert not config_entry._background_tasks
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    send.assert_not_awaited()
+    assert queue.stats() == {"batches": 0, "merged": 0}
+
+
+async def test_coordinator_merges_concurrent_set_calls(
+    hass, mock_connection, appliance
+) -> None:
+    """Concurrent coordinator.async_set calls become one cloud command."""
+    coordinator = HonBaseCoordinator(
+        hass, mock_connection, appliance, timedelta(seconds=60)
+    )
+    coordinator._set_queue._delay = 0
+    await asyncio.gather(
+        coordinator.async_set({"lightStatus": "1"}),
+        coordinator.async_set({"healthMode": "1"}),
+    )
+    mock_connection.async_set.assert_awaited_once_with(
+        MAC, "WM", {"lightStatus": "1", "healthMode": "1"}
+    )
+    assert coordinator.command_stats["set"] == {"batches": 1, "merged": 1}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -10,9 +11,9 @@ import pytest
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from custom_components.hon.api.exceptions import HonConnectionError
+from custom_components.hon.api.exceptions import HonConnectionError, HonRateLimitError
 from custom_components.hon.coordinator import HonBaseCoordinator
-from tests.conftest import EMAIL, MAC, build_appliance
+from tests.conftest import EMAIL, MAC, build_appliance, context_payload
 
 
 @pytest.fixture
@@ -35,6 +36,8 @@ async def test_async_update_data_success(coordinator) -> None:
         TimeoutError("timeout"),
         KeyError("missing"),
         TypeError("bad"),
+        HonConnectionError("circuit open"),
+        HonRateLimitError("throttled"),
     ],
 )
 async def test_async_update_data_failures(
@@ -137,7 +140,11 @@ async def test_async_setup_cold_persists_cache(coordinator, mock_connection) ->
     ):
         await coordinator._async_setup()
     mock_connection.store_setup_cache.assert_called_once_with(
-        MAC, "5.30.0", commands_payload, statistics_payload
+        MAC,
+        "5.30.0",
+        commands_payload,
+        statistics_payload,
+        statistics_state=coordinator.device.statistics_state,
     )
 
 
@@ -165,15 +172,18 @@ async def test_async_setup_warm_uses_cache(
         patch.object(coordinator.device, "load_context", AsyncMock()) as load_context,
     ):
         await coordinator._async_setup()
-        load_commands.assert_awaited_once_with({"c": 1})
-        load_statistics.assert_awaited_once_with({"s": 2})
+        load_commands.assert_awaited_once_with({"c": 1}, table=None)
+        load_statistics.assert_awaited_once_with({"s": 2}, state=None)
         load_context.assert_awaited_once()
         mock_connection.store_setup_cache.assert_not_called()
         await hass.async_block_till_done(wait_background_tasks=True)
-    # The deferred refresh re-fetched the live payloads and persisted them.
+    # The deferred refresh re-fetched the live payloads and persisted them;
+    # statistics without a fetch time count as expired.
     assert load_commands.await_count == 2
     assert load_commands.await_args.args == ()
+    assert load_statistics.await_args.args == ()
     mock_connection.store_setup_cache.assert_called_once()
+    mock_connection.store_cached_statistics.assert_called_once()
 
 
 async def test_async_setup_warm_without_entry_skips_refresh(
@@ -221,9 +231,117 @@ async def test_deferred_refresh_failure_keeps_cache(
     mock_connection.store_setup_cache.assert_not_called()
 
 
+async def test_program_end_refreshes_statistics(
+    hass, mock_connection, appliance, config_entry
+) -> None:
+    """A program end triggers one background statistics refresh."""
+    mock_connection.entry = config_entry
+    coordinator = HonBaseCoordinator(
+        hass, mock_connection, appliance, timedelta(seconds=60)
+    )
+    device = coordinator.device
+    await device.load_statistics({}, state={"time": time.time(), "validators": {}})
+    await coordinator._async_update_data()  # machMode "1": idle
+    mock_connection.async_get_context = AsyncMock(
+        return_value=context_payload({"machMode": "2"})["payload"]
+    )
+    await coordinator._async_update_data()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    mock_connection.load_statistics.assert_not_awaited()
+
+    mock_connection.async_get_context = AsyncMock(
+        return_value=context_payload()["payload"]
+    )
+    mock_connection.load_statistics = AsyncMock(return_value={"totalWashCycle": 9})
+    await coordinator._async_update_data()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    mock_connection.load_statistics.assert_awaited_once()
+    assert device.statistics == {"totalWashCycle": 9}
+    mock_connection.store_cached_statistics.assert_called_once_with(
+        MAC, {"totalWashCycle": 9}, device.statistics_state
+    )
+
+
 def test_apply_appliance_update(coordinator) -> None:
     """The fresh appliance payload replaces the cached one in place."""
     fresh = build_appliance(extra={"fwVersion": "9.9.9"})
     coordinator.apply_appliance_update(fresh)
     assert coordinator.device.appliance["fwVersion"] == "9.9.9"
     assert coordinator.device.appliance is coordinator._appliance
+
+
+async def test_unchanged_context_skips_fan_out(coordinator, mock_connection) -> None:
+    """An identical context skips the listener callbacks and is counted."""
+    mock_connection.async_get_context = AsyncMock(
+        side_effect=lambda device: context_payload()["payload"]
+    )
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+    await coordinator.async_refresh()
+    assert listener.call_count == 1
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert listener.call_count == 1
+    assert coordinator.skipped_fan_outs == 2
+
+    coordinator.device.set("machMode", "3")
+    await coordinator.async_refresh()
+    assert listener.call_count == 2
+
+    mock_connection.async_get_context = AsyncMock(
+        return_value=context_payload({"machMode": "5"})["payload"]
+    )
+    await coordinator.async_refresh()
+    assert listener.call_count == 3
+    unsub()
+
+
+async def test_recovery_does_not_skip_fan_out(coordinator, mock_connection) -> None:
+    """A refresh after a failed one always notifies the entities."""
+    mock_connection.async_get_context = AsyncMock(
+        side_effect=lambda device: context_payload()["payload"]
+    )
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+    await coordinator.async_refresh()
+    coordinator.last_update_success = False
+    await coordinator.async_refresh()
+    assert listener.call_count == 2
+    assert coordinator.skipped_fan_outs == 0
+    unsub()
+
+
+async def test_adaptive_interval_follows_activity(
+    hass, mock_connection, appliance
+) -> None:
+    """With a polling profile the interval tracks the device state."""
+    from custom_components.hon.polling import PROGRAM_PROFILE
+
+    coordinator = HonBaseCoordinator(
+        hass,
+        mock_connection,
+        appliance,
+        timedelta(seconds=60),
+        polling_profile=PROGRAM_PROFILE,
+    )
+    mock_connection.async_get_context = AsyncMock(
+        return_value=context_payload({"machMode": "2"})["payload"]
+    )
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=30)
+    assert not coordinator.poll_due()
+
+    mock_connection.async_get_context = AsyncMock(
+        return_value=context_payload({"onOffStatus": "0"})["payload"]
+    )
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=600)
+
+
+async def test_fixed_interval_without_profile(coordinator) -> None:
+    """Without a polling profile the configured interval is kept."""
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=60)
+    assert coordinator.poll_interval is None
+    assert coordinator.poll_due()
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from custom_components.hon.const import DOMAIN
+from custom_components.hon.command import compile_catalogue
+from custom_components.hon.const import DOMAIN, OPTIMISTIC_TIMEOUT
 from custom_components.hon.devices.device import HonDevice
+from custom_components.hon.helpers import compile_key_path
 from custom_components.hon.parameter import HonParameterRange
 from tests.conftest import MAC, build_appliance
 
@@ -34,6 +37,17 @@ def test_device_getitem_dotted(device) -> None:
     assert device["attributes.errors.1"] == "E2"
 
 
+def test_device_getitem_compiled_path(device) -> None:
+    """Compiled paths resolve exactly like their dotted keys."""
+    device.attributes["parameters"] = {"tempSel": "40"}
+    device.attributes["errors"] = ["E1", "E2"]
+    assert device[compile_key_path("tempSel")] == "40"
+    assert device[compile_key_path("macAddress")] == MAC
+    assert device.get(compile_key_path("attributes.errors.1")) == "E2"
+    assert device.get(compile_key_path("attributes.errors.5"), "x") == "x"
+    assert device.getInt(compile_key_path("tempSel")) == 40
+
+
 def test_device_getitem_missing_raises(device) -> None:
     """__getitem__ raises KeyError for unknown keys."""
     with pytest.raises(KeyError):
@@ -103,6 +117,224 @@ async def test_device_load_context_no_parameters(device, mock_connection) -> Non
     assert "parameters" not in device.attributes
 
 
+def _context(**parameters):
+    """Build a context payload with the given shadow parameters."""
+    return {
+        "lastConnEvent": {"category": "CONNECTED"},
+        "shadow": {
+            "parameters": {
+                name: {"parNewVal": value} for name, value in parameters.items()
+            }
+        },
+    }
+
+
+async def test_device_load_context_changed_keys(device, mock_connection) -> None:
+    """load_context diffs the new context against the previous one."""
+    mock_connection.async_get_context = AsyncMock(
+        side_effect=[
+            _context(machMode="1", onOffStatus="1"),
+            _context(machMode="1", onOffStatus="1"),
+            _context(machMode="2", onOffStatus="1"),
+        ]
+    )
+    await device.load_context()
+    assert device.changed_keys == {
+        "machMode",
+        "onOffStatus",
+        "attributes.lastConnEvent",
+    }
+    await device.load_context()
+    assert device.changed_keys == frozenset()
+    await device.load_context()
+    assert device.changed_keys == {"machMode"}
+
+
+def _stamped_context(stamp: str, **parameters):
+    """Build a context whose parameters all carry the ``stamp`` lastUpdate."""
+    payload = _context(**parameters)
+    for values in payload["shadow"]["parameters"].values():
+        values["lastUpdate"] = stamp
+    return payload
+
+
+async def test_device_load_context_updates_in_place(device, mock_connection) -> None:
+    """The parameters dict is updated in place, removed keys included."""
+    mock_connection.async_get_context = AsyncMock(
+        side_effect=[
+            _context(machMode="1", onOffStatus="1"),
+            _context(machMode="2", tempSel="40"),
+        ]
+    )
+    await device.load_context()
+    parameters = device.attributes["parameters"]
+    await device.load_context()
+    assert device.attributes["parameters"] is parameters
+    assert parameters == {"machMode": "2", "tempSel": "40"}
+    assert device.changed_keys == {"machMode", "onOffStatus", "tempSel"}
+
+
+async def test_device_load_context_skips_unchanged_stamps(
+    device, mock_connection
+) -> None:
+    """A parameter with an unchanged lastUpdate is not re-read."""
+    first = _stamped_context("2026-01-01T00:00:00Z", machMode="1", tempSel="40")
+    second = _stamped_context("2026-01-01T00:00:00Z", machMode="1", tempSel="40")
+    second["shadow"]["parameters"]["tempSel"] = {
+        "parNewVal": "45",
+        "lastUpdate": "2026-01-01T00:05:00Z",
+    }
+    # A value change without a new stamp is ignored: the stamp is trusted.
+    second["shadow"]["parameters"]["machMode"]["parNewVal"] = "9"
+    mock_connection.async_get_context = AsyncMock(side_effect=[first, second])
+    await device.load_context()
+    await device.load_context()
+    assert device.changed_keys == {"tempSel"}
+    assert device.get("tempSel") == "45"
+    assert device.get("machMode") == "1"
+
+
+async def test_device_load_context_rereads_local_writes(
+    device, mock_connection
+) -> None:
+    """A locally written key is re-read even when its stamp is unchanged."""
+    mock_connection.async_get_context = AsyncMock(
+        side_effect=lambda device: _stamped_context(
+            "2026-01-01T00:00:00Z", machMode="1"
+        )
+    )
+    await device.load_context()
+    device.set("machMode", "7")
+    await device.load_context()
+    assert device.get("machMode") == "1"
+    assert device.changed_keys == {"machMode"}
+
+
+async def test_device_changed_since(device, mock_connection) -> None:
+    """changed_since only reports keys stamped after the given version."""
+    mock_connection.async_get_context = AsyncMock(
+        side_effect=[_context(machMode="1"), _context(machMode="2")]
+    )
+    await device.load_context()
+    seen = device.data_version
+    assert not device.changed_since(seen, {"machMode"})
+    await device.load_context()
+    assert device.changed_since(seen, {"machMode"})
+    assert not device.changed_since(seen, {"onOffStatus"})
+    assert device.changed_since(seen, None)
+    seen = device.data_version
+    device.set("onOffStatus", "0")
+    assert device.changed_since(seen, {"onOffStatus"})
+    seen = device.data_version
+    await device.load_statistics({"programsCounter": 1})
+    assert device.changed_since(seen, {"statistics"})
+    assert not device.changed_since(seen, {"machMode"})
+    seen = device.data_version
+    device.invalidate_data()
+    assert device.changed_since(seen, {"machMode"})
+
+
+async def test_device_unchanged_context_keeps_data_version(
+    device, mock_connection
+) -> None:
+    """A re-parsed context that changed nothing leaves the data version."""
+    mock_connection.async_get_context = AsyncMock(
+        side_effect=lambda device: _context(tempSel="2")
+    )
+    await device.load_context()
+    # A local write of the same value forces the next context to be parsed.
+    device.set("tempSel", "2")
+    seen = device.data_version
+    await device.load_context()
+    assert device.changed_keys == set()
+    assert device.data_version == seen
+    assert not device.changed_since(seen, {"tempSel"})
+
+
+async def test_device_load_context_same_fingerprint(device, mock_connection) -> None:
+    """An identical context is not re-parsed unless written to locally."""
+    mock_connection.async_get_context = AsyncMock(
+        side_effect=lambda device: _context(machMode="1")
+    )
+    await device.load_context()
+    attributes = device.attributes
+    version = device.data_version
+    await device.load_context()
+    assert device.attributes is attributes
+    assert device.data_version == version
+
+    device.set("machMode", "7")
+    await device.load_context()
+    assert device.get("machMode") == "1"
+    assert device.changed_keys == {"machMode"}
+
+
+async def test_device_load_context_keeps_payload_intact(
+    device, mock_connection
+) -> None:
+    """The payload is left untouched, as coalesced reads share it."""
+    payload = _context(machMode="1")
+    mock_connection.async_get_context = AsyncMock(return_value=payload)
+    await device.load_context()
+    assert payload == _context(machMode="1")
+    assert device.get("machMode") == "1"
+
+
+async def test_device_expect_survives_stale_context(device, mock_connection) -> None:
+    """A written value is kept over a stale context, then confirmed."""
+    mock_connection.async_get_context = AsyncMock(return_value=_context(tempSel="22"))
+    await device.load_context()
+    device.expect({"tempSel": "25"})
+    assert device.get("tempSel") == "25"
+
+    await device.load_context()
+    assert device.get("tempSel") == "25"
+    assert device.pending == {"tempSel": "25"}
+    assert "tempSel" not in device.changed_keys
+
+    mock_connection.async_get_context = AsyncMock(return_value=_context(tempSel="25"))
+    await device.load_context()
+    assert device.pending == {}
+    assert device.optimistic_stats["confirmed"] == 1
+
+
+async def test_device_expect_times_out(device, mock_connection) -> None:
+    """Past OPTIMISTIC_TIMEOUT the cloud value wins."""
+    mock_connection.async_get_context = AsyncMock(return_value=_context(tempSel="22"))
+    device.expect({"tempSel": "25"})
+    with patch(
+        "custom_components.hon.devices.device.time.time",
+        return_value=time.time() + OPTIMISTIC_TIMEOUT + 1,
+    ):
+        await device.load_context()
+    assert device.get("tempSel") == "22"
+    assert device.optimistic_stats["timed_out"] == 1
+
+
+async def test_device_expect_superseded_by_newer_change(
+    device, mock_connection
+) -> None:
+    """A newer lastUpdate on the appliance supersedes the written value."""
+    payload = _context(tempSel="20")
+    payload["shadow"]["parameters"]["tempSel"]["lastUpdate"] = "2999-01-01T00:00:00Z"
+    mock_connection.async_get_context = AsyncMock(return_value=payload)
+    device.expect({"tempSel": "25"})
+    await device.load_context()
+    assert device.get("tempSel") == "20"
+    assert device.optimistic_stats["superseded"] == 1
+
+
+async def test_device_async_send_failure_reverts(device) -> None:
+    """A rejected command restores the previous value."""
+    device.set("onOffStatus", "1")
+    command = MagicMock()
+    command.send = AsyncMock(return_value=False)
+    assert await device.async_send(command, {"onOffStatus": "0"}) is False
+    assert device.get("onOffStatus") == "1"
+    assert device.pending == {}
+    assert device.optimistic_stats["failed"] == 1
+
+
 def test_device_getitem_data_branch(device) -> None:
     """__getitem__ reads top-level data keys like appliance and attributes."""
     assert device["appliance"] is device.appliance
@@ -152,6 +384,23 @@ def test_device_settings_property(device) -> None:
     assert "startProgram.tempSel" in device.settings
 
 
+async def test_device_settings_cached_until_full_invalidation(
+    device, mock_connection
+) -> None:
+    """A context refresh keeps the settings view; a full invalidation drops it."""
+    command = MagicMock()
+    command.settings = {"tempSel": MagicMock()}
+    device._commands = {"settings": command}
+    settings = device.settings
+    mock_connection.async_get_context = AsyncMock(return_value=_context(tempSel="3"))
+    await device.load_context()
+    assert device.settings is settings
+
+    device._commands = {}
+    device.invalidate_data()
+    assert device.settings == {}
+
+
 def test_device_update_command_unchanged(device) -> None:
     """update_command skips parameters already at the target value."""
     param = HonParameterRange(
@@ -227,6 +476,27 @@ def test_device_settings_command_writes_attributes(device) -> None:
     assert device.attributes["parameters"]["tempSel"] == 5
 
 
+async def test_device_send_settings_queues_the_change(device) -> None:
+    """send_settings applies the change locally and queues it for sending."""
+    param = HonParameterRange(
+        "tempSel",
+        {
+            "minimumValue": "0",
+            "maximumValue": "6",
+            "incrementValue": "1",
+            "defaultValue": "3",
+        },
+    )
+    command = MagicMock()
+    command.parameters = {"tempSel": param}
+    device._commands = {"settings": command}
+    device._coordinator.async_send_settings = AsyncMock(return_value=True)
+    assert await device.send_settings({"tempSel": "5"}) is True
+    assert device.attributes["parameters"]["tempSel"] == 5
+    device._coordinator.async_send_settings.assert_awaited_once_with({"tempSel": "5"})
+    command.send.assert_not_called()
+
+
 def test_device_start_command_writes_attributes(device) -> None:
     """start_command mirrors command values into the attributes."""
     command = MagicMock()
@@ -245,6 +515,90 @@ def test_device_start_command_writes_attributes(device) -> None:
     assert device.attributes["parameters"]["tempSel"] == 5
 
 
+def _range(key: str) -> HonParameterRange:
+    return HonParameterRange(
+        key,
+        {
+            "minimumValue": "0",
+            "maximumValue": "6",
+            "incrementValue": "1",
+            "defaultValue": "3",
+        },
+    )
+
+
+async def test_device_unsent_start_command_restored_by_poll(
+    device, mock_connection
+) -> None:
+    """Values of a prepared but unsent command give way to the next context."""
+    mock_connection.async_get_context = AsyncMock(
+        side_effect=lambda device: _stamped_context("2026-01-01T00:00:00Z", tempSel="2")
+    )
+    await device.load_context()
+    command = MagicMock()
+    command.parameters = {"tempSel": _range("tempSel")}
+    device._commands = {"startProgram": command}
+    device.start_command(parameters={"tempSel": "5"})
+    assert device.get("tempSel") == 5
+    await device.load_context()
+    await device.load_context()
+    assert device.get("tempSel") == "2"
+
+
+async def test_device_failed_settings_restored_by_poll(device, mock_connection) -> None:
+    """Fallback values written by a failed settings send are not kept."""
+    mock_connection.async_get_context = AsyncMock(
+        side_effect=lambda device: _stamped_context(
+            "2026-01-01T00:00:00Z", tempSel="2", spinSpeed="9"
+        )
+    )
+    await device.load_context()
+    command = MagicMock()
+    command.parameters = {
+        "tempSel": _range("tempSel"),
+        "spinSpeed": _range("spinSpeed"),
+    }
+    device._commands = {"settings": command}
+    device._coordinator.async_send_settings = AsyncMock(return_value=False)
+    assert await device.send_settings({"tempSel": "5"}) is False
+    # The out-of-range cloud value fell back to the default in the command.
+    assert device.get("spinSpeed") == 3
+    await device.load_context()
+    await device.load_context()
+    assert device.get("spinSpeed") == "9"
+    assert device.get("tempSel") == "2"
+
+
+async def test_device_failed_settings_reverts_at_once(device, mock_connection) -> None:
+    """A rejected settings send restores the value seen before preparing it."""
+    mock_connection.async_get_context = AsyncMock(return_value=_context(tempSel="2"))
+    await device.load_context()
+    command = MagicMock()
+    command.parameters = {"tempSel": _range("tempSel")}
+    device._commands = {"settings": command}
+    device._coordinator.async_send_settings = AsyncMock(return_value=False)
+    assert await device.send_settings({"tempSel": "5"}) is False
+    assert device.get("tempSel") == "2"
+    assert device.pending == {}
+
+
+async def test_device_failed_start_command_reverts_at_once(
+    device, mock_connection
+) -> None:
+    """A rejected start command restores the value seen before preparing it."""
+    mock_connection.async_get_context = AsyncMock(return_value=_context(tempSel="2"))
+    await device.load_context()
+    command = MagicMock()
+    command.parameters = {"tempSel": _range("tempSel")}
+    command.send = AsyncMock(side_effect=TimeoutError)
+    device._commands = {"startProgram": command}
+    with pytest.raises(TimeoutError):
+        await device.async_send(
+            device.start_command(parameters={"tempSel": "5"}), {"tempSel": 5}
+        )
+    assert device.get("tempSel") == "2"
+
+
 def test_device_data_combined(device) -> None:
     """data combines attributes, appliance, statistics and parameters."""
     device.attributes["parameters"] = {"tempSel": "40"}
@@ -444,6 +798,62 @@ async def test_device_load_commands_multi(device, mock_connection) -> None:
     assert "startProgram" in device.commands
 
 
+async def test_device_load_commands_multi_is_lazy(device, mock_connection) -> None:
+    """Only the default (last) program is built when the catalogue loads."""
+    mock_connection.load_commands = AsyncMock(
+        return_value={
+            "applianceModel": {"options": {}},
+            "startProgram": {
+                f"PROGRAMS.WM.P{index}": {
+                    "parameters": {
+                        "prCode": {"typology": "fixed", "fixedValue": str(index)}
+                    }
+                }
+                for index in range(5)
+            },
+        }
+    )
+    await device.load_commands()
+    command = device.commands["startProgram"]
+    programs = command.get_programs()
+    assert list(programs) == ["p0", "p1", "p2", "p3", "p4"]
+    assert programs.builds == 1
+    assert command.parameters["prCode"].value == "4"
+
+    device.start_command("p1")
+    assert device.commands["startProgram"].parameters["prCode"].value == "1"
+    assert programs.builds == 2
+
+
+async def test_device_load_commands_from_table(device) -> None:
+    """A compiled table rebuilds the commands; a stale one is ignored."""
+    payload = {
+        "applianceModel": {"options": {}},
+        "settings": {
+            "parameters": {"tempSel": {"typology": "enum", "enumValues": ["1", "2"]}}
+        },
+        "startProgram": {
+            f"PROGRAMS.WM.P{index}": {
+                "parameters": {
+                    "prCode": {"typology": "fixed", "fixedValue": str(index)}
+                }
+            }
+            for index in range(3)
+        },
+    }
+    table = compile_catalogue(payload)
+    # The table wins over the payload when its version matches.
+    await device.load_commands({"applianceModel": {}}, table=table)
+    assert device.commands["settings"].parameters["tempSel"].values == ("1", "2")
+    command = device.commands["startProgram"]
+    assert list(command.get_programs()) == ["p0", "p1", "p2"]
+    assert command.parameters["prCode"].value == "2"
+
+    await device.load_commands(payload, table={**table, "version": -1})
+    assert device.commands["startProgram"].parameters["prCode"].value == "2"
+    assert set(device.commands) == {"settings", "startProgram"}
+
+
 async def test_device_load_commands_missing_model(device, mock_connection) -> None:
     """load_commands aborts when the applianceModel is absent."""
     mock_connection.load_commands = AsyncMock(return_value={"options": {}})
@@ -530,3 +940,79 @@ async def test_device_load_statistics_from_cached_payload(
     assert result == {"programsCounter": 42}
     assert device.statistics == {"programsCounter": 42}
     mock_connection.load_statistics.assert_not_awaited()
+
+
+async def test_device_load_statistics_conditional(device, mock_connection) -> None:
+    """Fetches reuse the validators; a 304 keeps the statistics untouched."""
+    await device.load_statistics(
+        {"programsCounter": 1},
+        state={"time": 1.0, "validators": {"etag": '"v1"'}},
+    )
+    assert device.statistics_state == {"time": 1.0, "validators": {"etag": '"v1"'}}
+    version = device.data_version
+    mock_connection.load_statistics = AsyncMock(return_value=None)
+    assert await device.load_statistics() == {"programsCounter": 1}
+    mock_connection.load_statistics.assert_awaited_once_with(device, {"etag": '"v1"'})
+    assert device.data_version == version
+    assert device.statistics_age < 5
+
+
+def test_device_data_view_is_cached(device) -> None:
+    """data returns the same view until the device data changes."""
+    device.attributes["parameters"] = {"tempSel": "40"}
+    view = device.data
+    assert device.data is view
+    assert device["tempSel"] == "40"
+    assert device.data is view
+
+
+def test_device_data_view_is_read_only(device) -> None:
+    """The merged view cannot be written to."""
+    with pytest.raises(TypeError):
+        device.data["tempSel"] = "50"
+
+
+def test_device_data_view_rebuilt_after_set(device) -> None:
+    """set bumps the data version so the next read rebuilds the view."""
+    view = device.data
+    version = device.data_version
+    device.set("tempSel", "50")
+    assert device.data_version == version + 1
+    assert device.data is not view
+    assert device.get("tempSel") == "50"
+
+
+async def test_device_data_view_rebuilt_after_loads(device, mock_connection) -> None:
+    """Each load invalidates the view; the new payloads are visible."""
+    view = device.data
+    mock_connection.async_get_context = AsyncMock(
+        return_value={"shadow": {"parameters": {"machMode": {"parNewVal": "2"}}}}
+    )
+    await device.load_context()
+    assert device.data is not view
+    assert device.get("machMode") == "2"
+
+    view = device.data
+    await device.load_statistics({"programsCounter": 7})
+    assert device.data is not view
+    assert device.get("statistics.programsCounter") == 7
+
+
+def test_device_data_view_rebuilt_after_update_command(device) -> None:
+    """Command parameter values are re-snapshotted after update_command."""
+    param = HonParameterRange(
+        "tempSel",
+        {
+            "minimumValue": "0",
+            "maximumValue": "6",
+            "incrementValue": "1",
+            "defaultValue": "3",
+        },
+    )
+    command = MagicMock()
+    command.parameters = {"tempSel": param}
+    device._commands = {"settings": command}
+    device.invalidate_data()
+    assert device.get("settings.tempSel") == 3
+    device.update_command(command, {"tempSel": "5"})
+    assert device.get("settings.tempSel") == 5
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from custom_components.hon.coordinator import HonBaseCoordinator
+from custom_components.hon.profiler import HonBootProfiler
 
 pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
 
@@ -19,10 +20,20 @@ async def test_diagnostics_redacts_and_structures(
 
     coordinator = MagicMock(spec=HonBaseCoordinator)
     coordinator.last_update_success = True
+    coordinator.skipped_fan_outs = 3
+    coordinator.poll_interval = None
+    coordinator.command_stats = {"settings": {"batches": 1, "merged": 2}}
     coordinator.device = MagicMock()
     coordinator.device.mac_address = "08-b6-1f-de-c9-14"
     coordinator.device.attributes = {"onOffStatus": "1", "tempSel": "40"}
+    coordinator.device.optimistic_stats = {"confirmed": 2, "timed_out": 0}
     mock_connection._coordinator_dict = {"08-b6-1f-de-c9-14": coordinator}
+    mock_connection.rate_limit_stats = {"read": {"acquired": 4}}
+    mock_connection.coalesced_requests = 2
+    mock_connection.endpoint_stats = {"/commands/v1/context": {"requests": 5}}
+    mock_connection.boot_profiler = HonBootProfiler()
+    await mock_connection.boot_profiler.first_refresh(coordinator)
+    mock_connection.boot_profiler.finish()
 
     mock_connection.appliances = [
         {
@@ -69,6 +80,22 @@ async def test_diagnostics_redacts_and_structures(
     # les appliances et coordinators sont redactés (serialNumber masqué)
     assert result["appliances"][0]["serialNumber"] == "**REDACTED**"
     assert "coordinators" in result
+    assert result["rate_limit"] == {"read": {"acquired": 4}}
+    assert result["coalesced_requests"] == 2
+    assert result["endpoints"] == {"/commands/v1/context": {"requests": 5}}
+    assert result["boot"]["boot"] == "cold"
+    assert result["boot"]["total"] is not None
+    # The boot report does not expose MAC addresses.
+    assert list(result["boot"]["appliances"]) == ["appliance_1"]
+    assert "08-b6-1f-de-c9-14" not in str(result["boot"])
+    assert result["coordinators"]["08-b6-1f-de-c9-14"]["skipped_fan_outs"] == 3
+    assert result["coordinators"]["08-b6-1f-de-c9-14"]["commands"] == {
+        "settings": {"batches": 1, "merged": 2}
+    }
+    assert result["coordinators"]["08-b6-1f-de-c9-14"]["optimistic"] == {
+        "confirmed": 2,
+        "timed_out": 0,
+    }
     assert len(result["entities"]) == 1
     assert result["entities"][0]["entity_id"] == "sensor.lave_linge_mode"
     assert len(result["devices"]) == 1
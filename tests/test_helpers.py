@@ -4,7 +4,14 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 
-from custom_components.hon.helpers import get_key, minutes_until, snake_case
+from custom_components.hon.helpers import (
+    change_key,
+    compile_key_path,
+    context_fingerprint,
+    get_key,
+    minutes_until,
+    snake_case,
+)
 
 
 def test_snake_case_basic() -> None:
@@ -75,3 +82,49 @@ def test_minutes_until_exact() -> None:
     now = datetime(2026, 1, 1, 10, 0, 0)
     target = now + timedelta(minutes=30)
     assert minutes_until(target, now) == 30
+
+
+def test_compile_key_path_steps() -> None:
+    """Dotted keys compile to (segment, index) steps."""
+    assert compile_key_path("machMode") == (("machMode", None),)
+    assert compile_key_path("attributes.errors.1") == (
+        ("attributes", None),
+        ("errors", None),
+        ("1", 1),
+    )
+
+
+def test_compile_key_path_is_cached() -> None:
+    """The same key returns the same compiled path object."""
+    assert compile_key_path("statistics.programsCounter") is compile_key_path(
+        "statistics.programsCounter"
+    )
+
+
+def test_change_key() -> None:
+    """Change keys group attributes per top-level name, the rest per root."""
+    assert change_key("machMode") == "machMode"
+    assert change_key("attributes.lastConnEvent.category") == (
+        "attributes.lastConnEvent"
+    )
+    assert change_key("statistics.programsCounter") == "statistics"
+
+
+def test_context_fingerprint() -> None:
+    """Fingerprints follow the values and ignore parameter timestamps."""
+
+    def payload(value: str, stamp: str) -> dict:
+        return {
+            "lastConnEvent": {"category": "CONNECTED"},
+            "shadow": {
+                "parameters": {"machMode": {"parNewVal": value, "lastUpdate": stamp}}
+            },
+        }
+
+    assert context_fingerprint(payload("1", "a")) == context_fingerprint(
+        payload("1", "b")
+    )
+    assert context_fingerprint(payload("1", "a")) != context_fingerprint(
+        payload("2", "a")
+    )
+    assert context_fingerprint(None) == context_fingerprint({})
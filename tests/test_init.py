@@ -18,7 +18,7 @@ from custom_components.hon.api.exceptions import (
     HonAuthenticationError,
     HonConnectionError,
 )
-from custom_components.hon.const import DOMAIN, PLATFORMS
+from custom_components.hon.const import CONF_TRACING, DOMAIN, PLATFORMS
 from tests.conftest import EMAIL, MAC, MAC2, build_appliance
 
 pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
@@ -51,6 +51,51 @@ async def test_async_setup_entry_success(hass, mock_connection, config_entry) ->
     assert config_entry.runtime_data is mock_connection
     forward.assert_awaited_once_with(config_entry, PLATFORMS)
     coordinator.async_config_entry_first_refresh.assert_awaited_once()
+    report = mock_connection.boot_profiler.report
+    assert report["boot"] == "cold"
+    assert report["total"] is not None
+    assert "preload" not in report["phases"]
+
+
+async def test_async_setup_entry_tracing_option(
+    hass, mock_connection, config_entry
+) -> None:
+    """The tracing option turns the connection tracer on at setup."""
+    mock_connection.async_get_coordinator = AsyncMock(return_value=_coordinator_mock())
+    hass.config_entries.async_update_entry(config_entry, options={CONF_TRACING: True})
+
+    with (
+        patch("custom_components.hon.HonConnection", return_value=mock_connection),
+        patch.object(hass.config_entries, "async_forward_entry_setups", AsyncMock()),
+    ):
+        assert await async_setup_entry(hass, config_entry) is True
+
+    assert mock_connection.tracer.enabled is True
+
+
+async def test_async_setup_entry_batch_polling(
+    hass, mock_connection, config_entry
+) -> None:
+    """Batch polling starts the account scheduler, stopped on unload."""
+    from datetime import timedelta
+
+    mock_connection.async_get_coordinator = AsyncMock(return_value=_coordinator_mock())
+    mock_connection.batch_polling = True
+    mock_connection.update_interval = timedelta(seconds=60)
+    mock_connection.batch_poll_interval = timedelta(seconds=30)
+    unsub = MagicMock()
+
+    with (
+        patch("custom_components.hon.HonConnection", return_value=mock_connection),
+        patch.object(hass.config_entries, "async_forward_entry_setups", AsyncMock()),
+        patch("custom_components.hon.HonPollScheduler") as scheduler,
+    ):
+        scheduler.return_value.async_start.return_value = unsub
+        assert await async_setup_entry(hass, config_entry) is True
+
+    # The scheduler ticks at the (adaptive) batch interval.
+    scheduler.assert_called_once_with(hass, mock_connection, timedelta(seconds=30))
+    assert unsub in config_entry._on_unload
 
 
 async def test_async_setup_entry_auth_failed(
@@ -193,6 +238,12 @@ async def test_async_setup_entry_warm_parallel(
     mock_connection.async_restore_or_authorize.assert_awaited_once()
     coordinator.async_config_entry_first_refresh.assert_awaited_once()
     coordinator.apply_appliance_update.assert_called_once_with(fresh)
+    report = mock_connection.boot_profiler.report
+    assert report["boot"] == "warm"
+    assert {"cache_load", "auth", "preload", "first_refresh", "platforms"} <= set(
+        report["phases"]
+    )
+    assert report["appliances"][MAC]["preloaded"] is True
     mock_connection.prune_coordinators.assert_called_once_with({MAC})
     mock_connection.store_cached_appliances.assert_called_once()
 
@@ -11,39 +11,11 @@ from custom_components.hon import (
     async_setup_entry,
     get_device_ids,
     get_parameters,
-    update_sensor,
 )
 from custom_components.hon.const import DOMAIN
 from tests.conftest import MAC
 
 
-async def test_update_sensor(hass, mock_connection, config_entry) -> None:
-    """update_sensor writes the new state on the matching entity."""
-    from homeassistant.helpers import device_registry as dr
-    from homeassistant.helpers import entity_registry as er
-
-    device = dr.async_get(hass).async_get_or_create(
-        config_entry_id=config_entry.entry_id,
-        identifiers={(DOMAIN, MAC)},
-    )
-    registry = er.async_get(hass)
-    entity = registry.async_get_or_create(
-        "sensor",
-        DOMAIN,
-        f"{config_entry.unique_id}_{MAC}_light_status",
-        config_entry=config_entry,
-        device_id=device.id,
-        suggested_object_id="hon_light_status",
-    )
-    entity_id = entity.entity_id
-    hass.states.async_set(entity_id, "off", {"friendly_name": "Light"})
-
-    update_sensor(hass, device.id, MAC, "light_status", "on")
-
-    assert hass.states.get(entity_id).state == "on"
-    assert hass.states.get(entity_id).attributes["friendly_name"] == "Light"
-
-
 def test_get_parameters_dict() -> None:
     """get_parameters parses a dict payload."""
     call = MagicMock()
@@ -12,6 +12,7 @@ from custom_components.hon.parameter import (
     HonParameterFixed,
     HonParameterProgram,
     HonParameterRange,
+    parameter_from_spec,
 )
 
 
@@ -130,7 +131,7 @@ def test_hon_parameter_enum() -> None:
         "machMode", {"enumValues": ["3", "1", "2"], "defaultValue": "2"}
     )
     assert param.default == "2"
-    assert param.values == ["1", "2", "3"]
+    assert param.values == ("1", "2", "3")
     assert param.valuesBase == ["1", "2", "3"]
     assert param.value == "2"
 
@@ -198,7 +199,7 @@ def test_hon_parameter_program() -> None:
     assert param.value == "eco"
     assert param.default == "eco"
     assert param.typology == "enum"
-    assert param.values == ["eco", "max"]
+    assert param.values == ("eco", "max")
 
     param.value = "max"
     command.set_program.assert_called_once_with("max")
@@ -243,3 +244,75 @@ def test_hon_parameter_range_repr() -> None:
     param = HonParameterRange("spinSpeed", range_attributes())
     assert "spinSpeed" in repr(param)
     assert "[0 - 6]" in repr(param)
+
+
+def test_parameters_use_slots() -> None:
+    """Parameters carry no per-instance __dict__."""
+    params = [
+        HonParameter("k", {}),
+        HonParameterFixed("k", {"fixedValue": "1"}),
+        HonParameterRange("k", range_attributes()),
+        HonParameterEnum("k", {"enumValues": ["1"]}),
+    ]
+    for param in params:
+        assert not hasattr(param, "__dict__")
+
+
+def test_parameter_enum_shares_values() -> None:
+    """Equal enum value lists from different programs share one tuple."""
+    first = HonParameterEnum("dryLevel", {"enumValues": ["0", "1", "2"]})
+    second = HonParameterEnum("dryLevel", {"enumValues": ["0", "1", "2"]})
+    assert first._values is second._values
+    assert first.values == ("0", "1", "2")
+
+
+def test_parameter_strings_are_interned() -> None:
+    """Keys and typologies decoded separately end up as one string."""
+    first = HonParameterRange("".join(["spin", "Speed"]), range_attributes())
+    second = HonParameterRange("".join(["spin", "Spe", "ed"]), range_attributes())
+    assert first.key is second.key
+
+
+def test_parameter_enum_values_are_indexed_once() -> None:
+    """values is a precomputed tuple; validation uses the frozenset."""
+    param = HonParameterEnum("windSpeed", {"enumValues": [5, 1, 3]})
+    assert param.values is param.values
+    assert param.values == ("1", "3", "5")
+    param.value = "3"
+    assert param.value == "3"
+    with pytest.raises(ValueError):
+        param.value = 3
+
+
+def test_hon_parameter_program_follows_new_programs() -> None:
+    """Programs added to the shared dict after creation are picked up."""
+    command = MagicMock()
+    command._program = "eco"
+    command._multi = {"eco": MagicMock()}
+    param = HonParameterProgram("program", command)
+    assert param.values == ("eco",)
+    command._multi["max"] = MagicMock()
+    param.value = "max"
+    command.set_program.assert_called_once_with("max")
+    assert param.values == ("eco", "max")
+
+
+def test_parameter_spec_roundtrip() -> None:
+    """spec/parameter_from_spec restore an equivalent parameter."""
+    originals = [
+        HonParameterRange("tempSel", range_attributes(minimumValue="0,5")),
+        HonParameterEnum("windSpeed", {"enumValues": ["5", "1"], "defaultValue": "5"}),
+        HonParameterFixed("lang", {"fixedValue": "1", "mandatory": 1}),
+    ]
+    for original in originals:
+        restored = parameter_from_spec(original.spec())
+        assert type(restored) is type(original)
+        assert restored.key == original.key
+        assert restored.category == original.category
+        assert restored.mandatory == original.mandatory
+        assert restored.value == original.value
+        assert restored.spec() == original.spec()
+    restored = parameter_from_spec(originals[0].spec())
+    assert (restored.min, restored.max, restored.step) == (0.5, 6, 1)
+    with pytest.raises(ValueError):
+        restored.value = 7
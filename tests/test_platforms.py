@@ -174,6 +174,41 @@ async def test_sensor_platform_weight_fallback(hass, mock_connection) -> None:
     assert async_add_entities.call_args[0][0]
 
 
+async def test_sensor_platform_cloud_metrics(hass, full_device) -> None:
+    """Account-level request metric sensors are added, disabled by default."""
+    from homeassistant.helpers.entity import EntityCategory
+
+    from custom_components.hon.devices.sensor import HonCloudSensor
+
+    connection, _, _ = full_device
+    connection.request_totals = {
+        "requests": 8,
+        "retries": 1,
+        "reauths": 0,
+        "failures": 1,
+        "latency_p95": 250.0,
+    }
+    async_add_entities = MagicMock()
+    await setup_sensor(hass, _entry(hass, connection), async_add_entities)
+    cloud = {
+        entity.entity_description.key: entity
+        for entity in async_add_entities.call_args[0][0]
+        if isinstance(entity, HonCloudSensor)
+    }
+    assert set(cloud) == {
+        "cloud_requests",
+        "cloud_failed_requests",
+        "cloud_retries",
+        "cloud_reauths",
+        "cloud_latency_p95",
+    }
+    sensor = cloud["cloud_latency_p95"]
+    assert sensor.entity_registry_enabled_default is False
+    assert sensor.entity_category is EntityCategory.DIAGNOSTIC
+    assert sensor.native_value == 250.0
+    assert cloud["cloud_requests"].native_value == 8
+
+
 async def test_binary_sensor_platform(hass, full_device) -> None:
     """The binary sensor platform always adds an on/off sensor."""
     connection, _, _ = full_device
@@ -0,0 +1,76 @@
+"""Tests for the adaptive polling profiles."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from custom_components.hon.const import APPLIANCE_TYPE
+from custom_components.hon.polling import (
+    CONTINUOUS_PROFILE,
+    PROGRAM_PROFILE,
+    STATE_DISCONNECTED,
+    STATE_IDLE,
+    STATE_OFF,
+    STATE_RUNNING,
+    activity_state,
+    polling_profile,
+)
+from tests.devices.conftest import FakeDevice
+
+
+def _device(data: dict, category: str = "CONNECTED") -> FakeDevice:
+    device = FakeDevice(data)
+    device.attributes = {"lastConnEvent": {"category": category}}
+    return device
+
+
+@pytest.mark.parametrize(
+    ("data", "category", "expected"),
+    [
+        (
+            {"onOffStatus": "1", "machMode": "2", "remainingTimeMM": "40"},
+            "CONNECTED",
+            STATE_RUNNING,
+        ),
+        (
+            {"onOffStatus": "1", "machMode": "1", "remainingTimeMM": "0"},
+            "CONNECTED",
+            STATE_IDLE,
+        ),
+        (
+            {"onOffStatus": "1", "machMode": "1", "remainingTimeMM": "12"},
+            "CONNECTED",
+            STATE_RUNNING,
+        ),
+        ({"onOffStatus": "0", "machMode": "2"}, "CONNECTED", STATE_OFF),
+        ({"onOffStatus": "1", "machMode": "2"}, "DISCONNECTED", STATE_DISCONNECTED),
+    ],
+)
+def test_activity_state_program_appliance(data, category, expected) -> None:
+    """Program appliances run while a program or a countdown is active."""
+    assert activity_state(_device(data, category), PROGRAM_PROFILE) == expected
+
+
+def test_activity_state_continuous_appliance() -> None:
+    """Continuous appliances count as running whenever they are on."""
+    device = _device({"onOffStatus": "1", "machMode": "1"})
+    assert activity_state(device, CONTINUOUS_PROFILE) == STATE_RUNNING
+
+
+def test_profile_intervals_and_backoff() -> None:
+    """Intervals follow the state; offline polls back off up to the cap."""
+    assert PROGRAM_PROFILE.interval(STATE_RUNNING) == timedelta(seconds=30)
+    assert PROGRAM_PROFILE.interval(STATE_OFF) == timedelta(seconds=600)
+    assert [
+        PROGRAM_PROFILE.interval(STATE_DISCONNECTED, polls).total_seconds()
+        for polls in (1, 2, 3, 4)
+    ] == [120, 240, 480, 600]
+
+
+def test_polling_profile_per_type() -> None:
+    """Each appliance type maps to a profile, unknown types to the default."""
+    assert polling_profile(APPLIANCE_TYPE.WASHING_MACHINE) is PROGRAM_PROFILE
+    assert polling_profile(APPLIANCE_TYPE.CLIMATE) is CONTINUOUS_PROFILE
+    assert polling_profile(999) is PROGRAM_PROFILE
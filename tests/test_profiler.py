@@ -0,0 +1,88 @@
+"""Tests for the boot-time profiler."""
+
+from __future__ import annotations
+
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.exceptions import ConfigEntryNotReady
+
+from custom_components.hon.profiler import HonBootProfiler, profile_platform_setup
+from tests.conftest import MAC, MAC2
+
+
+def _coordinator(mac: str, **kwargs) -> MagicMock:
+    coordinator = MagicMock()
+    coordinator.device.mac_address = mac
+    coordinator.async_config_entry_first_refresh = AsyncMock(**kwargs)
+    return coordinator
+
+
+async def test_boot_report_structure() -> None:
+    """Phases, first refreshes and platforms land in the boot report."""
+    profiler = HonBootProfiler()
+    profiler.warm = True
+    with profiler.phase("cache_load"):
+        pass
+    assert await profiler.timed("auth", AsyncMock(return_value=True)()) is True
+    await profiler.first_refresh(_coordinator(MAC), preloaded=True)
+    profiler.record_platform("sensor", 0.0123)
+    assert profiler.report["total"] is None
+    profiler.finish()
+
+    report = profiler.report
+    assert report["boot"] == "warm"
+    assert report["total"] >= 0
+    assert set(report["phases"]) == {"cache_load", "auth"}
+    assert report["appliances"][MAC]["preloaded"] is True
+    assert report["platforms"] == {"sensor": 12.3}
+
+
+async def test_failed_first_refresh_is_recorded() -> None:
+    """A failing first refresh is timed and still raises."""
+    profiler = HonBootProfiler()
+    with pytest.raises(ConfigEntryNotReady):
+        await profiler.first_refresh(
+            _coordinator(MAC2, side_effect=ConfigEntryNotReady("down"))
+        )
+    assert profiler.report["appliances"][MAC2]["preloaded"] is False
+
+
+async def test_finish_logs_summary_without_macs(caplog) -> None:
+    """The debug summary names phases and platforms, never appliances."""
+    profiler = HonBootProfiler()
+    with profiler.phase("auth"):
+        pass
+    await profiler.first_refresh(_coordinator(MAC))
+    profiler.record_platform("switch", 0.002)
+    with caplog.at_level(logging.DEBUG, logger="custom_components.hon.profiler"):
+        profiler.finish()
+    assert "Cold boot took" in caplog.text
+    assert "auth" in caplog.text
+    assert "slowest platform switch" in caplog.text
+    assert MAC not in caplog.text
+
+
+async def test_profile_platform_setup_records_platform() -> None:
+    """The decorator records the platform named after its module."""
+    profiler = HonBootProfiler()
+    entry = MagicMock()
+    entry.runtime_data.boot_profiler = profiler
+    setup = AsyncMock(side_effect=RuntimeError("boom"))
+    setup.__module__ = "custom_components.hon.sensor"
+
+    with pytest.raises(RuntimeError):
+        await profile_platform_setup(setup)(None, entry, None)
+    assert "sensor" in profiler.report["platforms"]
+
+
+async def test_profile_platform_setup_without_profiler() -> None:
+    """Platforms set up without a boot profiler run unchanged."""
+    entry = MagicMock()
+    entry.runtime_data.boot_profiler = None
+    setup = AsyncMock()
+    setup.__module__ = "custom_components.hon.switch"
+
+    await profile_platform_setup(setup)(None, entry, "add")
+    setup.assert_awaited_once_with(None, entry, "add")
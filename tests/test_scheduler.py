@@ -0,0 +1,99 @@
+"""Tests for the account-wide batched poll scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.hon.api.exceptions import HonConnectionError
+from custom_components.hon.scheduler import HonPollScheduler
+
+
+def _coordinators(count: int, refresh) -> dict[str, MagicMock]:
+    """Build coordinator mocks whose refresh runs the given coroutine."""
+    coordinators = {}
+    for index in range(count):
+        coordinator = MagicMock()
+        coordinator.async_refresh = AsyncMock(side_effect=refresh)
+        coordinators[f"mac-{index}"] = coordinator
+    return coordinators
+
+
+async def test_refresh_all_bounded_concurrency(hass, mock_connection) -> None:
+    """Every coordinator is refreshed, never more than the bound at once."""
+    running = 0
+    peak = 0
+
+    async def refresh() -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    mock_connection.async_ensure_session = AsyncMock()
+    mock_connection.coordinators = _coordinators(6, refresh)
+    scheduler = HonPollScheduler(
+        hass, mock_connection, timedelta(seconds=60), max_concurrency=2
+    )
+    await scheduler.async_refresh_all()
+
+    mock_connection.async_ensure_session.assert_awaited_once()
+    for coordinator in mock_connection.coordinators.values():
+        coordinator.async_refresh.assert_awaited_once()
+    assert peak == 2
+
+
+async def test_refresh_all_session_failure_still_refreshes(
+    hass, mock_connection
+) -> None:
+    """A failed session check leaves the error handling to the coordinators."""
+    mock_connection.async_ensure_session = AsyncMock(
+        side_effect=HonConnectionError("x")
+    )
+    mock_connection.coordinators = _coordinators(2, None)
+    scheduler = HonPollScheduler(hass, mock_connection, timedelta(seconds=60))
+    await scheduler.async_refresh_all()
+    for coordinator in mock_connection.coordinators.values():
+        coordinator.async_refresh.assert_awaited_once()
+
+
+async def test_poll_skips_while_previous_poll_runs(hass, mock_connection) -> None:
+    """A tick arriving during a slow poll does not start a second one."""
+    release = asyncio.Event()
+
+    async def refresh() -> None:
+        await release.wait()
+
+    mock_connection.async_ensure_session = AsyncMock()
+    mock_connection.coordinators = _coordinators(1, refresh)
+    scheduler = HonPollScheduler(hass, mock_connection, timedelta(seconds=60))
+    first = asyncio.ensure_future(scheduler._async_poll())
+    await asyncio.sleep(0)
+    await scheduler._async_poll()
+    release.set()
+    await first
+    coordinator = mock_connection.coordinators["mac-0"]
+    assert coordinator.async_refresh.await_count == 1
+
+
+async def test_async_start_returns_unsubscribe(hass, mock_connection) -> None:
+    """async_start registers the interval timer and returns its canceller."""
+    scheduler = HonPollScheduler(hass, mock_connection, timedelta(seconds=60))
+    unsub = scheduler.async_start()
+    assert callable(unsub)
+    unsub()
+
+
+async def test_refresh_all_skips_coordinators_not_due(hass, mock_connection) -> None:
+    """Coordinators whose adaptive interval did not elapse are left alone."""
+    mock_connection.async_ensure_session = AsyncMock()
+    mock_connection.coordinators = _coordinators(2, None)
+    due, not_due = mock_connection.coordinators.values()
+    due.poll_due = MagicMock(return_value=True)
+    not_due.poll_due = MagicMock(return_value=False)
+    scheduler = HonPollScheduler(hass, mock_connection, timedelta(seconds=60))
+    await scheduler.async_refresh_all()
+    due.async_refresh.assert_awaited_once()
+    not_due.async_refresh.assert_not_awaited()
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 
 from custom_components.hon.const import DOMAIN
@@ -132,3 +133,45 @@ async def test_service_set_auto_mode_purifier(hass, setup_hon) -> None:
     )
     connection.async_set.assert_awaited()
     assert connection.async_set.call_args[0][1] == "AP"
+
+
+async def test_service_set_tracing(hass, setup_hon) -> None:
+    """set_tracing toggles the tracer and can drop the recorded spans."""
+    _entry, _coordinator, connection = setup_hon
+    assert connection.tracer.enabled is False
+    await hass.services.async_call(
+        DOMAIN, "set_tracing", {"enabled": True}, blocking=True
+    )
+    assert connection.tracer.enabled is True
+    connection.tracer.record("update_data", "WM", 0.0, 0.1)
+    await hass.services.async_call(
+        DOMAIN, "set_tracing", {"enabled": False, "reset": True}, blocking=True
+    )
+    assert connection.tracer.enabled is False
+    assert connection.tracer.stats() == {}
+
+
+async def test_service_dump_trace(hass, setup_hon) -> None:
+    """dump_trace writes every entry's spans to the configuration directory."""
+    entry, _coordinator, connection = setup_hon
+    connection.tracer.record("update_data", "WM", 0.0, 0.1)
+    with patch("custom_components.hon.write_trace") as write:
+        await hass.services.async_call(DOMAIN, "dump_trace", {}, blocking=True)
+    path, payload = write.call_args[0]
+    assert path == hass.config.path("hon_trace.json")
+    assert (
+        payload["entries"][entry.entry_id]["aggregates"]["update_data"]["WM"]["count"]
+        == 1
+    )
+
+
+async def test_service_dump_trace_rejects_path(hass, setup_hon) -> None:
+    """A path outside the allowed directories is refused."""
+    with (
+        patch("custom_components.hon.write_trace") as write,
+        pytest.raises(HomeAssistantError),
+    ):
+        await hass.services.async_call(
+            DOMAIN, "dump_trace", {"path": "/etc/hon_trace.json"}, blocking=True
+        )
+    write.assert_not_called()
@@ -0,0 +1,54 @@
+"""Tests for the statistics refresh policy."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from custom_components.hon.const import APPLIANCE_TYPE, STATISTICS_TTL
+from custom_components.hon.statistics import STATISTICS_RETRY, HonStatisticsTracker
+from tests.devices.conftest import FakeDevice
+
+
+def test_program_end_detected_on_idle_transition() -> None:
+    """Only a running → idle machMode transition counts as a program end."""
+    device = FakeDevice({"machMode": "1"})
+    tracker = HonStatisticsTracker(APPLIANCE_TYPE.WASHING_MACHINE)
+    assert tracker.program_ended(device) is False  # first observation
+    device._data["machMode"] = "2"
+    assert tracker.program_ended(device) is False  # program started
+    device._data["machMode"] = "2"
+    assert tracker.program_ended(device) is False
+    device._data["machMode"] = "6"
+    assert tracker.program_ended(device) is True
+    assert tracker.program_ended(device) is False
+
+
+def test_program_end_ignored_without_idle_modes() -> None:
+    """Continuously running appliances rely on the TTL alone."""
+    device = FakeDevice({"machMode": "2"})
+    tracker = HonStatisticsTracker(APPLIANCE_TYPE.CLIMATE)
+    tracker.program_ended(device)
+    device._data["machMode"] = "1"
+    assert tracker.program_ended(device) is False
+
+
+def test_statistics_due_after_ttl_and_retry_delay() -> None:
+    """Statistics are due when never fetched or older than the TTL."""
+    device = FakeDevice()
+    tracker = HonStatisticsTracker(APPLIANCE_TYPE.WASHING_MACHINE)
+    device.statistics_age = None
+    assert tracker.due(device)
+    device.statistics_age = 60
+    assert not tracker.due(device)
+    device.statistics_age = STATISTICS_TTL
+    assert tracker.due(device)
+
+    with patch("custom_components.hon.statistics.time.monotonic", return_value=0):
+        tracker.attempted()
+    with patch("custom_components.hon.statistics.time.monotonic", return_value=10):
+        assert not tracker.due(device)
+    with patch(
+        "custom_components.hon.statistics.time.monotonic",
+        return_value=STATISTICS_RETRY,
+    ):
+        assert tracker.due(device)
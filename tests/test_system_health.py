@@ -9,6 +9,14 @@ async def test_system_health_info(hass, mock_connection, config_entry) -> None:
     """System health reports reachability and coordinator status."""
     config_entry.runtime_data = mock_connection
     mock_connection._coordinator_dict = {}
+    mock_connection.open_circuits = ["/commands/v1/context"]
+    mock_connection.request_totals = {
+        "requests": 12,
+        "retries": 2,
+        "reauths": 1,
+        "failures": 3,
+        "latency_p95": 412.5,
+    }
 
     from custom_components.hon.system_health import system_health_info
 
@@ -27,6 +35,12 @@ async def test_system_health_info(hass, mock_connection, config_entry) -> None:
     assert result["can_reach_server"] is True
     assert result["appliances"] == 1
     assert result["all_updates_ok"] is False  # aucun coordinateur
+    assert result["open_circuits"] == "/commands/v1/context"
+    assert result["requests"] == 12
+    assert result["failed_requests"] == 3
+    assert result["retries"] == 2
+    assert result["reauths"] == 1
+    assert result["latency_p95"] == "412 ms"
 
 
 async def test_system_health_no_entry(hass) -> None:
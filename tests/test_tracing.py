@@ -0,0 +1,115 @@
+"""Tests for the refresh tracing."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+from custom_components.hon.coordinator import HonBaseCoordinator
+from custom_components.hon.devices.sensor import HonBaseMode
+from custom_components.hon.tracing import HonTracer, write_trace
+
+
+def test_disabled_tracer_records_nothing() -> None:
+    """Spans of a disabled tracer are no-ops."""
+    tracer = HonTracer()
+    with tracer.span("update_data", "WM"):
+        pass
+    assert tracer.stats() == {}
+    assert tracer.snapshot()["spans"] == []
+
+
+def test_spans_aggregated_per_stage_and_target() -> None:
+    """Spans are counted per stage and target, and kept for the dump."""
+    tracer = HonTracer(enabled=True)
+    for duration in (0.002, 0.004):
+        tracer.record("write_state", "HonBaseMode", 1000.0, duration)
+    with tracer.span("load_context", "WM"):
+        pass
+    stats = tracer.stats()
+    assert stats["write_state"]["HonBaseMode"] == {
+        "count": 2,
+        "total_ms": 6.0,
+        "mean_ms": 3.0,
+        "max_ms": 4.0,
+    }
+    assert stats["load_context"]["WM"]["count"] == 1
+    spans = tracer.snapshot()["spans"]
+    assert spans[0] == {
+        "name": "write_state",
+        "target": "HonBaseMode",
+        "start": 1000.0,
+        "duration_ms": 2.0,
+    }
+    tracer.reset()
+    assert tracer.stats() == {}
+
+
+def test_write_trace(tmp_path) -> None:
+    """The dump is written as JSON, creating the directory."""
+    path = tmp_path / "traces" / "hon_trace.json"
+    write_trace(str(path), {"entries": {"entry": HonTracer().snapshot()}})
+    assert json.loads(path.read_text())["entries"]["entry"]["enabled"] is False
+
+
+class _Listener:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def update(self) -> None:
+        self.calls += 1
+
+
+async def test_coordinator_refresh_spans(hass, mock_connection, appliance) -> None:
+    """A traced refresh records the refresh, the context and each listener."""
+    mock_connection.tracer.enabled = True
+    coordinator = HonBaseCoordinator(hass, mock_connection, appliance, None)
+    listener = _Listener()
+    unsub = coordinator.async_add_listener(listener.update)
+
+    await coordinator._async_update_data()
+    coordinator.async_update_listeners()
+    unsub()
+
+    stats = mock_connection.tracer.stats()
+    assert stats["update_data"]["WM"]["count"] == 1
+    assert stats["load_context"]["WM"]["count"] == 1
+    assert stats["entity_update"]["_Listener"]["count"] == 1
+    assert listener.calls == 1
+
+
+async def test_listener_spans_follow_runtime_toggle(
+    hass, mock_connection, appliance
+) -> None:
+    """Listeners added before tracing is enabled are timed once it is."""
+    coordinator = HonBaseCoordinator(hass, mock_connection, appliance, None)
+    listener = _Listener()
+    unsub = coordinator.async_add_listener(listener.update)
+
+    coordinator.async_update_listeners()
+    assert mock_connection.tracer.stats() == {}
+    mock_connection.tracer.enabled = True
+    coordinator.async_update_listeners()
+    unsub()
+
+    assert mock_connection.tracer.stats()["entity_update"]["_Listener"]["count"] == 1
+    assert listener.calls == 2
+
+
+async def test_entity_update_split_spans(
+    hass, mock_connection, appliance, config_entry
+) -> None:
+    """Entity updates record their state computation and write apart."""
+    coordinator = HonBaseCoordinator(hass, mock_connection, appliance, None)
+    await coordinator._async_update_data()
+    entity = HonBaseMode(hass, coordinator, config_entry, appliance)
+    mock_connection.tracer.enabled = True
+
+    with patch.object(entity, "async_write_ha_state") as write:
+        coordinator.device.invalidate_data()
+        entity._handle_coordinator_update()
+
+    write.assert_called_once()
+    stats = mock_connection.tracer.stats()
+    assert stats["coordinator_update"]["HonBaseMode"]["count"] == 1
+    assert stats["write_state"]["HonBaseMode"]["count"] == 1